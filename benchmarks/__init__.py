@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the Quipu Analytics Suite.
+
+Run with ``python -m benchmarks.runner run``; see ``benchmarks/runner.py``.
+"""
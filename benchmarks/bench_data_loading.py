@@ -0,0 +1,22 @@
+"""Benchmarks for loading the bundled datasets."""
+
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+class CsvLoading:
+    """``pd.read_csv`` of each tab-separated file in ``data/``."""
+
+    params = ["Coffee_sales.csv", "Nasa_disaster_dataset.csv", "Spotify_churn_dataset.csv"]
+
+    def setup(self, filename):
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        self.read_csv = pd.read_csv
+        self.path = DATA_DIR / filename
+        if not self.path.exists():
+            raise NotImplementedError(f"{filename} not found")
+
+    def time_read_csv(self, filename):
+        self.read_csv(self.path, sep="\t")
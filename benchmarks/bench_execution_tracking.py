@@ -0,0 +1,31 @@
+"""Benchmarks for execution tracking and provenance capture."""
+
+import shutil
+import tempfile
+
+
+class ExecutionTracking:
+    """Per-notebook tracking overhead."""
+
+    def setup(self):
+        from quipu_analytics import execution_tracking  # pylint: disable=import-outside-toplevel
+
+        self.tracking = execution_tracking
+        self.metadata = execution_tracking.get_execution_metadata()
+        self.summary = execution_tracking.generate_execution_summary(self.metadata)
+        self.log_dir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def time_execution_metadata(self):
+        self.tracking.get_execution_metadata()
+
+    def time_git_provenance(self):
+        self.tracking.get_git_provenance()
+
+    def time_execution_summary(self):
+        self.tracking.generate_execution_summary(self.metadata)
+
+    def time_save_execution_log(self):
+        self.tracking.save_execution_log(self.summary, self.log_dir)
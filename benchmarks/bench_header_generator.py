@@ -0,0 +1,19 @@
+"""Benchmarks for notebook header rendering."""
+
+
+class HeaderGenerator:
+    """Registry load and header rendering of ``EnhancedNotebookHeaderGenerator``."""
+
+    def setup(self):
+        from enhanced_header_generator import (  # pylint: disable=import-outside-toplevel
+            EnhancedNotebookHeaderGenerator)
+
+        self.generator_class = EnhancedNotebookHeaderGenerator
+        self.generator = EnhancedNotebookHeaderGenerator()
+        self.notebook_key = next(iter(self.generator.registry.get("notebooks", {})), None)
+
+    def time_load_registry(self):
+        self.generator_class()
+
+    def time_render_header(self):
+        self.generator.generate_enhanced_header(self.notebook_key, display_immediately=False)
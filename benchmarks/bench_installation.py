@@ -0,0 +1,14 @@
+"""Benchmarks for installation verification."""
+
+
+class VerifyInstallation:
+    """Full dependency check, as run after installing the suite."""
+
+    def setup(self):
+        from quipu_analytics.verify_installation import (  # pylint: disable=import-outside-toplevel
+            main)
+
+        self.verify = main
+
+    def time_verify_installation(self):
+        self.verify()
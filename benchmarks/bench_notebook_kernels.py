@@ -0,0 +1,124 @@
+"""
+Benchmarks for computational kernels extracted from the notebooks.
+
+Each kernel mirrors the core call of its notebook on synthetic data at
+several row counts, so timings can be compared across scales and commits.
+"""
+
+import numpy as np
+import pandas as pd
+
+SCALES = [1_000, 10_000, 100_000]
+
+
+class Correlation:
+    """``Tier1_Correlation``: Pearson and Spearman matrices of a numeric frame."""
+
+    params = SCALES
+
+    def setup(self, n_rows):
+        rng = np.random.default_rng(42)
+        base = rng.standard_normal((n_rows, 3))
+        mixing = rng.standard_normal((3, 10))
+        self.frame = pd.DataFrame(base @ mixing + rng.standard_normal((n_rows, 10)),
+                                  columns=[f"x{i}" for i in range(10)])
+
+    def time_pearson(self, n_rows):
+        self.frame.corr(method="pearson")
+
+    def time_spearman(self, n_rows):
+        self.frame.corr(method="spearman")
+
+
+class Pivot:
+    """``Tier1_Pivot``: revenue pivot of coffee sales by product and month."""
+
+    params = SCALES
+
+    def setup(self, n_rows):
+        rng = np.random.default_rng(42)
+        products = ["Latte", "Americano", "Cappuccino", "Cortado", "Espresso",
+                    "Hot Chocolate", "Cocoa", "Americano with Milk"]
+        months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                  "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+        self.frame = pd.DataFrame({
+            "coffee_name": rng.choice(products, n_rows),
+            "Month_name": rng.choice(months, n_rows),
+            "cash_type": rng.choice(["card", "cash"], n_rows, p=[0.9, 0.1]),
+            "money": rng.uniform(18.0, 40.0, n_rows).round(2),
+        })
+
+    def time_pivot_table(self, n_rows):
+        pd.pivot_table(self.frame, values="money", index=["coffee_name", "cash_type"],
+                       columns="Month_name", aggfunc=["sum", "mean", "count"])
+
+
+class KNearestNeighbors:
+    """``Tier2_kNN``: fit on ``n_rows`` samples and classify 1,000 queries."""
+
+    params = SCALES
+
+    def setup(self, n_rows):
+        from sklearn.datasets import make_classification  # pylint: disable=import-outside-toplevel
+        from sklearn.neighbors import (  # pylint: disable=import-outside-toplevel
+            KNeighborsClassifier)
+
+        X, y = make_classification(n_samples=n_rows + 1000, n_features=10, random_state=42)
+        self.X_train, self.y_train, self.X_query = X[:n_rows], y[:n_rows], X[n_rows:]
+        self.model_class = KNeighborsClassifier
+
+    def time_fit_predict(self, n_rows):
+        model = self.model_class(n_neighbors=5).fit(self.X_train, self.y_train)
+        model.predict(self.X_query)
+
+
+class Dbscan:
+    """``Tier4_DBSCAN``: 2-D blobs with ``eps`` scaled to keep neighborhoods similar."""
+
+    params = SCALES
+
+    def setup(self, n_rows):
+        from sklearn.cluster import DBSCAN  # pylint: disable=import-outside-toplevel
+        from sklearn.datasets import make_blobs  # pylint: disable=import-outside-toplevel
+
+        self.X, _ = make_blobs(n_samples=n_rows, centers=5, cluster_std=1.0, random_state=42)
+        self.model = DBSCAN(eps=float(np.sqrt(40.0 / n_rows)) * 5.0, min_samples=5)
+
+    def time_fit(self, n_rows):
+        self.model.fit(self.X)
+
+
+class Arima:
+    """``Tier3_ARIMA``: ARIMA(1, 1, 1) fit on a random-walk-with-drift series."""
+
+    params = [1_000, 5_000, 20_000]
+
+    def setup(self, n_rows):
+        try:
+            from statsmodels.tsa.arima.model import (  # pylint: disable=import-outside-toplevel
+                ARIMA)
+        except ImportError as error:
+            raise NotImplementedError("statsmodels is not installed") from error
+        rng = np.random.default_rng(42)
+        self.series = np.cumsum(0.1 + rng.standard_normal(n_rows))
+        self.model_class = ARIMA
+
+    def time_fit(self, n_rows):
+        self.model_class(self.series, order=(1, 1, 1)).fit()
+
+
+class IsolationForestKernel:
+    """``Tier6_IsolationForest``: fit and score with 100 trees."""
+
+    params = SCALES
+
+    def setup(self, n_rows):
+        from sklearn.ensemble import IsolationForest  # pylint: disable=import-outside-toplevel
+
+        rng = np.random.default_rng(42)
+        self.X = rng.standard_normal((n_rows, 8))
+        self.model_class = IsolationForest
+
+    def time_fit_score(self, n_rows):
+        model = self.model_class(n_estimators=100, contamination=0.05, random_state=42)
+        model.fit(self.X).score_samples(self.X)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner with Commit-Keyed History
+
+Discovers asv-style benchmarks in ``benchmarks/bench_*.py`` (classes with
+optional ``params``, ``setup`` and ``time_*`` methods, or module-level
+``time_*`` functions), times them with ``timeit`` and appends the results to
+a JSON history keyed by git commit. ``compare`` flags benchmarks whose median
+time grew beyond a threshold between two commits.
+
+Usage:
+    python -m benchmarks.runner run [--filter NAME] [--repeat 5]
+    python -m benchmarks.runner compare BASE HEAD [--threshold 0.10]
+    python -m benchmarks.runner list
+
+A ``setup`` that raises ``NotImplementedError`` (for example because an
+optional dependency is missing) marks the case as skipped, as in asv.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import argparse
+import contextlib
+import datetime
+import importlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+BENCH_DIR = Path(__file__).parent
+REPO_ROOT = BENCH_DIR.parent
+DEFAULT_HISTORY = BENCH_DIR / "results" / "history.json"
+
+# Benchmark the checkout whose commit is recorded, never an installed copy
+for _path in (str(REPO_ROOT), str(REPO_ROOT / "src")):
+    if _path in sys.path:
+        sys.path.remove(_path)
+    sys.path.insert(0, _path)
+
+
+def discover(bench_dir: Path = BENCH_DIR,
+             name_filter: Optional[str] = None) -> Iterator[Tuple[str, Any, Callable, Any]]:
+    """
+    Yield benchmark cases as ``(name, owner, method, param)``.
+
+    ``owner`` is the benchmark class (None for module-level functions) and
+    ``param`` is None for unparameterized benchmarks.
+
+    Args:
+        bench_dir: Directory holding ``bench_*.py`` modules
+        name_filter: Substring that case names must contain
+
+    Yields:
+        Benchmark cases in file, class and method order
+    """
+    package = bench_dir.name
+    if str(bench_dir.parent) not in sys.path:
+        sys.path.insert(0, str(bench_dir.parent))
+    for path in sorted(bench_dir.glob("bench_*.py")):
+        module = importlib.import_module(f"{package}.{path.stem}")
+        for attr in vars(module).values():
+            if isinstance(attr, type) and attr.__module__ == module.__name__:
+                params = getattr(attr, "params", [None])
+                for method_name in sorted(m for m in vars(attr) if m.startswith("time_")):
+                    for param in params:
+                        suffix = "" if param is None else f"[{param}]"
+                        name = f"{path.stem}.{attr.__name__}.{method_name}{suffix}"
+                        if name_filter is None or name_filter in name:
+                            yield name, attr, getattr(attr, method_name), param
+            elif callable(attr) and getattr(attr, "__name__", "").startswith("time_") \
+                    and attr.__module__ == module.__name__:
+                name = f"{path.stem}.{attr.__name__}"
+                if name_filter is None or name_filter in name:
+                    yield name, None, attr, None
+
+
+def time_case(owner: Any, method: Callable, param: Any, repeat: int = 5,
+              min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Time one benchmark case.
+
+    Args:
+        owner: Benchmark class (None for module-level functions)
+        method: ``time_*`` callable
+        param: Parameter value (None if unparameterized)
+        repeat: Timed repetitions
+        min_time: Target seconds per repetition when choosing the loop count
+
+    Returns:
+        Dict with ``status`` ("ok", "skipped" or "error") and, when ok,
+        per-call ``median``, ``min`` and ``max`` seconds
+    """
+    args = () if param is None else (param,)
+    sink = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sink):
+            if owner is not None:
+                instance = owner()
+                if hasattr(instance, "setup"):
+                    instance.setup(*args)
+                call = lambda: method(instance, *args)  # noqa: E731
+            else:
+                call = lambda: method(*args)  # noqa: E731
+            timer = timeit.Timer(call)
+            number, elapsed = timer.autorange()
+            number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+            samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+            if owner is not None and hasattr(instance, "teardown"):
+                instance.teardown(*args)
+    except NotImplementedError as reason:
+        return {"status": "skipped", "reason": str(reason)}
+    except Exception as error:  # pylint: disable=broad-except
+        return {"status": "error", "reason": f"{type(error).__name__}: {error}"}
+    return {"status": "ok", "median": statistics.median(samples), "min": min(samples),
+            "max": max(samples), "number": number, "repeat": repeat}
+
+
+def current_commit(repo: Path = REPO_ROOT) -> Tuple[str, bool]:
+    """
+    Current git commit and whether the working tree has uncommitted changes.
+
+    Returns:
+        Tuple of (commit hash or "unknown", dirty flag)
+    """
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=repo,
+                                         stderr=subprocess.DEVNULL, text=True).strip()
+        status = subprocess.check_output(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=repo, stderr=subprocess.DEVNULL, text=True)
+        return commit, bool(status.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown", False
+
+
+def load_history(path: Path = DEFAULT_HISTORY) -> Dict[str, Any]:
+    """Load the benchmark history (empty if the file does not exist)."""
+    if not Path(path).exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run(history_path: Path = DEFAULT_HISTORY, name_filter: Optional[str] = None,
+        repeat: int = 5, commit: Optional[str] = None,
+        bench_dir: Path = BENCH_DIR) -> Dict[str, Any]:
+    """
+    Run the suite and store the results under the current commit.
+
+    Args:
+        history_path: JSON history file
+        name_filter: Substring that case names must contain
+        repeat: Timed repetitions per case
+        commit: Key to store results under (defaults to ``git rev-parse HEAD``)
+        bench_dir: Directory holding ``bench_*.py`` modules
+
+    Returns:
+        The stored history entry
+    """
+    detected, dirty = current_commit()
+    commit = commit or detected
+    results = {}
+    for name, owner, method, param in discover(bench_dir, name_filter):
+        results[name] = time_case(owner, method, param, repeat)
+        outcome = results[name]
+        detail = (f"{outcome['median'] * 1e3:10.3f} ms" if outcome["status"] == "ok"
+                  else f"{outcome['status']}: {outcome['reason']}")
+        print(f"   {name:<70} {detail}")
+
+    entry = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "dirty": dirty,
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    history = load_history(history_path)
+    previous = history.get(commit, {}).get("results", {})
+    entry["results"] = {**previous, **results}
+    history[commit] = entry
+    Path(history_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    return entry
+
+
+def _resolve(history: Dict[str, Any], ref: str) -> str:
+    if ref in history:
+        return ref
+    matches = [commit for commit in history if commit.startswith(ref)]
+    if len(matches) != 1:
+        try:
+            full = subprocess.check_output(["git", "rev-parse", ref], cwd=REPO_ROOT,
+                                           stderr=subprocess.DEVNULL, text=True).strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            full = None
+        if full in history:
+            return full
+        raise KeyError(f"No unique benchmark history entry for '{ref}'")
+    return matches[0]
+
+
+def compare(history: Dict[str, Any], base: str, head: str,
+            threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compare median times of two history entries.
+
+    Args:
+        history: Output of ``load_history``
+        base: Baseline commit (hash prefix or git ref)
+        head: Candidate commit (hash prefix or git ref)
+        threshold: Relative slowdown (0.10 = 10%) reported as a regression
+
+    Returns:
+        One row per benchmark with ``base``, ``head``, ``ratio`` and ``status``
+        ("regression", "improvement", "unchanged", "new", "removed", "skipped"
+        or "failed")
+    """
+    base_results = history[_resolve(history, base)]["results"]
+    head_results = history[_resolve(history, head)]["results"]
+    rows = []
+    for name in sorted(set(base_results) | set(head_results)):
+        old, new = base_results.get(name), head_results.get(name)
+        old_time = old.get("median") if old else None
+        new_time = new.get("median") if new else None
+        if old is None:
+            status, ratio = "new", None
+        elif new is None:
+            status, ratio = "removed", None
+        elif new_time is None:
+            status, ratio = ("failed" if new["status"] == "error" else "skipped"), None
+        elif old_time is None:
+            status, ratio = "new", None
+        else:
+            ratio = new_time / old_time
+            status = ("regression" if ratio > 1.0 + threshold
+                      else "improvement" if ratio < 1.0 / (1.0 + threshold) else "unchanged")
+        rows.append({"name": name, "base": old_time, "head": new_time, "ratio": ratio,
+                     "status": status})
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]]) -> None:
+    """Print a comparison table, regressions first."""
+    icons = {"regression": "❌", "improvement": "✅", "unchanged": "  ", "new": "🆕",
+             "removed": "🗑️", "skipped": "⏭️", "failed": "⚠️"}
+    order = ["regression", "failed", "improvement", "new", "removed", "skipped", "unchanged"]
+    print("\n⏱️ BENCHMARK COMPARISON")
+    print("-" * 50)
+    for row in sorted(rows, key=lambda r: (order.index(r["status"]), r["name"])):
+        timing = (f"{row['base'] * 1e3:9.3f} -> {row['head'] * 1e3:9.3f} ms "
+                  f"({row['ratio']:.2f}x)" if row["ratio"] is not None else row["status"])
+        print(f"{icons[row['status']]} {row['name']:<70} {timing}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns 1 when ``compare`` finds regressions."""
+    parser = argparse.ArgumentParser(description="Quipu Analytics benchmark suite")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and record them")
+    run_parser.add_argument("--filter", dest="name_filter")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--commit", help="history key (defaults to HEAD)")
+
+    compare_parser = commands.add_parser("compare", help="compare two recorded commits")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    list_parser = commands.add_parser("list", help="list benchmark cases")
+    list_parser.add_argument("--filter", dest="name_filter")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        run(args.history, args.name_filter, args.repeat, args.commit)
+    elif args.command == "list":
+        for name, *_ in discover(name_filter=args.name_filter):
+            print(name)
+    else:
+        rows = compare(load_history(args.history), args.base, args.head, args.threshold)
+        print_comparison(rows)
+        return int(any(row["status"] == "regression" for row in rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
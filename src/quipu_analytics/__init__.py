@@ -8,6 +8,29 @@ machine learning techniques.
 Modules:
 execution_tracking: Academic provenance and reproducibility utilities
 verify_installation: Installation verification and dependency checking
+density_clustering: Graph-reusing DBSCAN sweeps and geographic grid index
+hierarchical_clustering: Memory-bounded, scipy-compatible linkage
+cluster_selection: Warm-started k sweeps with approximate silhouette scoring
+dimensionality_reduction: Out-of-core incremental and randomized PCA
+streaming_anomaly: Online covariance and asyncio micro-batch anomaly scoring
+multivariate_distance: Vectorized classical and robust Mahalanobis distances
+model_store: Fingerprint-keyed estimator artifacts with memory-mapped arrays
+inference_server: Micro-batching asyncio model server with latency metrics
+resampling: Vectorized bootstrap confidence intervals and permutation tests
+distribution_fitting: Parallel, cached two-stage distribution fitting
+boosting_harness: XGBoost/LightGBM/CatBoost harness with dataset reuse and thread budgets
+dtype_optimization: Dtype downcasting, categoricals and memory reports on load
+environment_fingerprint: Cached environment fingerprint and run-to-run diffing
+content_hashing: Chunked mmap BLAKE2b file hashing with a stat-keyed digest cache
+notebook_index: Streaming .ipynb indexer with an mtime-invalidated SQLite index
+notebook_scaling: Data-scale parameter injection and notebook scaling reports
+sparse_encoding: Sparse one-hot/hashed categorical encoding straight to CSR
+incremental_ingestion: Tail-following ingestion with persisted daily/product/hour aggregates
+parallel_executor: Thread, process and socket-worker executors with locality-aware retries
+precision: Suite-wide float32/float64 precision policy and accuracy-drift report
+svm_search: SVM grid search reusing blocked Gram matrices, with Nystroem/RFF fallback
+regularization_paths: Path-based model selection for Ridge, Lasso/ElasticNet and logistic grids
+forest_tuning: Incremental random-forest growth with OOB plateau stopping and OOB model selection
 
 Author: Brandon Deloatch
 Affiliation: Quipu Research Labs, LLC
@@ -20,12 +43,126 @@ __author__ = "Brandon Deloatch"
 __email__ = "brandon@quipuresearchlabs.com"
 __license__ = "MIT"
 
+import importlib
+
 # Import main modules
 from .execution_tracking import setup_notebook_tracking, get_execution_metadata
+from .execution_tracking import track_stage, export_chrome_trace
 from .verify_installation import main as verify_installation
 
+# Analytics modules pull in numpy, pandas and scikit-learn, so their public
+# names are resolved on first access instead of at package import
+_LAZY_EXPORTS = {
+    'dbscan_sweep': 'density_clustering',
+    'GeoGridIndex': 'density_clustering',
+    'hierarchical_linkage': 'hierarchical_clustering',
+    'k_sweep': 'cluster_selection',
+    'select_k': 'cluster_selection',
+    'StreamingPCA': 'dimensionality_reduction',
+    'StreamingAnomalyScorer': 'streaming_anomaly',
+    'detect_multivariate_outliers': 'multivariate_distance',
+    'ModelStore': 'model_store',
+    'InferenceServer': 'inference_server',
+    'bootstrap': 'resampling',
+    'permutation_test': 'resampling',
+    'fit_distributions': 'distribution_fitting',
+    'FitCache': 'distribution_fitting',
+    'BoostingHarness': 'boosting_harness',
+    'throughput_comparison': 'boosting_harness',
+    'optimize_dtypes': 'dtype_optimization',
+    'load_dataset': 'dtype_optimization',
+    'get_environment_fingerprint': 'environment_fingerprint',
+    'diff_fingerprints': 'environment_fingerprint',
+    'hash_file': 'content_hashing',
+    'hash_directory': 'content_hashing',
+    'HashCache': 'content_hashing',
+    'NotebookIndex': 'notebook_index',
+    'scan_notebook': 'notebook_index',
+    'run_notebook': 'notebook_scaling',
+    'scaling_study': 'notebook_scaling',
+    'fit_complexity': 'notebook_scaling',
+    'SparseFeatureEncoder': 'sparse_encoding',
+    'IncrementalIngestor': 'incremental_ingestion',
+    'get_executor': 'parallel_executor',
+    'WorkerServer': 'parallel_executor',
+    'start_local_workers': 'parallel_executor',
+    'run_cv_trials': 'parallel_executor',
+    'set_precision': 'precision',
+    'get_precision': 'precision',
+    'precision_scope': 'precision',
+    'wrap_estimator': 'precision',
+    'precision_drift': 'precision',
+    'SVMGridSearch': 'svm_search',
+    'GramStore': 'svm_search',
+    'RegularizationPathSearch': 'regularization_paths',
+    'ridge_path': 'regularization_paths',
+    'OOBForestSearch': 'forest_tuning',
+    'grow_forest': 'forest_tuning',
+}
+
+
+def __getattr__(name):
+    """Import the module behind a lazily exported name on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazily exported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 __all__ = [
 'setup_notebook_tracking',
 'get_execution_metadata',
-'verify_installation'
+'verify_installation',
+'dbscan_sweep',
+'GeoGridIndex',
+'hierarchical_linkage',
+'k_sweep',
+'select_k',
+'StreamingPCA',
+'StreamingAnomalyScorer',
+'detect_multivariate_outliers',
+'ModelStore',
+'InferenceServer',
+'bootstrap',
+'permutation_test',
+'fit_distributions',
+'FitCache',
+'BoostingHarness',
+'throughput_comparison',
+'optimize_dtypes',
+'load_dataset',
+'get_environment_fingerprint',
+'diff_fingerprints',
+'hash_file',
+'hash_directory',
+'HashCache',
+'track_stage',
+'export_chrome_trace',
+'NotebookIndex',
+'scan_notebook',
+'run_notebook',
+'scaling_study',
+'fit_complexity',
+'SparseFeatureEncoder',
+'IncrementalIngestor',
+'get_executor',
+'WorkerServer',
+'start_local_workers',
+'run_cv_trials',
+'set_precision',
+'get_precision',
+'precision_scope',
+'wrap_estimator',
+'precision_drift',
+'SVMGridSearch',
+'GramStore',
+'RegularizationPathSearch',
+'ridge_path',
+'OOBForestSearch',
+'grow_forest'
 ]
\ No newline at end of file
@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+Unified Gradient-Boosting Harness
+
+This module trains XGBoost, LightGBM, CatBoost and scikit-learn's
+``HistGradientBoosting`` behind one interface. The boosting notebooks
+rebuild ``DMatrix``/``Dataset``/``Pool`` objects inside every fit and leave
+thread counts at their defaults, which oversubscribes cores under
+``GridSearchCV``. Here the native binned datasets are built once per CV
+fold (``QuantileDMatrix``, constructed LightGBM ``Dataset`` with a shared
+bin reference, quantized CatBoost ``Pool``) and reused by every
+hyperparameter trial, each trial gets an explicit thread budget, training
+is early-stopped on the fold's validation split, and a throughput
+comparison reports build, training and prediction speed per library.
+
+XGBoost, LightGBM and CatBoost are optional: backends whose library is not
+installed are skipped, following the notebooks' availability checks.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import abc
+import importlib
+import inspect
+import itertools
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def _categorical_columns(X: Any) -> List[str]:
+    if isinstance(X, pd.DataFrame):
+        return [c for c in X.columns if isinstance(X[c].dtype, pd.CategoricalDtype)]
+    return []
+
+
+def _rows(X: Any, index: np.ndarray) -> Any:
+    return X.iloc[index] if isinstance(X, (pd.DataFrame, pd.Series)) else X[index]
+
+
+class BoostingBackend(abc.ABC):
+    """
+    Interface implemented by each boosting library adapter.
+
+    Args:
+        task: "binary" or "regression"
+        max_bin: Histogram bins used when building datasets
+        random_state: Seed passed to the library
+    """
+
+    name = "base"
+    module: Optional[str] = None
+
+    def __init__(self, task: str = "binary", max_bin: int = 255, random_state: int = 42):
+        if task not in ("binary", "regression"):
+            raise ValueError(f"Unsupported task '{task}'; use 'binary' or 'regression'")
+        self.task = task
+        self.max_bin = max_bin
+        self.random_state = random_state
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the backing library can be imported."""
+        if cls.module is None:
+            return True
+        try:
+            importlib.import_module(cls.module)
+            return True
+        except ImportError:
+            return False
+
+    @abc.abstractmethod
+    def build(self, X: Any, y: Any, reference: Any = None) -> Any:
+        """Build the native (binned) dataset; ``reference`` is the fold's training set."""
+
+    @abc.abstractmethod
+    def train(self, params: Dict[str, Any], train_set: Any, valid_set: Any,
+              num_boost_round: int, early_stopping_rounds: int,
+              n_threads: int) -> Tuple[Any, int]:
+        """Train with early stopping; returns the model and its best iteration count."""
+
+    @abc.abstractmethod
+    def predict(self, model: Any, X: Any, dataset: Any, n_iterations: int) -> np.ndarray:
+        """Probabilities (binary) or values (regression) using ``n_iterations`` rounds."""
+
+
+class XGBoostBackend(BoostingBackend):
+    """XGBoost with ``QuantileDMatrix`` datasets sharing the training quantiles."""
+
+    name = "xgboost"
+    module = "xgboost"
+
+    def build(self, X: Any, y: Any, reference: Any = None) -> Any:
+        xgb = importlib.import_module("xgboost")
+        return xgb.QuantileDMatrix(X, label=y, ref=reference, max_bin=self.max_bin,
+                                   enable_categorical=bool(_categorical_columns(X)))
+
+    def train(self, params, train_set, valid_set, num_boost_round, early_stopping_rounds,
+              n_threads):
+        xgb = importlib.import_module("xgboost")
+        config = {
+            "objective": "binary:logistic" if self.task == "binary" else "reg:squarederror",
+            "eval_metric": "logloss" if self.task == "binary" else "rmse",
+            "tree_method": "hist",
+            "max_bin": self.max_bin,
+            "seed": self.random_state,
+            **params,
+            "nthread": n_threads,
+        }
+        booster = xgb.train(config, train_set, num_boost_round=num_boost_round,
+                            evals=[(valid_set, "valid")],
+                            early_stopping_rounds=early_stopping_rounds, verbose_eval=False)
+        return booster, booster.best_iteration + 1
+
+    def predict(self, model, X, dataset, n_iterations):
+        return model.predict(dataset, iteration_range=(0, n_iterations))
+
+
+class LightGBMBackend(BoostingBackend):
+    """LightGBM with eagerly constructed ``Dataset`` objects sharing bin mappers."""
+
+    name = "lightgbm"
+    module = "lightgbm"
+
+    def build(self, X: Any, y: Any, reference: Any = None) -> Any:
+        lgb = importlib.import_module("lightgbm")
+        dataset = lgb.Dataset(X, label=y, reference=reference, free_raw_data=False,
+                              params={"max_bin": self.max_bin, "verbose": -1})
+        return dataset.construct()
+
+    def train(self, params, train_set, valid_set, num_boost_round, early_stopping_rounds,
+              n_threads):
+        lgb = importlib.import_module("lightgbm")
+        config = {
+            "objective": "binary" if self.task == "binary" else "regression",
+            "metric": "binary_logloss" if self.task == "binary" else "rmse",
+            "max_bin": self.max_bin,
+            "seed": self.random_state,
+            "verbose": -1,
+            **params,
+            "num_threads": n_threads,
+        }
+        booster = lgb.train(config, train_set, num_boost_round=num_boost_round,
+                            valid_sets=[valid_set],
+                            callbacks=[lgb.early_stopping(early_stopping_rounds, verbose=False)])
+        return booster, booster.best_iteration or booster.current_iteration()
+
+    def predict(self, model, X, dataset, n_iterations):
+        return model.predict(X, num_iteration=n_iterations)
+
+
+class CatBoostBackend(BoostingBackend):
+    """CatBoost with the training ``Pool`` quantized once per fold."""
+
+    name = "catboost"
+    module = "catboost"
+
+    def build(self, X: Any, y: Any, reference: Any = None) -> Any:
+        catboost = importlib.import_module("catboost")
+        pool = catboost.Pool(X, label=y, cat_features=_categorical_columns(X) or None)
+        if reference is None:
+            pool.quantize(border_count=self.max_bin)
+        return pool
+
+    def train(self, params, train_set, valid_set, num_boost_round, early_stopping_rounds,
+              n_threads):
+        catboost = importlib.import_module("catboost")
+        config = {
+            "loss_function": "Logloss" if self.task == "binary" else "RMSE",
+            "iterations": num_boost_round,
+            "random_seed": self.random_state,
+            "use_best_model": True,
+            "verbose": False,
+            **params,
+            "thread_count": n_threads,
+        }
+        model = catboost.CatBoost(config)
+        model.fit(train_set, eval_set=valid_set, early_stopping_rounds=early_stopping_rounds)
+        return model, model.get_best_iteration() + 1
+
+    def predict(self, model, X, dataset, n_iterations):
+        if self.task == "binary":
+            return model.predict(dataset, prediction_type="Probability",
+                                 ntree_end=n_iterations)[:, 1]
+        return model.predict(dataset, ntree_end=n_iterations)
+
+
+class SklearnHistBackend(BoostingBackend):
+    """
+    scikit-learn ``HistGradientBoosting`` (always available).
+
+    scikit-learn bins inside ``fit``, so only the fold split is reused; thread
+    budgets are applied through ``threadpoolctl``. Before scikit-learn 1.7,
+    whose ``fit`` cannot take the validation split, trees are added with
+    ``warm_start`` and early stopping is done on the staged validation loss.
+    """
+
+    name = "sklearn"
+
+    def build(self, X: Any, y: Any, reference: Any = None) -> Any:
+        return X, np.asarray(y)
+
+    def train(self, params, train_set, valid_set, num_boost_round, early_stopping_rounds,
+              n_threads):
+        from sklearn.ensemble import (  # pylint: disable=import-outside-toplevel
+            HistGradientBoostingClassifier, HistGradientBoostingRegressor)
+        from threadpoolctl import threadpool_limits  # pylint: disable=import-outside-toplevel
+
+        estimator = (HistGradientBoostingClassifier if self.task == "binary"
+                     else HistGradientBoostingRegressor)
+        if not _fit_accepts_validation_set(estimator):
+            model = estimator(max_iter=num_boost_round, max_bins=min(self.max_bin, 255),
+                              early_stopping=False, warm_start=True,
+                              random_state=self.random_state, **params)
+            with threadpool_limits(limits=n_threads, user_api="openmp"):
+                return self._train_warm_started(model, train_set, valid_set, num_boost_round,
+                                                early_stopping_rounds)
+        model = estimator(max_iter=num_boost_round, max_bins=min(self.max_bin, 255),
+                          early_stopping=True, n_iter_no_change=early_stopping_rounds,
+                          scoring="loss", random_state=self.random_state, **params)
+        with threadpool_limits(limits=n_threads, user_api="openmp"):
+            model.fit(*train_set, X_val=valid_set[0], y_val=valid_set[1])
+        # validation_score_[0] is the initial prediction, so index == iterations
+        return model, max(int(np.argmax(model.validation_score_)), 1)
+
+    def _train_warm_started(self, model, train_set, valid_set, num_boost_round,
+                            early_stopping_rounds):
+        """Early stopping on the validation split for scikit-learn < 1.7."""
+        X_val, y_val = valid_set[0], np.asarray(valid_set[1])
+        losses: List[float] = []
+        while len(losses) < num_boost_round:
+            model.set_params(max_iter=min(len(losses) + early_stopping_rounds,
+                                          num_boost_round)).fit(*train_set)
+            staged = (model.staged_predict_proba(X_val) if self.task == "binary"
+                      else model.staged_predict(X_val))
+            for prediction in itertools.islice(staged, len(losses), None):
+                if self.task == "binary":
+                    p = np.clip(prediction[:, 1], 1e-15, 1 - 1e-15)
+                    losses.append(float(-np.mean(y_val * np.log(p) + (1 - y_val) * np.log(1 - p))))
+                else:
+                    losses.append(float(np.mean((y_val - prediction) ** 2)))
+            if len(losses) - 1 - int(np.argmin(losses)) >= early_stopping_rounds:
+                break
+        return model, int(np.argmin(losses)) + 1
+
+    def predict(self, model, X, dataset, n_iterations):
+        staged = (model.staged_predict_proba(X) if self.task == "binary"
+                  else model.staged_predict(X))
+        prediction = next(itertools.islice(staged, n_iterations - 1, None))
+        return prediction[:, 1] if self.task == "binary" else prediction
+
+
+def _fit_accepts_validation_set(estimator: type) -> bool:
+    """Whether ``estimator.fit`` takes ``X_val``/``y_val`` (scikit-learn >= 1.7)."""
+    return "X_val" in inspect.signature(estimator.fit).parameters
+
+
+BACKENDS = {backend.name: backend for backend in
+            (XGBoostBackend, LightGBMBackend, CatBoostBackend, SklearnHistBackend)}
+
+
+def available_backends() -> List[str]:
+    """
+    Names of backends whose library is installed.
+
+    Returns:
+        List of backend names
+    """
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def thread_budget(n_parallel_trials: int = 1, total_threads: Optional[int] = None) -> int:
+    """
+    Threads each concurrent trial may use without oversubscribing cores.
+
+    Args:
+        n_parallel_trials: Trials trained at the same time
+        total_threads: Threads available (defaults to the CPUs usable by this process)
+
+    Returns:
+        Per-trial thread count (at least 1)
+    """
+    if total_threads is None:
+        total_threads = (len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity")
+                         else os.cpu_count() or 1)
+    return max(1, total_threads // max(1, n_parallel_trials))
+
+
+def _score(task: str, y_true: np.ndarray, prediction: np.ndarray) -> Dict[str, float]:
+    from sklearn.metrics import (  # pylint: disable=import-outside-toplevel
+        log_loss, mean_squared_error, roc_auc_score)
+
+    if task == "binary":
+        return {"logloss": float(log_loss(y_true, np.clip(prediction, 1e-15, 1 - 1e-15))),
+                "auc": float(roc_auc_score(y_true, prediction))}
+    return {"rmse": float(np.sqrt(mean_squared_error(y_true, prediction)))}
+
+
+class BoostingHarness:
+    """
+    Early-stopped cross-validation with native datasets reused across trials.
+
+    Datasets are built lazily, once per fold and per concurrent worker slot,
+    because native dataset objects are not safe to share between trials that
+    train at the same time. Dataset-level settings (``max_bin``) are fixed per
+    harness; trial parameters must not change them.
+
+    Args:
+        backend: Backend name (see ``available_backends``)
+        X: Features (DataFrame or array)
+        y: Target
+        task: "binary" or "regression"
+        n_splits: Cross-validation folds
+        max_bin: Histogram bins
+        random_state: Seed for folds and libraries
+    """
+
+    def __init__(self, backend: str, X: Any, y: Any, task: str = "binary",
+                 n_splits: int = 5, max_bin: int = 255, random_state: int = 42):
+        from sklearn.model_selection import (  # pylint: disable=import-outside-toplevel
+            KFold, StratifiedKFold)
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'; choose from {sorted(BACKENDS)}")
+        if not BACKENDS[backend].available():
+            raise ImportError(f"{backend} is not installed")
+        self.backend = BACKENDS[backend](task=task, max_bin=max_bin, random_state=random_state)
+        self.task = task
+        self.X = X
+        self.y = np.asarray(y)
+        splitter = (StratifiedKFold if task == "binary" else KFold)(
+            n_splits=n_splits, shuffle=True, random_state=random_state)
+        self.folds = list(splitter.split(np.zeros(len(self.y)), self.y))
+        self._datasets: Dict[Tuple[int, int], Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+        self.build_seconds = 0.0
+        self.datasets_built = 0
+
+    def _fold_datasets(self, fold: int, slot: int) -> Tuple[Any, Any]:
+        key = (fold, slot)
+        if key not in self._datasets:
+            train_index, valid_index = self.folds[fold]
+            start = time.perf_counter()
+            train_set = self.backend.build(_rows(self.X, train_index), self.y[train_index])
+            valid_set = self.backend.build(_rows(self.X, valid_index), self.y[valid_index],
+                                           reference=train_set)
+            with self._lock:
+                self._datasets[key] = (train_set, valid_set)
+                self.build_seconds += time.perf_counter() - start
+                self.datasets_built += 1
+        return self._datasets[key]
+
+    def cross_validate(self, params: Optional[Dict[str, Any]] = None,
+                       num_boost_round: int = 1000, early_stopping_rounds: int = 50,
+                       n_threads: Optional[int] = None, slot: int = 0) -> Dict[str, Any]:
+        """
+        Early-stopped CV of one parameter set.
+
+        Args:
+            params: Library-native hyperparameters
+            num_boost_round: Maximum boosting rounds
+            early_stopping_rounds: Rounds without validation improvement before stopping
+            n_threads: Threads for training (defaults to ``thread_budget()``)
+            slot: Dataset slot (distinct per concurrently running trial)
+
+        Returns:
+            Dict with mean validation metrics, per-fold ``best_iterations`` and
+            ``train_seconds``
+        """
+        params = dict(params or {})
+        n_threads = n_threads or thread_budget()
+        fold_scores, best_iterations, train_seconds = [], [], 0.0
+        for fold, (_, valid_index) in enumerate(self.folds):
+            train_set, valid_set = self._fold_datasets(fold, slot)
+            start = time.perf_counter()
+            model, n_iterations = self.backend.train(params, train_set, valid_set,
+                                                     num_boost_round, early_stopping_rounds,
+                                                     n_threads)
+            train_seconds += time.perf_counter() - start
+            prediction = self.backend.predict(model, _rows(self.X, valid_index), valid_set,
+                                              n_iterations)
+            fold_scores.append(_score(self.task, self.y[valid_index], prediction))
+            best_iterations.append(n_iterations)
+
+        summary = {metric: float(np.mean([s[metric] for s in fold_scores]))
+                   for metric in fold_scores[0]}
+        summary.update(params=params, best_iterations=best_iterations,
+                       train_seconds=train_seconds, n_threads=n_threads)
+        return summary
+
+    def search(self, param_grid: Union[Dict[str, Sequence[Any]], List[Dict[str, Any]]],
+               n_parallel_trials: int = 1, num_boost_round: int = 1000,
+               early_stopping_rounds: int = 50,
+               total_threads: Optional[int] = None) -> pd.DataFrame:
+        """
+        Evaluate a hyperparameter grid with explicit per-trial thread budgets.
+
+        Args:
+            param_grid: Dict of value lists (expanded like ``GridSearchCV``) or a
+                list of parameter dicts
+            n_parallel_trials: Trials trained concurrently
+            num_boost_round: Maximum boosting rounds
+            early_stopping_rounds: Rounds without validation improvement before stopping
+            total_threads: Threads shared by all trials (defaults to available CPUs)
+
+        Returns:
+            DataFrame with one row per trial, best first
+        """
+        if isinstance(param_grid, dict):
+            names = list(param_grid)
+            trials = [dict(zip(names, values))
+                      for values in itertools.product(*(param_grid[n] for n in names))]
+        else:
+            trials = list(param_grid)
+        n_threads = thread_budget(n_parallel_trials, total_threads)
+        slots: "queue.Queue[int]" = queue.Queue()
+        for slot in range(n_parallel_trials):
+            slots.put(slot)
+
+        def run(params: Dict[str, Any]) -> Dict[str, Any]:
+            slot = slots.get()
+            try:
+                return self.cross_validate(params, num_boost_round, early_stopping_rounds,
+                                           n_threads, slot)
+            finally:
+                slots.put(slot)
+
+        with ThreadPoolExecutor(max_workers=n_parallel_trials) as executor:
+            results = list(executor.map(run, trials))
+
+        frame = pd.DataFrame(results)
+        metric = "logloss" if self.task == "binary" else "rmse"
+        return frame.sort_values(metric).reset_index(drop=True)
+
+
+def throughput_comparison(X: Any, y: Any, backends: Optional[Sequence[str]] = None,
+                          task: str = "binary", params: Optional[Dict[str, Dict]] = None,
+                          num_boost_round: int = 200, early_stopping_rounds: int = 20,
+                          n_threads: Optional[int] = None, test_size: float = 0.2,
+                          random_state: int = 42) -> pd.DataFrame:
+    """
+    Compare dataset build, training and prediction throughput across libraries.
+
+    Args:
+        X: Features
+        y: Target
+        backends: Backend names (defaults to every installed backend)
+        task: "binary" or "regression"
+        params: Optional per-backend hyperparameters keyed by backend name
+        num_boost_round: Maximum boosting rounds
+        early_stopping_rounds: Rounds without validation improvement before stopping
+        n_threads: Threads per library (defaults to ``thread_budget()``)
+        test_size: Holdout fraction used for early stopping and scoring
+        random_state: Seed for the split and the libraries
+
+    Returns:
+        DataFrame with one row per backend
+    """
+    from sklearn.model_selection import train_test_split  # pylint: disable=import-outside-toplevel
+
+    y = np.asarray(y)
+    train_index, test_index = train_test_split(
+        np.arange(len(y)), test_size=test_size, random_state=random_state,
+        stratify=y if task == "binary" else None)
+    n_threads = n_threads or thread_budget()
+    rows = []
+    for name in backends or available_backends():
+        backend = BACKENDS[name](task=task, random_state=random_state)
+        X_train, X_test = _rows(X, train_index), _rows(X, test_index)
+
+        start = time.perf_counter()
+        train_set = backend.build(X_train, y[train_index])
+        test_set = backend.build(X_test, y[test_index], reference=train_set)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model, n_iterations = backend.train((params or {}).get(name, {}), train_set, test_set,
+                                            num_boost_round, early_stopping_rounds, n_threads)
+        train_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        prediction = backend.predict(model, X_test, test_set, n_iterations)
+        predict_seconds = time.perf_counter() - start
+
+        rows.append({
+            "backend": name,
+            "build_seconds": build_seconds,
+            "train_seconds": train_seconds,
+            "iterations": n_iterations,
+            "train_rows_per_second": len(train_index) * n_iterations / train_seconds,
+            "predict_rows_per_second": len(test_index) / predict_seconds,
+            "n_threads": n_threads,
+            **_score(task, y[test_index], prediction),
+        })
+    return pd.DataFrame(rows)
+
+
+def print_throughput_report(results: pd.DataFrame) -> None:
+    """
+    Print the output of ``throughput_comparison``.
+
+    Args:
+        results: Throughput comparison frame
+    """
+    print("\n🚀 GRADIENT BOOSTING THROUGHPUT")
+    print("-" * 50)
+    for _, row in results.iterrows():
+        quality = (f"AUC={row['auc']:.4f}" if "auc" in row and pd.notna(row.get("auc"))
+                   else f"RMSE={row['rmse']:.4f}")
+        print(f"   {row['backend']:<9} build {row['build_seconds']:.2f}s  "
+              f"train {row['train_seconds']:.2f}s ({row['iterations']} rounds)  "
+              f"{row['train_rows_per_second']:,.0f} row-rounds/s  {quality}")
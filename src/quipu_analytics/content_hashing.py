@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Chunked, Stat-Cached Content Hashing for Data Provenance
+
+This module fingerprints the bytes a notebook actually reads. Files are
+memory-mapped and fed to BLAKE2b in fixed-size chunks, so multi-GB inputs
+are hashed without loading them into memory. Digests are cached under
+(path, size, mtime, inode), so an unchanged file is never rehashed, and the
+cache can persist to JSON across sessions. Directories are hashed with a
+thread pool (hashlib releases the GIL on large buffers) and combined into a
+single digest that result caches can use as a key.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+CHUNK_SIZE = 8 * 1024 * 1024
+DIGEST_SIZE = 32
+
+PathLike = Union[str, os.PathLike]
+
+
+def _stat_key(path: Path) -> Tuple[str, int, int, int]:
+    stat = path.stat()
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _hash_bytes(path: Path, chunk_size: int) -> str:
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, len(view), chunk_size):
+                    digest.update(view[start:start + chunk_size])
+            finally:
+                view.release()
+    return digest.hexdigest()
+
+
+class HashCache:
+    """
+    File digests keyed by (path, size, mtime, inode).
+
+    Only the latest state of each path is kept, so entries are indexed by
+    resolved path and replacing a stale digest is a single dict update.
+
+    Args:
+        path: Optional JSON file for persistence across sessions
+    """
+
+    def __init__(self, path: Optional[PathLike] = None):
+        self.path = Path(path) if path is not None else None
+        # resolved path -> [size, mtime_ns, inode, digest]
+        self._entries: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+
+    def get(self, stat_key: Tuple[str, int, int, int]) -> Optional[str]:
+        """
+        Cached digest for a file state, or None.
+
+        Args:
+            stat_key: (resolved path, size, mtime_ns, inode)
+
+        Returns:
+            Hex digest or None
+        """
+        with self._lock:
+            entry = self._entries.get(stat_key[0])
+            digest = entry[3] if entry is not None and tuple(entry[:3]) == stat_key[1:] else None
+            if digest is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return digest
+
+    def put(self, stat_key: Tuple[str, int, int, int], digest: str) -> None:
+        """
+        Store a digest, replacing entries for older states of the same path.
+
+        Args:
+            stat_key: (resolved path, size, mtime_ns, inode)
+            digest: Hex digest of the file contents
+        """
+        with self._lock:
+            self._entries[stat_key[0]] = [*stat_key[1:], digest]
+
+    def save(self) -> None:
+        """Write the cache to its JSON file (no-op for in-memory caches)."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = dict(self._entries)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+_DEFAULT_CACHE = HashCache()
+
+
+def hash_file(path: PathLike, cache: Optional[HashCache] = None,
+              chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    BLAKE2b digest of a file's contents, reused while its stat is unchanged.
+
+    Args:
+        path: File to hash
+        cache: Digest cache (defaults to a process-wide in-memory cache)
+        chunk_size: Bytes fed to the hash per update
+
+    Returns:
+        Dict with ``path``, ``size``, ``mtime_ns``, ``blake2b`` and ``cached``
+    """
+    cache = _DEFAULT_CACHE if cache is None else cache
+    path = Path(path)
+    stat_key = _stat_key(path)
+    digest = cache.get(stat_key)
+    cached = digest is not None
+    if digest is None:
+        digest = _hash_bytes(path, chunk_size)
+        # A write during hashing changes the stat; only cache a consistent read
+        if _stat_key(path) == stat_key:
+            cache.put(stat_key, digest)
+    return {"path": str(path), "size": stat_key[1], "mtime_ns": stat_key[2],
+            "blake2b": digest, "cached": cached}
+
+
+def hash_files(paths: Iterable[PathLike], cache: Optional[HashCache] = None,
+               n_jobs: Optional[int] = None,
+               chunk_size: int = CHUNK_SIZE) -> Dict[str, Dict[str, Any]]:
+    """
+    Hash several files concurrently.
+
+    Args:
+        paths: Files to hash
+        cache: Digest cache (defaults to a process-wide in-memory cache)
+        n_jobs: Worker threads (defaults to the CPU count, at most 8)
+        chunk_size: Bytes fed to the hash per update
+
+    Returns:
+        Dict mapping each path (as given) to its ``hash_file`` record
+    """
+    paths = [str(path) for path in paths]
+    n_jobs = n_jobs or min(8, os.cpu_count() or 1)
+    if n_jobs == 1 or len(paths) <= 1:
+        records = [hash_file(path, cache, chunk_size) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            records = list(executor.map(lambda p: hash_file(p, cache, chunk_size), paths))
+    return dict(zip(paths, records))
+
+
+def hash_directory(directory: PathLike, pattern: str = "**/*",
+                   cache: Optional[HashCache] = None, n_jobs: Optional[int] = None,
+                   chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Hash every file under a directory in parallel and combine the digests.
+
+    Args:
+        directory: Root directory
+        pattern: Glob pattern relative to ``directory``
+        cache: Digest cache (defaults to a process-wide in-memory cache)
+        n_jobs: Worker threads (defaults to the CPU count, at most 8)
+        chunk_size: Bytes fed to the hash per update
+
+    Returns:
+        Dict with ``path``, per-file ``files`` digests keyed by relative
+        POSIX path, total ``size`` and a combined ``blake2b`` digest that
+        changes whenever any file's contents, name or presence changes
+    """
+    root = Path(directory)
+    files = sorted(path for path in root.glob(pattern) if path.is_file())
+    records = hash_files(files, cache, n_jobs, chunk_size)
+    digests = {Path(path).relative_to(root).as_posix(): record["blake2b"]
+               for path, record in records.items()}
+    combined = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for name in sorted(digests):
+        combined.update(f"{name}\0{digests[name]}\n".encode())
+    return {"path": str(root), "files": digests,
+            "size": sum(record["size"] for record in records.values()),
+            "blake2b": combined.hexdigest()}
+
+
+def fingerprint_paths(paths: Iterable[PathLike], cache: Optional[HashCache] = None,
+                      n_jobs: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Provenance records for a mix of files and directories.
+
+    Args:
+        paths: Files or directories read by a notebook
+        cache: Digest cache (defaults to a process-wide in-memory cache)
+        n_jobs: Worker threads per directory or file batch
+
+    Returns:
+        Dict mapping each path to its ``hash_file`` or ``hash_directory`` record
+    """
+    paths = [str(path) for path in paths]
+    records = hash_files([p for p in paths if not Path(p).is_dir()], cache, n_jobs)
+    for path in paths:
+        if Path(path).is_dir():
+            records[path] = hash_directory(path, cache=cache, n_jobs=n_jobs)
+    return {path: records[path] for path in paths}
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Density-Based Clustering Utilities
+
+This module provides a DBSCAN engine that builds a single sorted,
+radius-bounded neighbor graph and answers an entire eps/min_samples sweep
+from it, plus a grid spatial index with haversine distance for clustering
+latitude/longitude data such as store and customer locations.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class NeighborGraph:
+    """
+    Sorted, radius-bounded neighbor graph stored in CSR layout.
+
+    Row ``i`` holds every point within ``radius`` of point ``i`` (including
+    ``i`` itself) ordered by increasing distance, so any smaller radius is a
+    prefix of each row.
+
+    Args:
+        indptr: Row pointer array of length ``n_samples + 1``
+        indices: Neighbor indices, sorted by distance within each row
+        distances: Neighbor distances aligned with ``indices``
+        radius: Radius the graph was built with
+        metric: Distance metric name ("euclidean" or "haversine")
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray,
+                 distances: np.ndarray, radius: float, metric: str = "euclidean"):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.distances = np.asarray(distances, dtype=np.float64)
+        self.radius = float(radius)
+        self.metric = metric
+        self._rows = np.repeat(np.arange(self.n_samples, dtype=np.int64),
+                               np.diff(self.indptr))
+
+    @property
+    def n_samples(self) -> int:
+        """Number of points in the graph."""
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        """Number of stored (point, neighbor) pairs."""
+        return len(self.indices)
+
+    def _check_eps(self, eps: float) -> None:
+        if eps > self.radius:
+            raise ValueError(f"eps={eps} exceeds the graph radius {self.radius}; "
+                             "rebuild the graph with a larger radius")
+
+    def counts_within(self, eps: float) -> np.ndarray:
+        """
+        Count neighbors (including the point itself) within ``eps``.
+
+        Args:
+            eps: Neighborhood radius, at most the graph radius
+
+        Returns:
+            Array of neighbor counts per point
+        """
+        self._check_eps(eps)
+        within = self.distances <= eps
+        return np.bincount(self._rows[within], minlength=self.n_samples)
+
+    def kth_distances(self, k: int) -> np.ndarray:
+        """
+        Distance to the k-th nearest neighbor, counting the point itself.
+
+        Matches ``NearestNeighbors(n_neighbors=k).kneighbors(X)[0][:, k - 1]``
+        for points that have at least ``k`` neighbors inside the graph radius;
+        other points get ``inf``.
+
+        Args:
+            k: Neighbor rank (1 is the point itself)
+
+        Returns:
+            Array of k-distances per point
+        """
+        row_lengths = np.diff(self.indptr)
+        result = np.full(self.n_samples, np.inf)
+        has_k = row_lengths >= k
+        result[has_k] = self.distances[self.indptr[:-1][has_k] + k - 1]
+        return result
+
+
+def haversine_distances(lat1: np.ndarray, lon1: np.ndarray,
+                        lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance in kilometres between coordinates in degrees.
+
+    Inputs broadcast against each other, so passing column and row vectors
+    yields a full distance block.
+
+    Args:
+        lat1: Latitudes of the first set of points
+        lon1: Longitudes of the first set of points
+        lat2: Latitudes of the second set of points
+        lon2: Longitudes of the second set of points
+
+    Returns:
+        Array of distances in kilometres
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(v) for v in (lat1, lon1, lat2, lon2))
+    hav = (np.sin((lat2 - lat1) / 2.0) ** 2
+           + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2)
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(hav, 0.0, 1.0)))
+
+
+class GeoGridIndex:
+    """
+    Latitude/longitude grid index for haversine radius queries.
+
+    Cells are sized so that any two points within ``cell_km`` of each other
+    fall in the same or adjacent cells, so a radius query only inspects the
+    3x3 block of cells around each point. Longitude cells wrap around the
+    antimeridian.
+
+    Args:
+        coords: Array of shape (n_samples, 2) holding latitude, longitude in degrees
+        cell_km: Largest query radius the index must support, in kilometres
+    """
+
+    def __init__(self, coords: np.ndarray, cell_km: float):
+        coords = np.asarray(coords, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("coords must have shape (n_samples, 2) as (latitude, longitude)")
+        if cell_km <= 0:
+            raise ValueError("cell_km must be positive")
+
+        self.coords = coords
+        self.cell_km = float(cell_km)
+
+        angle = self.cell_km / EARTH_RADIUS_KM
+        self.lat_step = math.degrees(angle)
+        max_abs_lat = float(np.abs(coords[:, 0]).max()) if len(coords) else 0.0
+        cos_lat = math.cos(math.radians(max_abs_lat))
+        ratio = math.sin(angle / 2.0) / cos_lat if cos_lat > 0 else np.inf
+        if ratio >= 1.0:
+            self.n_lon_cells = 1
+        else:
+            min_lon_step = math.degrees(2.0 * math.asin(ratio))
+            self.n_lon_cells = max(1, int(360.0 // min_lon_step))
+        self.lon_step = 360.0 / self.n_lon_cells
+
+        self.cell_rows = np.floor((coords[:, 0] + 90.0) / self.lat_step).astype(np.int64)
+        self.cell_cols = np.mod(np.floor((coords[:, 1] + 180.0) / self.lon_step).astype(np.int64),
+                                self.n_lon_cells)
+        keys = self.cell_rows * self.n_lon_cells + self.cell_cols
+
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_keys, self.cell_starts, self.cell_counts = np.unique(
+            keys[self.order], return_index=True, return_counts=True)
+
+    @property
+    def n_cells(self) -> int:
+        """Number of occupied grid cells."""
+        return len(self.cell_keys)
+
+    def _cell_offsets(self) -> List[Tuple[int, int]]:
+        """Distinct (row, column) offsets of the 3x3 neighborhood after wrapping."""
+        col_offsets = sorted({d % self.n_lon_cells for d in (-1, 0, 1)})
+        return [(dr, dc) for dr in (-1, 0, 1) for dc in col_offsets]
+
+    def radius_graph(self, radius_km: Optional[float] = None,
+                     max_pairs: int = 4_000_000) -> NeighborGraph:
+        """
+        Build the sorted neighbor graph of every indexed point.
+
+        Candidate pairs are generated per neighboring-cell offset with array
+        operations only, in batches of at most ``max_pairs`` to bound memory.
+
+        Args:
+            radius_km: Query radius in kilometres (defaults to ``cell_km``)
+            max_pairs: Candidate pairs evaluated per batch
+
+        Returns:
+            NeighborGraph with haversine distances in kilometres
+        """
+        radius_km = self.cell_km if radius_km is None else float(radius_km)
+        if radius_km > self.cell_km:
+            raise ValueError(f"radius_km={radius_km} exceeds the index cell size {self.cell_km}")
+
+        lat, lon = self.coords[:, 0], self.coords[:, 1]
+        row_parts, col_parts, dist_parts = [], [], []
+
+        # Walk points in cell order so the neighbor-cell lookups arrive sorted
+        cell_rows, cell_cols = self.cell_rows[self.order], self.cell_cols[self.order]
+        for dr, dc in self._cell_offsets():
+            target = ((cell_rows + dr) * self.n_lon_cells
+                      + np.mod(cell_cols + dc, self.n_lon_cells))
+            pos = np.minimum(np.searchsorted(self.cell_keys, target), self.n_cells - 1)
+            found = self.cell_keys[pos] == target
+            counts = np.where(found, self.cell_counts[pos], 0)
+            starts = self.cell_starts[pos]
+
+            batch_ends = np.searchsorted(np.cumsum(counts),
+                                         np.arange(max_pairs, counts.sum() + max_pairs, max_pairs),
+                                         side="right")
+            batch_start = 0
+            for batch_end in np.unique(np.maximum(batch_ends, 1)):
+                sources = np.arange(batch_start, batch_end)
+                batch_start = batch_end
+                batch_counts = counts[sources]
+                n_pairs = int(batch_counts.sum())
+                if n_pairs == 0:
+                    continue
+                pair_sources = self.order[np.repeat(sources, batch_counts)]
+                offsets = np.arange(n_pairs) - np.repeat(np.cumsum(batch_counts) - batch_counts,
+                                                         batch_counts)
+                pair_targets = self.order[np.repeat(starts[sources], batch_counts) + offsets]
+
+                dist = haversine_distances(lat[pair_sources], lon[pair_sources],
+                                           lat[pair_targets], lon[pair_targets])
+                keep = dist <= radius_km
+                row_parts.append(pair_sources[keep])
+                col_parts.append(pair_targets[keep])
+                dist_parts.append(dist[keep])
+
+        return _assemble_graph(len(self.coords), row_parts, col_parts, dist_parts,
+                               radius_km, "haversine")
+
+
+def _assemble_graph(n_samples: int, row_parts: List[np.ndarray], col_parts: List[np.ndarray],
+                    dist_parts: List[np.ndarray], radius: float, metric: str) -> NeighborGraph:
+    """Sort (row, distance) pairs into a CSR NeighborGraph."""
+    if row_parts:
+        rows = np.concatenate(row_parts)
+        cols = np.concatenate(col_parts)
+        dists = np.concatenate(dist_parts)
+    else:
+        rows = cols = np.empty(0, dtype=np.int64)
+        dists = np.empty(0, dtype=np.float64)
+
+    order = np.argsort(dists, kind="stable")
+    order = order[np.argsort(rows[order], kind="stable")]
+    indptr = np.zeros(n_samples + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_samples), out=indptr[1:])
+    return NeighborGraph(indptr, cols[order], dists[order], radius, metric)
+
+
+def build_neighbor_graph(X: np.ndarray, radius: float, metric: str = "euclidean",
+                         n_jobs: Optional[int] = None) -> NeighborGraph:
+    """
+    Build a sorted neighbor graph bounded by ``radius``.
+
+    Args:
+        X: Feature matrix, or (latitude, longitude) degrees for ``metric="haversine"``
+        radius: Largest eps to be evaluated (kilometres for haversine)
+        metric: "euclidean" or "haversine"
+        n_jobs: Parallel jobs for the scikit-learn neighbor search
+
+    Returns:
+        NeighborGraph covering every point
+    """
+    if metric == "haversine":
+        return GeoGridIndex(X, cell_km=radius).radius_graph(radius)
+    if metric != "euclidean":
+        raise ValueError(f"Unsupported metric '{metric}'; use 'euclidean' or 'haversine'")
+
+    from sklearn.neighbors import NearestNeighbors  # pylint: disable=import-outside-toplevel
+
+    X = np.asarray(X, dtype=np.float64)
+    nbrs = NearestNeighbors(radius=radius, n_jobs=n_jobs).fit(X)
+    distances, indices = nbrs.radius_neighbors(X, sort_results=True)
+
+    indptr = np.zeros(len(X) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in indices], out=indptr[1:])
+    flat_indices = np.concatenate(indices) if len(X) else np.empty(0, dtype=np.int64)
+    flat_distances = np.concatenate(distances) if len(X) else np.empty(0)
+    return NeighborGraph(indptr, flat_indices, flat_distances, radius, metric)
+
+
+def dbscan_from_graph(graph: NeighborGraph, eps: float, min_samples: int) -> np.ndarray:
+    """
+    Run DBSCAN on a precomputed neighbor graph.
+
+    Labels match ``sklearn.cluster.DBSCAN(eps, min_samples)`` on the same
+    distances: clusters are numbered by their lowest-index core point and
+    border points join the lowest-numbered adjacent cluster.
+
+    Args:
+        graph: Neighbor graph built with ``radius >= eps``
+        eps: Neighborhood radius
+        min_samples: Minimum neighborhood size (including the point) for a core point
+
+    Returns:
+        Array of cluster labels, with -1 for noise
+    """
+    from scipy.sparse import csr_matrix  # pylint: disable=import-outside-toplevel
+    from scipy.sparse.csgraph import connected_components  # pylint: disable=import-outside-toplevel
+
+    graph._check_eps(eps)  # pylint: disable=protected-access
+    n_samples = graph.n_samples
+    rows, cols = graph._rows, graph.indices  # pylint: disable=protected-access
+    within = graph.distances <= eps
+    core = np.bincount(rows[within], minlength=n_samples) >= min_samples
+
+    labels = np.full(n_samples, -1, dtype=np.int64)
+    core_idx = np.flatnonzero(core)
+    if len(core_idx) == 0:
+        return labels
+
+    core_edges = within & core[rows] & core[cols]
+    adjacency = csr_matrix((np.ones(int(core_edges.sum()), dtype=np.int8),
+                            (rows[core_edges], cols[core_edges])),
+                           shape=(n_samples, n_samples))
+    _, components = connected_components(adjacency, directed=False)
+
+    core_components = components[core_idx]
+    unique_components, first_seen = np.unique(core_components, return_index=True)
+    rank = np.empty(components.max() + 1, dtype=np.int64)
+    rank[unique_components[np.argsort(first_seen)]] = np.arange(len(unique_components))
+    labels[core_idx] = rank[core_components]
+
+    border_edges = within & ~core[rows] & core[cols]
+    if border_edges.any():
+        border_labels = np.full(n_samples, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(border_labels, rows[border_edges], labels[cols[border_edges]])
+        assigned = border_labels != np.iinfo(np.int64).max
+        labels[assigned] = border_labels[assigned]
+
+    return labels
+
+
+def dbscan_sweep(X: np.ndarray, eps_values: Iterable[float],
+                 min_samples_values: Iterable[int], metric: str = "euclidean",
+                 graph: Optional[NeighborGraph] = None,
+                 n_jobs: Optional[int] = None) -> Dict[Tuple[float, int], Dict[str, Any]]:
+    """
+    Evaluate a grid of DBSCAN parameters from a single neighbor graph.
+
+    Args:
+        X: Feature matrix, or (latitude, longitude) degrees for ``metric="haversine"``
+        eps_values: Candidate eps values
+        min_samples_values: Candidate min_samples values
+        metric: "euclidean" or "haversine"
+        graph: Previously built graph to reuse (built from ``X`` if omitted)
+        n_jobs: Parallel jobs for the scikit-learn neighbor search
+
+    Returns:
+        Dict mapping (eps, min_samples) to labels, cluster count and noise count
+    """
+    eps_values = [float(eps) for eps in eps_values]
+    min_samples_values = [int(m) for m in min_samples_values]
+    if not eps_values or not min_samples_values:
+        raise ValueError("eps_values and min_samples_values must each contain at least one value")
+    if graph is None:
+        graph = build_neighbor_graph(X, max(eps_values), metric=metric, n_jobs=n_jobs)
+
+    results = {}
+    for eps in eps_values:
+        for min_samples in min_samples_values:
+            labels = dbscan_from_graph(graph, eps, min_samples)
+            results[(eps, min_samples)] = {
+                "labels": labels,
+                "n_clusters": int(labels.max() + 1) if len(labels) else 0,
+                "n_noise": int(np.sum(labels == -1)),
+            }
+    return results
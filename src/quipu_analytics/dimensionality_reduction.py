@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Out-of-Core Principal Component Analysis
+
+This module fits PCA on feature matrices that do not fit in memory by
+streaming row chunks from arrays, memory-mapped ``.npy`` files, CSV files or
+chunk generators. Two solvers are available:
+
+- ``incremental``: scikit-learn ``IncrementalPCA`` fed one chunk at a time.
+- ``randomized``: randomized subspace iteration that only keeps
+  (n_features x (n_components + oversampling)) matrices in memory; the
+  oversampling and power-iteration settings trade passes over the data for
+  accuracy.
+
+Standardization (the notebooks' ``StandardScaler`` step), explained
+variance, loadings and projections are all computed chunk by chunk.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+ChunkSource = Union[str, os.PathLike, np.ndarray, pd.DataFrame,
+                    Callable[[], Iterable[np.ndarray]]]
+
+
+def iter_chunks(source: ChunkSource, chunk_size: int = 100_000,
+                columns: Optional[Sequence[str]] = None) -> Iterator[np.ndarray]:
+    """
+    Yield float64 row chunks from an in-memory or on-disk source.
+
+    Args:
+        source: Array or memmap, DataFrame, path to a ``.npy`` or CSV file, or a
+            zero-argument callable returning a fresh iterable of chunks
+            (callables let multi-pass solvers re-read generated data)
+        chunk_size: Rows per chunk for arrays and files
+        columns: Columns to read from CSV files or DataFrames
+
+    Yields:
+        2-D float64 arrays of at most ``chunk_size`` rows
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = Path(source)
+        if path.suffix == ".npy":
+            source = np.load(path, mmap_mode="r")
+        else:
+            for frame in pd.read_csv(path, chunksize=chunk_size, usecols=columns):
+                yield frame.to_numpy(dtype=np.float64)
+            return
+
+    if isinstance(source, pd.DataFrame):
+        frame = source if columns is None else source[list(columns)]
+        for start in range(0, len(frame), chunk_size):
+            yield frame.iloc[start:start + chunk_size].to_numpy(dtype=np.float64)
+    elif hasattr(source, "shape"):
+        for start in range(0, source.shape[0], chunk_size):
+            yield np.asarray(source[start:start + chunk_size], dtype=np.float64)
+    elif callable(source):
+        for chunk in source():
+            yield np.atleast_2d(np.asarray(chunk, dtype=np.float64))
+    else:
+        raise TypeError("source must be an array, DataFrame, file path or chunk factory")
+
+
+def _rebatch(chunks: Iterable[np.ndarray], min_rows: int) -> Iterator[np.ndarray]:
+    """Merge chunks shorter than ``min_rows`` into a neighbor."""
+    pending = None
+    for chunk in chunks:
+        if pending is None:
+            pending = chunk
+        elif len(pending) < min_rows or len(chunk) < min_rows:
+            pending = np.vstack([pending, chunk])
+        else:
+            yield pending
+            pending = chunk
+    if pending is not None:
+        yield pending
+
+
+class StreamingPCA:
+    """
+    PCA fitted and applied chunk by chunk.
+
+    Args:
+        n_components: Number of components to keep
+        method: "incremental" or "randomized"
+        standardize: Scale features to unit variance before PCA, like
+            ``StandardScaler`` followed by ``PCA``
+        chunk_size: Rows per chunk when reading arrays and files
+        oversampling: Extra random directions for the randomized solver
+        n_power_iterations: Subspace iterations for the randomized solver;
+            each one costs a pass over the data and sharpens the components
+        random_state: Seed for the randomized solver
+
+    Attributes:
+        mean_, scale_: Per-feature location and scale applied before projection
+        components_: Array of shape (n_components, n_features)
+        explained_variance_, explained_variance_ratio_: Per-component variance
+        n_samples_seen_: Rows processed during fit
+        n_passes_: Passes over the data made during fit
+    """
+
+    def __init__(self, n_components: int = 10, method: str = "incremental",
+                 standardize: bool = True, chunk_size: int = 100_000,
+                 oversampling: int = 10, n_power_iterations: int = 2,
+                 random_state: int = 42):
+        if method not in ("incremental", "randomized"):
+            raise ValueError(f"Unsupported method '{method}'; use 'incremental' or 'randomized'")
+        self.n_components = n_components
+        self.method = method
+        self.standardize = standardize
+        self.chunk_size = chunk_size
+        self.oversampling = oversampling
+        self.n_power_iterations = n_power_iterations
+        self.random_state = random_state
+
+    def _chunks(self, source: ChunkSource, columns: Optional[Sequence[str]]) -> Iterator[np.ndarray]:
+        return iter_chunks(source, self.chunk_size, columns)
+
+    def _scaled(self, chunk: np.ndarray) -> np.ndarray:
+        return (chunk - self.mean_) / self.scale_
+
+    def _fit_moments(self, source: ChunkSource, columns: Optional[Sequence[str]]) -> None:
+        """First pass: per-feature mean and variance merged across chunks."""
+        count, mean, m2 = 0, None, None
+        for chunk in self._chunks(source, columns):
+            n_chunk = len(chunk)
+            if n_chunk == 0:
+                continue
+            chunk_mean = chunk.mean(axis=0)
+            chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+            if mean is None:
+                count, mean, m2 = n_chunk, chunk_mean, chunk_m2
+                continue
+            total = count + n_chunk
+            delta = chunk_mean - mean
+            mean = mean + delta * n_chunk / total
+            m2 = m2 + chunk_m2 + delta ** 2 * count * n_chunk / total
+            count = total
+        if mean is None or count < 2:
+            raise ValueError("At least two rows are required to fit PCA")
+
+        variance = m2 / (count - 1)
+        self.n_samples_seen_ = count
+        self.mean_ = mean
+        if self.standardize:
+            scale = np.sqrt(m2 / count)
+            self.scale_ = np.where(scale > 0, scale, 1.0)
+        else:
+            self.scale_ = np.ones_like(mean)
+        self.total_variance_ = float((variance / self.scale_ ** 2).sum())
+
+    def _fit_incremental(self, source: ChunkSource, columns: Optional[Sequence[str]]) -> None:
+        from sklearn.decomposition import IncrementalPCA  # pylint: disable=import-outside-toplevel
+
+        model = IncrementalPCA(n_components=self.n_components)
+        scaled = (self._scaled(chunk) for chunk in self._chunks(source, columns))
+        for chunk in _rebatch(scaled, self.n_components):
+            model.partial_fit(chunk)
+        self.n_passes_ += 1
+        self.components_ = model.components_
+        self.explained_variance_ = model.explained_variance_
+        self.singular_values_ = model.singular_values_
+
+    def _gram_apply(self, source: ChunkSource, columns: Optional[Sequence[str]],
+                    basis: np.ndarray) -> np.ndarray:
+        """One pass computing (A^T A) @ basis for the scaled, centered data A."""
+        product = np.zeros_like(basis)
+        for chunk in self._chunks(source, columns):
+            scaled = self._scaled(chunk)
+            product += scaled.T @ (scaled @ basis)
+        self.n_passes_ += 1
+        return product
+
+    def _fit_randomized(self, source: ChunkSource, columns: Optional[Sequence[str]]) -> None:
+        n_features = len(self.mean_)
+        rank = min(self.n_components + self.oversampling, n_features)
+        rng = np.random.default_rng(self.random_state)
+        basis, _ = np.linalg.qr(rng.standard_normal((n_features, rank)))
+
+        for _ in range(self.n_power_iterations + 1):
+            basis, _ = np.linalg.qr(self._gram_apply(source, columns, basis))
+
+        # Rayleigh-Ritz: eigen-decompose A^T A restricted to the basis
+        projected_gram = basis.T @ self._gram_apply(source, columns, basis)
+        eigenvalues, eigenvectors = np.linalg.eigh((projected_gram + projected_gram.T) / 2.0)
+        order = np.argsort(eigenvalues)[::-1][:self.n_components]
+        eigenvalues = np.maximum(eigenvalues[order], 0.0)
+        self.components_ = (basis @ eigenvectors[:, order]).T
+        self.explained_variance_ = eigenvalues / (self.n_samples_seen_ - 1)
+        self.singular_values_ = np.sqrt(eigenvalues)
+
+    def fit(self, source: ChunkSource, columns: Optional[Sequence[str]] = None) -> "StreamingPCA":
+        """
+        Fit the components from a chunked source.
+
+        Args:
+            source: See ``iter_chunks``; generator-based sources must be passed as
+                a callable because the solvers make several passes
+            columns: Columns to read from CSV files or DataFrames
+
+        Returns:
+            The fitted instance
+        """
+        self.n_passes_ = 1
+        self._fit_moments(source, columns)
+        if self.method == "incremental":
+            self._fit_incremental(source, columns)
+        else:
+            self._fit_randomized(source, columns)
+
+        # Deterministic signs: largest absolute loading of each component is positive
+        signs = np.sign(self.components_[np.arange(len(self.components_)),
+                                         np.abs(self.components_).argmax(axis=1)])
+        self.components_ = self.components_ * signs[:, None]
+        self.explained_variance_ratio_ = self.explained_variance_ / self.total_variance_
+        return self
+
+    def transform(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Project a single chunk onto the fitted components.
+
+        Args:
+            chunk: Array of shape (n_rows, n_features)
+
+        Returns:
+            Array of shape (n_rows, n_components)
+        """
+        return self._scaled(np.asarray(chunk, dtype=np.float64)) @ self.components_.T
+
+    def transform_chunks(self, source: ChunkSource,
+                         columns: Optional[Sequence[str]] = None) -> Iterator[np.ndarray]:
+        """
+        Lazily project every chunk of a source.
+
+        Args:
+            source: See ``iter_chunks``
+            columns: Columns to read from CSV files or DataFrames
+
+        Yields:
+            Projected chunks of shape (n_rows, n_components)
+        """
+        for chunk in self._chunks(source, columns):
+            yield self.transform(chunk)
+
+    def transform_to_npy(self, source: ChunkSource, output_path: str,
+                         columns: Optional[Sequence[str]] = None,
+                         n_rows: Optional[int] = None) -> str:
+        """
+        Stream projections into a memory-mapped ``.npy`` file.
+
+        Args:
+            source: See ``iter_chunks``
+            output_path: Destination ``.npy`` path
+            columns: Columns to read from CSV files or DataFrames
+            n_rows: Total rows in ``source`` (defaults to the rows seen during fit)
+
+        Returns:
+            Path to the written file
+        """
+        n_rows = self.n_samples_seen_ if n_rows is None else n_rows
+        output = np.lib.format.open_memmap(output_path, mode="w+", dtype=np.float64,
+                                           shape=(n_rows, len(self.components_)))
+        position = 0
+        for projected in self.transform_chunks(source, columns):
+            output[position:position + len(projected)] = projected
+            position += len(projected)
+        output.flush()
+        if position != n_rows:
+            raise ValueError(f"Source produced {position} rows, expected {n_rows}")
+        return str(output_path)
+
+    def loadings(self, feature_names: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Component loadings as a features x components frame.
+
+        Args:
+            feature_names: Optional feature labels for the index
+
+        Returns:
+            DataFrame with one ``PC{i}`` column per component
+        """
+        return pd.DataFrame(self.components_.T, index=feature_names,
+                            columns=[f"PC{i + 1}" for i in range(len(self.components_))])
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Fit diagnostics in the shape of the notebook's component-selection output.
+
+        Returns:
+            Dict with explained variance ratios, cumulative variance and passes made
+        """
+        cumulative = np.cumsum(self.explained_variance_ratio_)
+        return {
+            "method": self.method,
+            "n_samples_seen": int(self.n_samples_seen_),
+            "n_passes": self.n_passes_,
+            "explained_variance_ratio": self.explained_variance_ratio_.tolist(),
+            "cumulative_variance": cumulative.tolist(),
+        }
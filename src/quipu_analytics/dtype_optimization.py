@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+DataFrame Dtype Optimization and Memory Reporting
+
+This module shrinks DataFrames loaded with default pandas dtypes. Integer
+columns are downcast to the smallest signed type that holds their range,
+float columns are downcast only when it is lossless (or when explicitly
+allowed), low-cardinality string columns such as ``gender``, ``country``,
+``Weekday`` or ``Month_name`` become categoricals, and date or time-of-day
+columns are parsed into ``datetime64`` (a ``Time`` column next to a ``Date``
+column becomes a full timestamp). Every optimization returns a deep
+before/after memory report, and ``load_dataset`` can apply it automatically
+whenever the suite's datasets are loaded.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .precision import as_precision
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+_TIME_OF_DAY = re.compile(r"^\d{1,2}:\d{2}(:\d{2}(\.\d+)?)?$")
+_AUTO_OPTIMIZE = os.environ.get("QUIPU_AUTO_OPTIMIZE", "0") == "1"
+
+
+def set_auto_optimize(enabled: bool = True) -> None:
+    """
+    Apply ``optimize_dtypes`` in every ``load_dataset`` call by default.
+
+    The initial value comes from the ``QUIPU_AUTO_OPTIMIZE=1`` environment variable.
+
+    Args:
+        enabled: Whether loads are optimized automatically
+    """
+    global _AUTO_OPTIMIZE  # pylint: disable=global-statement
+    _AUTO_OPTIMIZE = enabled
+
+
+def _is_text(series: pd.Series) -> bool:
+    return (pd.api.types.is_object_dtype(series.dtype)
+            or pd.api.types.is_string_dtype(series.dtype)) and \
+        not isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def _sample(series: pd.Series, size: int = 1000) -> pd.Series:
+    values = series.dropna()
+    return values if len(values) <= size else values.sample(size, random_state=0)
+
+
+def _looks_like_date(series: pd.Series, name: str) -> bool:
+    if not re.search(r"date|timestamp", name, re.IGNORECASE):
+        return False
+    sample = _sample(series)
+    parsed = pd.to_datetime(sample, errors="coerce", format="ISO8601")
+    return len(sample) > 0 and parsed.notna().all()
+
+
+def _looks_like_time(series: pd.Series) -> bool:
+    sample = _sample(series).astype(str)
+    return len(sample) > 0 and sample.str.match(_TIME_OF_DAY).all()
+
+
+def analyze_dtypes(df: pd.DataFrame, category_threshold: float = 0.5,
+                   max_categories: int = 10_000, allow_float32: bool = False,
+                   date_columns: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Propose a compact dtype for every column from its value range and cardinality.
+
+    Args:
+        df: DataFrame to analyze
+        category_threshold: Largest unique-to-rows ratio converted to category
+        max_categories: Largest number of categories converted to category
+        allow_float32: Downcast floats to float32 even when it loses precision
+        date_columns: Columns to parse as dates (auto-detected by name if omitted)
+
+    Returns:
+        Dict mapping column names to ``{"from", "to", "reason"}``; columns
+        that keep their dtype are omitted
+    """
+    plan: Dict[str, Dict[str, Any]] = {}
+    date_like = set(date_columns) if date_columns is not None else {
+        column for column in df.columns if _is_text(df[column]) and
+        _looks_like_date(df[column], str(column))}
+    for column in date_like:
+        plan[column] = {"from": str(df[column].dtype), "to": "datetime64",
+                        "reason": "date strings"}
+
+    for column in df.columns:
+        if column in plan:
+            continue
+        series = df[column]
+        dtype = series.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            if len(series) == 0:
+                continue
+            low, high = series.min(), series.max()
+            for candidate in (np.int8, np.int16, np.int32):
+                info = np.iinfo(candidate)
+                if info.min <= low and high <= info.max:
+                    if np.dtype(candidate).itemsize < dtype.itemsize:
+                        plan[column] = {"from": str(dtype), "to": np.dtype(candidate).name,
+                                        "reason": f"range [{low}, {high}]"}
+                    break
+        elif pd.api.types.is_float_dtype(dtype) and dtype.itemsize > 4:
+            as_float32 = series.to_numpy().astype(np.float32)
+            lossless = np.array_equal(as_float32.astype(dtype), series.to_numpy(), equal_nan=True)
+            if allow_float32 or lossless:
+                plan[column] = {"from": str(dtype), "to": "float32",
+                                "reason": "lossless" if lossless else "float32 allowed"}
+        elif _is_text(series):
+            if _looks_like_time(series):
+                date_partner = next((c for c in date_like
+                                     if str(c).lower().replace("date", "") ==
+                                     str(column).lower().replace("time", "")), None)
+                plan[column] = {"from": str(dtype),
+                                "to": "datetime64" if date_partner is not None
+                                else "timedelta64",
+                                "reason": "time of day",
+                                "date_column": date_partner}
+                continue
+            n_unique = series.nunique(dropna=True)
+            if n_unique <= max_categories and n_unique <= category_threshold * max(len(series), 1):
+                plan[column] = {"from": str(dtype), "to": "category",
+                                "reason": f"{n_unique} unique of {len(series)}"}
+    return plan
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Deep memory usage of two versions of a DataFrame.
+
+    Args:
+        before: Original DataFrame
+        after: Optimized DataFrame
+
+    Returns:
+        Dict with per-column ``columns`` (bytes before/after and dtypes) and
+        ``total_before``, ``total_after`` and ``reduction_pct``
+    """
+    usage_before = before.memory_usage(deep=True, index=False)
+    usage_after = after.memory_usage(deep=True, index=False)
+    columns = {
+        column: {
+            "dtype_before": str(before[column].dtype),
+            "dtype_after": str(after[column].dtype),
+            "bytes_before": int(usage_before[column]),
+            "bytes_after": int(usage_after[column]),
+        }
+        for column in before.columns if column in after.columns
+    }
+    total_before, total_after = int(usage_before.sum()), int(usage_after.sum())
+    return {
+        "columns": columns,
+        "total_before": total_before,
+        "total_after": total_after,
+        "reduction_pct": 100.0 * (1.0 - total_after / total_before) if total_before else 0.0,
+    }
+
+
+def optimize_dtypes(df: pd.DataFrame, category_threshold: float = 0.5,
+                    max_categories: int = 10_000, allow_float32: bool = False,
+                    date_columns: Optional[Sequence[str]] = None
+                    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Apply the ``analyze_dtypes`` plan and report the memory saved.
+
+    Args:
+        df: DataFrame to optimize (not modified)
+        category_threshold: Largest unique-to-rows ratio converted to category
+        max_categories: Largest number of categories converted to category
+        allow_float32: Downcast floats to float32 even when it loses precision
+        date_columns: Columns to parse as dates (auto-detected by name if omitted)
+
+    Returns:
+        Tuple of (optimized DataFrame, memory report with the applied ``plan``)
+    """
+    plan = analyze_dtypes(df, category_threshold, max_categories, allow_float32, date_columns)
+    optimized = df.copy()
+    for column, step in plan.items():
+        target = step["to"]
+        if step["reason"] == "time of day":
+            offsets = pd.to_timedelta(df[column].astype(str))
+            if step["date_column"] is not None:
+                optimized[column] = pd.to_datetime(df[step["date_column"]],
+                                                   format="ISO8601") + offsets
+            else:
+                optimized[column] = offsets
+        elif target == "datetime64":
+            optimized[column] = pd.to_datetime(df[column], format="ISO8601")
+        else:
+            optimized[column] = df[column].astype(target)
+    report = memory_report(df, optimized)
+    report["plan"] = plan
+    return optimized, report
+
+
+def load_dataset(source: Union[str, os.PathLike], optimize: Optional[bool] = None,
+                 sep: str = "\t", **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Load a suite dataset, optimizing dtypes when requested or enabled globally.
+
+    Float columns follow the ``precision`` policy (``set_precision``).
+
+    Args:
+        source: Path to a CSV file, or a file name inside ``./data`` or the
+            repository's ``data/`` directory
+        optimize: Apply ``optimize_dtypes`` (defaults to ``set_auto_optimize``)
+        sep: Field separator (the bundled datasets are tab-separated)
+        **read_csv_kwargs: Extra arguments for ``pd.read_csv``
+
+    Returns:
+        Loaded DataFrame; when optimized, its memory report is stored in
+        ``df.attrs["memory_report"]``
+    """
+    path = Path(source)
+    if not path.exists():
+        path = next((directory / path for directory in (Path("data"), DATA_DIR)
+                     if (directory / path).exists()), path)
+    df = as_precision(pd.read_csv(path, sep=sep, **read_csv_kwargs))
+    if optimize is None:
+        optimize = _AUTO_OPTIMIZE
+    if optimize:
+        df, report = optimize_dtypes(df)
+        df.attrs["memory_report"] = report
+    return df
+
+
+def print_memory_report(report: Dict[str, Any], name: str = "DataFrame") -> None:
+    """
+    Print the output of ``memory_report`` or ``optimize_dtypes``.
+
+    Args:
+        report: Memory report
+        name: Label for the DataFrame
+    """
+    print(f"\n💾 MEMORY FOOTPRINT: {name}")
+    print("-" * 50)
+    for column, entry in report["columns"].items():
+        if entry["dtype_before"] != entry["dtype_after"]:
+            print(f"   {column:<24} {entry['dtype_before']:>10} -> {entry['dtype_after']:<16} "
+                  f"{entry['bytes_before'] / 1024:9.1f} KB -> "
+                  f"{entry['bytes_after'] / 1024:9.1f} KB")
+    print(f"✅ Total: {report['total_before'] / 1e6:.2f} MB -> "
+          f"{report['total_after'] / 1e6:.2f} MB ({report['reduction_pct']:.1f}% smaller)")
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Cached Environment Fingerprint and Run-to-Run Diffing
+
+This module captures the parts of the runtime environment that influence
+performance and results: operating system and CPU details, BLAS/OpenMP
+libraries and their thread counts, threading environment variables and the
+versions of every installed distribution (from ``importlib.metadata``). The
+fingerprint is computed once per process, hashed per section and overall to
+stable digests, and ``diff_fingerprints`` pinpoints which libraries or
+thread settings changed between two runs.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import copy
+import hashlib
+import importlib
+import json
+import os
+import platform
+import sys
+from importlib import metadata as importlib_metadata
+from typing import Any, Dict, List, Optional
+
+THREAD_VARIABLES = (
+    "OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS", "NUMBA_NUM_THREADS",
+)
+SECTIONS = ("os", "cpu", "python", "threads", "packages")
+# Extension modules that load the suite's BLAS and OpenMP runtimes; they are
+# imported first so the reported libraries do not depend on import order
+NATIVE_RUNTIME_MODULES = ("numpy", "scipy.linalg", "sklearn.utils._openmp_helpers")
+
+_CACHE: Optional[Dict[str, Any]] = None
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def _blas_libraries() -> List[Dict[str, Any]]:
+    """BLAS/OpenMP libraries of numpy, scipy and scikit-learn with their thread counts."""
+    try:
+        from threadpoolctl import threadpool_info  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return []
+    for module in NATIVE_RUNTIME_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+    keys = ("user_api", "internal_api", "version", "num_threads", "threading_layer",
+            "architecture", "filepath")
+    libraries = [{key: info.get(key) for key in keys if key in info}
+                 for info in threadpool_info()]
+    return sorted(libraries, key=lambda info: (info.get("user_api") or "",
+                                               info.get("internal_api") or "",
+                                               info.get("filepath") or ""))
+
+
+def _package_versions() -> Dict[str, str]:
+    versions = {}
+    for distribution in importlib_metadata.distributions():
+        name = distribution.metadata["Name"]
+        if name:
+            versions[name.lower().replace("_", "-")] = distribution.version
+    return dict(sorted(versions.items()))
+
+
+def _collect() -> Dict[str, Any]:
+    affinity = (len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity")
+                else os.cpu_count())
+    sections = {
+        "os": {
+            "system": platform.system(),
+            "release": platform.release(),
+            "version": platform.version(),
+            "libc": " ".join(platform.libc_ver()).strip(),
+        },
+        "cpu": {
+            "machine": platform.machine(),
+            "model": _cpu_model(),
+            "logical_cores": os.cpu_count(),
+            "available_cores": affinity,
+        },
+        "python": {
+            "implementation": platform.python_implementation(),
+            "version": platform.python_version(),
+            "compiler": platform.python_compiler(),
+            "executable": sys.executable,
+        },
+        "threads": {
+            "environment": {name: os.environ.get(name) for name in THREAD_VARIABLES},
+            "libraries": _blas_libraries(),
+        },
+        "packages": _package_versions(),
+    }
+    fingerprint = dict(sections)
+    fingerprint["section_digests"] = {name: _digest(sections[name]) for name in SECTIONS}
+    fingerprint["digest"] = _digest(fingerprint["section_digests"])
+    return fingerprint
+
+
+def get_environment_fingerprint(refresh: bool = False) -> Dict[str, Any]:
+    """
+    Environment fingerprint, computed once per process.
+
+    Args:
+        refresh: Recollect instead of returning the cached fingerprint (for
+            example after changing thread limits at runtime)
+
+    Returns:
+        Dict with ``os``, ``cpu``, ``python``, ``threads`` and ``packages``
+        sections, per-section ``section_digests`` and an overall ``digest``
+    """
+    global _CACHE  # pylint: disable=global-statement
+    if _CACHE is None or refresh:
+        _CACHE = _collect()
+    return copy.deepcopy(_CACHE)
+
+
+def _flatten(value: Any, prefix: str = "") -> Dict[str, Any]:
+    if isinstance(value, dict):
+        flat = {}
+        for key, item in value.items():
+            flat.update(_flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+        return flat
+    if isinstance(value, list):
+        flat = {}
+        for index, item in enumerate(value):
+            label = None
+            if isinstance(item, dict) and (item.get("internal_api") or item.get("user_api")):
+                # Several copies of one runtime can be loaded, so the file tells them apart
+                label = item.get("internal_api") or item.get("user_api")
+                if item.get("filepath"):
+                    label = f"{label}:{os.path.basename(item['filepath'])}"
+            flat.update(_flatten(item, f"{prefix}[{label or index}]"))
+        return flat
+    return {prefix: value}
+
+
+def diff_fingerprints(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compare two fingerprints section by section.
+
+    Sections whose digests match are skipped without inspection.
+
+    Args:
+        old: Earlier fingerprint (e.g. from a saved execution log)
+        new: Later fingerprint
+
+    Returns:
+        Dict with ``identical`` and, per changed section, the differences:
+        ``packages`` as ``added``/``removed``/``changed`` maps, other sections
+        as ``{setting: [old, new]}``
+    """
+    old_digests, new_digests = old.get("section_digests", {}), new.get("section_digests", {})
+    diff: Dict[str, Any] = {"identical": old.get("digest") == new.get("digest")}
+    for section in SECTIONS:
+        if old_digests.get(section) is not None and \
+                old_digests.get(section) == new_digests.get(section):
+            continue
+        before, after = old.get(section, {}), new.get(section, {})
+        if section == "packages":
+            changes = {
+                "added": {name: after[name] for name in sorted(set(after) - set(before))},
+                "removed": {name: before[name] for name in sorted(set(before) - set(after))},
+                "changed": {name: [before[name], after[name]]
+                            for name in sorted(set(before) & set(after))
+                            if before[name] != after[name]},
+            }
+            if any(changes.values()):
+                diff[section] = changes
+        else:
+            flat_before, flat_after = _flatten(before), _flatten(after)
+            changes = {key: [flat_before.get(key), flat_after.get(key)]
+                       for key in sorted(set(flat_before) | set(flat_after))
+                       if flat_before.get(key) != flat_after.get(key)}
+            if changes:
+                diff[section] = changes
+    return diff
+
+
+def print_environment_diff(diff: Dict[str, Any]) -> None:
+    """
+    Print the output of ``diff_fingerprints``.
+
+    Args:
+        diff: Fingerprint difference
+    """
+    print("\n🧬 ENVIRONMENT DIFF")
+    print("-" * 50)
+    if diff["identical"]:
+        print("✅ Environments are identical")
+        return
+    packages = diff.get("packages", {})
+    for name, (before, after) in packages.get("changed", {}).items():
+        print(f"   📦 {name}: {before} -> {after}")
+    for name, version in packages.get("added", {}).items():
+        print(f"   ➕ {name} {version}")
+    for name, version in packages.get("removed", {}).items():
+        print(f"   ➖ {name} {version}")
+    for section in SECTIONS[:-1]:
+        for key, (before, after) in diff.get(section, {}).items():
+            print(f"   ⚙️ {section}.{key}: {before} -> {after}")
@@ -12,28 +12,32 @@ Date: 2025-10-02
 Version: v1.3
 """
 
+import collections
+import contextlib
+import copy
 import datetime
+import functools
 import getpass
 import platform
+import threading
+import time
 import uuid
 import sys
 import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import hashlib
 
+from .content_hashing import fingerprint_paths
+from .environment_fingerprint import get_environment_fingerprint
 
-def get_execution_metadata() -> Dict[str, Any]:
-    """
-    Capture comprehensive execution environment metadata.
 
-    Returns:
-        Dict containing execution environment information
-    """
+@functools.lru_cache(maxsize=None)
+def _static_metadata() -> Dict[str, Any]:
+    """User, system and interpreter details, collected once per process."""
     return {
-        "execution_id": str(uuid.uuid4()),
-        "timestamp": datetime.datetime.now().isoformat(),
         "user": getpass.getuser(),
         "system": {
             "node": platform.node(),
@@ -51,14 +55,40 @@ def get_execution_metadata() -> Dict[str, Any]:
                 "micro": sys.version_info.micro
             }
         },
+        "environment_variables": {
+            key: os.environ.get(key, "Not set")
+            for key in ["VIRTUAL_ENV", "CONDA_DEFAULT_ENV", "PATH"]
+        }
+    }
+
+
+def get_execution_metadata() -> Dict[str, Any]:
+    """
+    Capture comprehensive execution environment metadata.
+
+    Process-level details are collected once and reused; the full environment
+    fingerprint is available from ``get_environment_fingerprint()``.
+
+    Returns:
+        Dict containing execution environment information
+    """
+    # precision pulls in numpy/pandas, so it is only imported once metadata is needed
+    from .precision import get_precision  # pylint: disable=import-outside-toplevel
+
+    static = copy.deepcopy(_static_metadata())
+    return {
+        "execution_id": str(uuid.uuid4()),
+        "timestamp": datetime.datetime.now().isoformat(),
+        "user": static["user"],
+        "system": static["system"],
+        "python": static["python"],
         "environment": {
             "working_directory": os.getcwd(),
             "python_path": sys.path[:3], # First 3 paths for brevity
-            "environment_variables": {
-                key: os.environ.get(key, "Not set")
-                for key in ["VIRTUAL_ENV", "CONDA_DEFAULT_ENV", "PATH"]
-            }
-        }
+            "environment_variables": static["environment_variables"]
+        },
+        "environment_digest": get_environment_fingerprint()["digest"],
+        "precision": get_precision().name
     }
 
 
@@ -159,9 +189,11 @@ def log_data_provenance(data_sources: Dict[str, Dict[str, str]]) -> None:
     Args:
         data_sources: Dict mapping dataset names to their metadata
         Format: {"dataset_name": {"source": "URL", "license": "MIT", "version": "1.0"}}
+        An optional "path" entry is hashed and its BLAKE2b digest printed.
     """
     if not data_sources:
         return
+    fingerprints = _source_fingerprints(data_sources)
 
     print("\n📊 DATA PROVENANCE TRACKING")
     print("-" * 50)
@@ -170,9 +202,20 @@ def log_data_provenance(data_sources: Dict[str, Dict[str, str]]) -> None:
         print(f"📈 Dataset: {dataset_name}")
         for key, value in metadata.items():
             print(f"   {key.title()}: {value}")
+        if metadata.get("path") in fingerprints:
+            print(f"   BLAKE2b: {fingerprints[metadata['path']]['blake2b']}")
         print()
 
 
+def _source_fingerprints(data_sources: Dict[str, Dict[str, str]],
+                         data_files: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Content digests of the given files plus any data source "path" entries."""
+    paths = list(data_files or [])
+    paths += [source["path"] for source in data_sources.values()
+              if source.get("path") and Path(source["path"]).exists()]
+    return fingerprint_paths(list(dict.fromkeys(paths)))
+
+
 def validate_reproducibility_requirements() -> Dict[str, bool]:
     """
     Validate that reproducibility requirements are met.
@@ -209,15 +252,23 @@ def validate_reproducibility_requirements() -> Dict[str, bool]:
     return requirements
 
 
-def set_reproducible_environment(seed: int = 42) -> None:
+def set_reproducible_environment(seed: int = 42, precision: Optional[str] = None) -> None:
     """
     Set up reproducible environment with fixed seeds.
 
     Args:
         seed: Random seed to use for reproducibility
+        precision: Optional suite-wide float precision ("float64" or "float32")
     """
     print(f"🎯 Setting reproducible environment (seed={seed})")
 
+    if precision is not None:
+        # pylint: disable=import-outside-toplevel
+        from .precision import get_precision, set_precision
+
+        set_precision(precision)
+        print(f"✅ Float precision set to {get_precision().name}")
+
     # Set Python random seed
     import random
     random.seed(seed)
@@ -247,9 +298,196 @@ def set_reproducible_environment(seed: int = 42) -> None:
         print("⚠️  PyTorch not available - seed not set")
 
 
+# Stage tracing: nested spans recorded into per-thread ring buffers. Each thread
+# appends only to its own deque (bounded, so old spans are overwritten), so the
+# hot path takes no locks; the registry lock is only taken once per thread.
+TRACE_CAPACITY = 10_000
+_trace_local = threading.local()
+_trace_buffers: List[Tuple[threading.Thread, collections.deque]] = []
+_trace_registry_lock = threading.Lock()
+
+
+def _trace_state() -> threading.local:
+    if getattr(_trace_local, "buffer", None) is None:
+        _trace_local.buffer = collections.deque(maxlen=TRACE_CAPACITY)
+        _trace_local.stack = []
+        with _trace_registry_lock:
+            _trace_buffers.append((threading.current_thread(), _trace_local.buffer))
+    return _trace_local
+
+
+class track_stage(contextlib.ContextDecorator):  # pylint: disable=invalid-name
+    """
+    Record a named pipeline stage as a span; usable as ``with`` block or decorator.
+
+    Spans nest: each records its parent stage and depth in the current thread.
+
+    Args:
+        name: Stage name (e.g. "load", "features", "fit", "score")
+        **attrs: JSON-serializable attributes stored with the span
+    """
+
+    def __init__(self, name: str, **attrs: Any):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self) -> "track_stage":
+        _trace_state().stack.append((self.name, time.perf_counter_ns()))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_ns = time.perf_counter_ns()
+        state = _trace_local
+        name, start_ns = state.stack.pop()
+        attrs = self.attrs if exc_type is None else {**self.attrs, "error": exc_type.__name__}
+        state.buffer.append((name, start_ns, end_ns, os.getpid(), threading.get_ident(),
+                             len(state.stack), state.stack[-1][0] if state.stack else None,
+                             attrs))
+        return False
+
+
+def current_stage() -> Optional[str]:
+    """
+    Name of the innermost open stage in the calling thread.
+
+    Returns:
+        Stage name or None
+    """
+    stack = getattr(_trace_local, "stack", None)
+    return stack[-1][0] if stack else None
+
+
+def collect_spans(clear: bool = False) -> List[Dict[str, Any]]:
+    """
+    Completed spans from every thread (and merged worker processes), by start time.
+
+    Args:
+        clear: Empty the buffers after reading
+
+    Returns:
+        List of span dicts with ``name``, ``start_ns``, ``end_ns``,
+        ``duration_ns``, ``pid``, ``tid``, ``depth``, ``parent`` and ``attrs``
+    """
+    with _trace_registry_lock:
+        buffers = [buffer for _, buffer in _trace_buffers]
+        _trace_buffers[:] = [(thread, buffer) for thread, buffer in _trace_buffers
+                             if thread.is_alive() or (buffer and not clear)]
+    records = []
+    for buffer in buffers:
+        records.extend(list(buffer))
+        if clear:
+            buffer.clear()
+    keys = ("name", "start_ns", "end_ns", "pid", "tid", "depth", "parent", "attrs")
+    spans = [dict(zip(keys, record)) for record in sorted(records, key=lambda r: r[1])]
+    for span in spans:
+        span["duration_ns"] = span["end_ns"] - span["start_ns"]
+    return spans
+
+
+def _ingest_spans(spans: List[Dict[str, Any]]) -> None:
+    buffer = _trace_state().buffer
+    for span in spans:
+        buffer.append((span["name"], span["start_ns"], span["end_ns"], span["pid"],
+                       span["tid"], span["depth"], span["parent"], span["attrs"]))
+
+
+def _run_traced(fn: Callable, parent: Optional[str], args: tuple,
+                kwargs: Dict[str, Any]) -> Tuple[Any, List[Dict[str, Any]]]:
+    """Worker-side wrapper: run one task under a span and ship its spans back."""
+    collect_spans(clear=True)
+    name = getattr(fn, "__name__", None) or getattr(getattr(fn, "func", None), "__name__", "task")
+    try:
+        with track_stage(name, parent_stage=parent):
+            result = fn(*args, **kwargs)
+    except BaseException as error:
+        error.quipu_spans = collect_spans(clear=True)
+        raise
+    return result, collect_spans(clear=True)
+
+
+class TracedProcessPoolExecutor(ProcessPoolExecutor):
+    """
+    ``ProcessPoolExecutor`` whose tasks are traced in the workers.
+
+    Each task runs inside a span named after the function, tagged with the
+    submitting thread's current stage; spans recorded in the worker (including
+    nested ``track_stage`` calls) are merged into the parent's buffers.
+    """
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:  # pylint: disable=arguments-differ
+        outer: Future = Future()
+        inner = super().submit(_run_traced, fn, current_stage(), args, kwargs)
+
+        def _forward(done: Future) -> None:
+            if not outer.set_running_or_notify_cancel():
+                return
+            error = done.exception()
+            if error is not None:
+                _ingest_spans(getattr(error, "quipu_spans", []))
+                outer.set_exception(error)
+                return
+            result, spans = done.result()
+            _ingest_spans(spans)
+            outer.set_result(result)
+
+        inner.add_done_callback(_forward)
+        return outer
+
+
+def stage_timings(spans: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Per-stage call counts and total/max wall time.
+
+    Args:
+        spans: Spans from ``collect_spans`` (defaults to the current buffers)
+
+    Returns:
+        Dict mapping stage names to ``count``, ``total_ms`` and ``max_ms``
+    """
+    timings: Dict[str, Dict[str, float]] = {}
+    for span in collect_spans() if spans is None else spans:
+        entry = timings.setdefault(span["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["count"] += 1
+        entry["total_ms"] += span["duration_ns"] / 1e6
+        entry["max_ms"] = max(entry["max_ms"], span["duration_ns"] / 1e6)
+    return timings
+
+
+def export_chrome_trace(path: Optional[str] = None,
+                        spans: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Chrome trace-event JSON (loadable in Perfetto or chrome://tracing).
+
+    Args:
+        path: Optional file to write
+        spans: Spans from ``collect_spans`` (defaults to the current buffers)
+
+    Returns:
+        Trace dictionary with ``traceEvents``
+    """
+    spans = collect_spans() if spans is None else spans
+    events: List[Dict[str, Any]] = []
+    for pid in sorted({span["pid"] for span in spans}):
+        label = "main" if pid == os.getpid() else "worker"
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                       "args": {"name": f"{label} ({pid})"}})
+    for span in spans:
+        events.append({"name": span["name"], "cat": "stage", "ph": "X",
+                       "ts": span["start_ns"] / 1000.0, "dur": span["duration_ns"] / 1000.0,
+                       "pid": span["pid"], "tid": span["tid"],
+                       "args": {**span["attrs"], "parent": span["parent"]}})
+    trace = {"traceEvents": events, "displayTimeUnit": "ns"}
+    if path is not None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, default=str)
+    return trace
+
+
 def generate_execution_summary(metadata: Dict[str, Any],
                                 data_sources: Optional[Dict[str, Dict[str, str]]] = None,
-                                notebook_id: Optional[str] = None) -> Dict[str, Any]:
+                                notebook_id: Optional[str] = None,
+                                data_files: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Generate a comprehensive execution summary for archival.
 
@@ -257,9 +495,14 @@ def generate_execution_summary(metadata: Dict[str, Any],
         metadata: Execution metadata from log_execution_start
         data_sources: Data provenance information
         notebook_id: Unique notebook identifier
+        data_files: Files or directories whose contents are fingerprinted
+            (data source "path" entries are included automatically)
 
     Returns:
-        Complete execution summary
+        Complete execution summary; ``environment_fingerprint`` can be compared
+        across runs with ``diff_fingerprints`` and ``stage_timings`` aggregates
+        the spans recorded by ``track_stage`` (raw spans are exported with
+        ``export_chrome_trace``)
     """
     summary = {
         "execution_summary": {
@@ -267,7 +510,10 @@ def generate_execution_summary(metadata: Dict[str, Any],
             "execution_metadata": metadata,
             "git_provenance": get_git_provenance(),
             "data_sources": data_sources or {},
+            "data_fingerprints": _source_fingerprints(data_sources or {}, data_files),
             "reproducibility_check": validate_reproducibility_requirements(),
+            "environment_fingerprint": get_environment_fingerprint(),
+            "stage_timings": stage_timings(),
             "generated_at": datetime.datetime.now().isoformat()
         }
     }
@@ -311,7 +557,8 @@ def setup_notebook_tracking(notebook_name: str,
                              notebook_id: Optional[str] = None,
                              data_sources: Optional[Dict[str, Dict[str, str]]] = None,
                              seed: int = 42,
-                             save_log: bool = False) -> Dict[str, Any]:
+                             save_log: bool = False,
+                             precision: Optional[str] = None) -> Dict[str, Any]:
     """
     Complete notebook tracking setup - call this at the start of every notebook.
 
@@ -322,12 +569,13 @@ def setup_notebook_tracking(notebook_name: str,
         data_sources: Data source provenance information
         seed: Random seed for reproducibility
         save_log: Whether to save execution log to file
+        precision: Optional suite-wide float precision ("float64" or "float32")
 
     Returns:
         Complete tracking metadata
     """
     # Set up reproducible environment
-    set_reproducible_environment(seed)
+    set_reproducible_environment(seed, precision)
 
     # Log execution start
     metadata = log_execution_start(notebook_name, version)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Incremental Random-Forest Growth with Out-of-Bag Model Selection
+
+This module tunes random forests without ``GridSearchCV`` refits. A forest
+is grown in steps with ``warm_start``. After each step, only the new trees
+are scored on their own out-of-bag rows, which are reconstructed from each
+tree's bootstrap seed as scikit-learn draws them, and their votes are added
+to running OOB predictions. This gives the OOB score curve without
+re-predicting the whole forest. Growth stops when the curve plateaus.
+Depth and feature settings are compared on their plateau OOB scores.
+Candidates can grow concurrently, with the machine's cores split between
+them by ``boosting_harness.thread_budget``.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .boosting_harness import thread_budget
+
+
+def _n_bootstrap(n_samples: int, max_samples: Union[int, float, None]) -> int:
+    if max_samples is None:
+        return n_samples
+    if isinstance(max_samples, (int, np.integer)):
+        return int(max_samples)
+    return max(int(max_samples * n_samples), 1)
+
+
+def _oob_rows(tree: Any, n_samples: int, n_bootstrap: int) -> np.ndarray:
+    """Rows left out of a tree's bootstrap sample (same draw as scikit-learn's)."""
+    sampled = np.random.RandomState(tree.random_state).randint(0, n_samples, n_bootstrap)
+    return np.flatnonzero(np.bincount(sampled, minlength=n_samples) == 0)
+
+
+def _oob_votes(tree: Any, X: np.ndarray, n_bootstrap: int, classifier: bool
+               ) -> Tuple[np.ndarray, np.ndarray]:
+    rows = _oob_rows(tree, len(X), n_bootstrap)
+    if not len(rows):
+        return rows, np.empty(0)
+    votes = tree.predict_proba(X[rows]) if classifier else tree.predict(X[rows])
+    return rows, votes
+
+
+def grow_forest(estimator: Any, X: Any, y: Any, step: int = 25, max_estimators: int = 500,
+                patience: int = 2, tol: float = 1e-3, n_jobs: Optional[int] = None
+                ) -> Tuple[Any, pd.DataFrame]:
+    """
+    Grow a forest until its out-of-bag score stops improving.
+
+    The OOB score at each size is computed on the rows that at least one
+    tree has left out, so it equals ``oob_score_`` once every row is covered.
+
+    Args:
+        estimator: Unfitted ``RandomForest*`` or ``ExtraTrees*`` with ``bootstrap=True``
+        X: Features
+        y: Target (one column)
+        step: Trees added per step
+        max_estimators: Upper bound on the forest size
+        patience: Steps without an improvement above ``tol`` before stopping
+        tol: Minimum OOB improvement that resets the patience counter
+        n_jobs: Threads for tree building and OOB scoring (all usable CPUs by default)
+
+    Returns:
+        (fitted forest, OOB curve with n_estimators, oob_score and seconds per step)
+    """
+    # pylint: disable=import-outside-toplevel
+    from sklearn.base import clone, is_classifier
+
+    forest = clone(estimator)
+    if not forest.get_params().get("bootstrap", False):
+        raise ValueError("OOB estimates need bootstrap=True")
+    n_jobs = n_jobs or thread_budget()
+    forest.set_params(warm_start=True, oob_score=False, n_jobs=n_jobs)
+    y = np.asarray(y)
+    if y.ndim != 1:
+        raise ValueError("grow_forest supports a single target column")
+    X_float = np.ascontiguousarray(X, dtype=np.float32)
+    classifier = is_classifier(forest)
+    n_bootstrap = _n_bootstrap(len(y), forest.max_samples)
+
+    totals: Optional[np.ndarray] = None
+    counts = np.zeros(len(y))
+    curve: List[Dict[str, float]] = []
+    best, stale = -np.inf, 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        while not curve or curve[-1]["n_estimators"] < max_estimators:
+            grown = len(getattr(forest, "estimators_", []))
+            forest.set_params(n_estimators=min(grown + step, max_estimators)).fit(X, y)
+            if totals is None:
+                totals = np.zeros((len(y), len(forest.classes_)) if classifier else len(y))
+                target = np.searchsorted(forest.classes_, y) if classifier else y
+            new_trees = forest.estimators_[grown:]
+            for rows, votes in pool.map(_oob_votes, new_trees, [X_float] * len(new_trees),
+                                        [n_bootstrap] * len(new_trees),
+                                        [classifier] * len(new_trees)):
+                totals[rows] += votes
+                counts[rows] += 1
+
+            covered = counts > 0
+            if classifier:
+                score = float(np.mean(totals[covered].argmax(axis=1) == target[covered]))
+            else:
+                residual = np.sum((target[covered] - totals[covered] / counts[covered]) ** 2)
+                total = np.sum((target[covered] - target[covered].mean()) ** 2)
+                score = float(1.0 - residual / total) if total else 0.0
+            curve.append({"n_estimators": len(forest.estimators_), "oob_score": score,
+                          "seconds": time.perf_counter() - start})
+            if score > best + tol:
+                best, stale = score, 0
+            else:
+                stale += 1
+                if stale >= patience:
+                    break
+    return forest, pd.DataFrame(curve)
+
+
+class OOBForestSearch:
+    """
+    Forest hyperparameter search on plateau OOB scores instead of k-fold refits.
+
+    Args:
+        estimator: Unfitted ``RandomForest*`` or ``ExtraTrees*`` with ``bootstrap=True``
+        param_grid: Tree settings to compare (``max_depth``, ``max_features``, ...)
+        step: Trees added per growth step
+        max_estimators: Upper bound on each forest's size
+        patience: Steps without improvement before a forest stops growing
+        tol: Minimum OOB improvement
+        n_parallel: Candidates grown at the same time
+        total_threads: Threads shared by all candidates (usable CPUs by default)
+    """
+
+    def __init__(self, estimator: Any,
+                 param_grid: Union[Dict[str, Sequence[Any]], List[Dict[str, Sequence[Any]]]],
+                 step: int = 25, max_estimators: int = 500, patience: int = 2,
+                 tol: float = 1e-3, n_parallel: int = 1, total_threads: Optional[int] = None):
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.step = step
+        self.max_estimators = max_estimators
+        self.patience = patience
+        self.tol = tol
+        self.n_parallel = n_parallel
+        self.total_threads = total_threads
+
+    def fit(self, X: Any, y: Any) -> "OOBForestSearch":
+        """
+        Grow one forest per candidate and rank them by OOB score.
+
+        Args:
+            X: Features
+            y: Target
+
+        Returns:
+            The fitted search (``results_``, ``curves_``, ``best_*``)
+        """
+        # pylint: disable=import-outside-toplevel
+        from sklearn.base import clone
+        from sklearn.model_selection import ParameterGrid
+
+        candidates = list(ParameterGrid(self.param_grid))
+        n_parallel = max(1, min(self.n_parallel, len(candidates)))
+        self.n_jobs_ = thread_budget(n_parallel, self.total_threads)
+
+        def _grow(params: Dict[str, Any]) -> Tuple[Any, pd.DataFrame]:
+            return grow_forest(clone(self.estimator).set_params(**params), X, y, self.step,
+                               self.max_estimators, self.patience, self.tol, self.n_jobs_)
+
+        with ThreadPoolExecutor(max_workers=n_parallel) as pool:
+            grown = list(pool.map(_grow, candidates))
+        self.curves_ = [curve for _, curve in grown]
+        results = pd.DataFrame({
+            "params": candidates,
+            "n_estimators": [int(curve["n_estimators"].iloc[-1]) for curve in self.curves_],
+            "oob_score": [float(curve["oob_score"].iloc[-1]) for curve in self.curves_],
+            "seconds": [float(curve["seconds"].iloc[-1]) for curve in self.curves_],
+        })
+        results["rank_oob_score"] = results["oob_score"].rank(
+            ascending=False, method="min").astype(int)
+        self.results_ = results
+        self.best_index_ = int(results["oob_score"].to_numpy().argmax())
+        self.best_params_ = candidates[self.best_index_]
+        self.best_score_ = float(results["oob_score"].iloc[self.best_index_])
+        self.best_estimator_ = grown[self.best_index_][0]
+        return self
+
+    def predict(self, X: Any) -> np.ndarray:
+        """
+        Predict with the best forest.
+
+        Args:
+            X: Features
+
+        Returns:
+            Predictions
+        """
+        return self.best_estimator_.predict(X)
+
+
+def print_forest_report(search: OOBForestSearch, top: int = 5) -> None:
+    """
+    Print the best candidates of a fitted ``OOBForestSearch``.
+
+    Args:
+        search: Fitted search
+        top: Number of candidates to list
+    """
+    print("\n🌲 OOB FOREST SEARCH")
+    print("-" * 50)
+    print(f"{len(search.results_)} candidates, {search.n_jobs_} threads per forest")
+    for _, row in search.results_.sort_values("rank_oob_score").head(top).iterrows():
+        print(f"   #{row['rank_oob_score']} {row['params']}: OOB {row['oob_score']:.4f} "
+              f"with {row['n_estimators']} trees ({row['seconds']:.1f}s)")
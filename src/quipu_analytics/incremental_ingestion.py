@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Tail-Following Incremental Ingestion with Materialized Aggregates
+
+This module keeps the coffee-sales aggregates that the examples recompute
+from scratch (daily revenue and transaction counts, per-``coffee_name``
+counts and revenue, hour-of-day profiles) up to date as the source file is
+appended to. The ingestor remembers the byte offset of the last complete
+line and the row count, parses only newly appended bytes, and folds them
+into aggregates persisted as JSON. A trailing line without a newline is
+counted provisionally and replaced once it is complete. Truncation,
+replacement or rewriting of already-ingested bytes (detected from the
+inode, size and checksums of the header and of the bytes before the
+offset) triggers a full rebuild.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+CHECK_BYTES = 4096
+CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def _empty_aggregates() -> Dict[str, Dict[str, List[float]]]:
+    return {"daily": {}, "products": {}, "hourly": {}}
+
+
+class IncrementalIngestor:
+    """
+    Follows an append-only CSV and maintains materialized aggregates.
+
+    Args:
+        source: CSV file being appended to
+        state_path: JSON file persisting the offset, checksums and aggregates
+            (in-memory only when omitted)
+        sep: Field separator (the bundled datasets are tab-separated)
+        date_column: Column holding the transaction date
+        amount_column: Column holding the transaction amount
+        product_column: Column holding the product name
+        hour_column: Column holding the hour of day
+    """
+
+    def __init__(self, source: Union[str, os.PathLike],
+                 state_path: Optional[Union[str, os.PathLike]] = None, sep: str = "\t",
+                 date_column: str = "Date", amount_column: str = "money",
+                 product_column: str = "coffee_name", hour_column: str = "hour_of_day"):
+        self.source = Path(source)
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.sep = sep
+        self.date_column = date_column
+        self.amount_column = amount_column
+        self.product_column = product_column
+        self.hour_column = hour_column
+        self.state = self._initial_state()
+        if self.state_path is not None and self.state_path.exists():
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                self.state = json.load(f)
+
+    @staticmethod
+    def _initial_state() -> Dict[str, Any]:
+        return {"offset": 0, "rows": 0, "inode": None, "header": None, "head_hash": None,
+                "head_length": 0, "check_hash": None, "provisional": None,
+                "aggregates": _empty_aggregates()}
+
+    @property
+    def offset(self) -> int:
+        """Byte offset just past the last complete ingested line."""
+        return self.state["offset"]
+
+    @property
+    def rows(self) -> int:
+        """Rows ingested, including a provisional trailing line."""
+        return self.state["rows"]
+
+    @staticmethod
+    def _digest(payload: bytes) -> str:
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _rewrite_reason(self, f, stat: os.stat_result) -> Optional[str]:
+        state = self.state
+        if state["inode"] is None:
+            return "initial load"
+        if stat.st_ino != state["inode"]:
+            return "file replaced"
+        if stat.st_size < state["offset"]:
+            return "file truncated"
+        f.seek(0)
+        if self._digest(f.read(state["head_length"])) != state["head_hash"]:
+            return "header rewritten"
+        start = max(state["offset"] - CHECK_BYTES, 0)
+        f.seek(start)
+        if self._digest(f.read(state["offset"] - start)) != state["check_hash"]:
+            return "ingested rows rewritten"
+        return None
+
+    def _parse(self, lines: bytes) -> pd.DataFrame:
+        frame = pd.read_csv(io.BytesIO(lines), sep=self.sep, header=None,
+                            names=self.state["header"], dtype=str, keep_default_na=False)
+        frame[self.amount_column] = pd.to_numeric(frame[self.amount_column], errors="coerce")
+        frame[self.hour_column] = pd.to_numeric(frame[self.hour_column], errors="coerce")
+        return frame.dropna(subset=[self.amount_column])
+
+    def _fold(self, frame: pd.DataFrame, sign: int = 1) -> None:
+        """Add (or with ``sign=-1`` remove) a parsed chunk's contributions."""
+        if frame.empty:
+            return
+        aggregates = self.state["aggregates"]
+        amount, hour = self.amount_column, self.hour_column
+        groups = {
+            "daily": frame.groupby(self.date_column).agg(
+                revenue=(amount, "sum"), transactions=(amount, "size"), hour_sum=(hour, "sum")),
+            "products": frame.groupby(self.product_column).agg(
+                transactions=(amount, "size"), revenue=(amount, "sum")),
+            "hourly": frame.dropna(subset=[hour]).groupby(hour).agg(
+                transactions=(amount, "size"), revenue=(amount, "sum")),
+        }
+        for name, grouped in groups.items():
+            table = aggregates[name]
+            for key, row in zip(grouped.index, grouped.to_numpy(dtype=float).tolist()):
+                key = str(int(key)) if name == "hourly" else str(key)
+                current = table.setdefault(key, [0.0] * len(row))
+                for position, value in enumerate(row):
+                    current[position] += sign * value
+                if current[0 if name != "daily" else 1] <= 0:
+                    del table[key]
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def update(self) -> Dict[str, Any]:
+        """
+        Ingest bytes appended since the last call, or rebuild if the file was rewritten.
+
+        Returns:
+            Dict with ``mode`` ("incremental", "rebuild" or "unchanged"),
+            ``reason`` for a rebuild, ``rows_added`` and the total ``rows``
+        """
+        stat = self.source.stat()
+        with open(self.source, "rb") as f:
+            reason = self._rewrite_reason(f, stat)
+            if reason is not None:
+                self.state = self._initial_state()
+                self.state["inode"] = stat.st_ino
+            state = self.state
+            if reason is None and stat.st_size == state["offset"] + len(
+                    (state["provisional"] or "").encode()):
+                return {"mode": "unchanged", "reason": None, "rows_added": 0,
+                        "rows": state["rows"]}
+
+            rows_before = state["rows"]
+            if state["provisional"] is not None:
+                self._fold(self._parse(state["provisional"].encode()), sign=-1)
+                state["rows"] -= 1
+                state["provisional"] = None
+            f.seek(state["offset"])
+            pending = b""
+            while True:
+                chunk = f.read(CHUNK_BYTES)
+                if not chunk:
+                    break
+                pending += chunk
+                complete = pending.rfind(b"\n") + 1
+                if complete == 0:
+                    continue
+                lines, pending = pending[:complete], pending[complete:]
+                if state["header"] is None:
+                    header, lines = lines.split(b"\n", 1)
+                    state["header"] = header.decode("utf-8").rstrip("\r").split(self.sep)
+                    state["head_length"] = min(len(header) + 1, CHECK_BYTES)
+                state["offset"] += complete
+                if lines.strip():
+                    parsed = self._parse(lines)
+                    self._fold(parsed)
+                    state["rows"] += len(parsed)
+
+            if pending.strip() and state["header"] is not None:
+                parsed = self._parse(pending)
+                if len(parsed) == 1:
+                    self._fold(parsed)
+                    state["rows"] += 1
+                    state["provisional"] = pending.decode("utf-8")
+
+            f.seek(0)
+            state["head_hash"] = self._digest(f.read(state["head_length"]))
+            start = max(state["offset"] - CHECK_BYTES, 0)
+            f.seek(start)
+            state["check_hash"] = self._digest(f.read(state["offset"] - start))
+        self._save()
+        return {"mode": "rebuild" if reason is not None else "incremental", "reason": reason,
+                "rows_added": state["rows"] - rows_before if reason is None else state["rows"],
+                "rows": state["rows"]}
+
+    def daily_revenue(self) -> pd.DataFrame:
+        """
+        Daily totals, as in ``time_series_example``.
+
+        Returns:
+            DataFrame indexed by date with ``sales``, ``transaction_count`` and ``avg_hour``
+        """
+        daily = self.state["aggregates"]["daily"]
+        frame = pd.DataFrame.from_dict(daily, orient="index",
+                                       columns=["sales", "transaction_count", "hour_sum"])
+        frame.index = pd.to_datetime(frame.index)
+        frame["transaction_count"] = frame["transaction_count"].round().astype(int)
+        frame["avg_hour"] = frame.pop("hour_sum") / frame["transaction_count"]
+        return frame.sort_index().rename_axis("date")
+
+    def product_counts(self) -> pd.DataFrame:
+        """
+        Transactions and revenue per product.
+
+        Returns:
+            DataFrame indexed by product, most sold first
+        """
+        frame = pd.DataFrame.from_dict(self.state["aggregates"]["products"], orient="index",
+                                       columns=["transactions", "revenue"])
+        frame["transactions"] = frame["transactions"].round().astype(int)
+        return frame.sort_values("transactions", ascending=False).rename_axis("coffee_name")
+
+    def hourly_profile(self) -> pd.DataFrame:
+        """
+        Hour-of-day profile.
+
+        Returns:
+            DataFrame indexed by hour with ``transactions``, ``revenue`` and ``avg_ticket``
+        """
+        frame = pd.DataFrame.from_dict(self.state["aggregates"]["hourly"], orient="index",
+                                       columns=["transactions", "revenue"])
+        frame.index = frame.index.astype(int)
+        frame["transactions"] = frame["transactions"].round().astype(int)
+        frame["avg_ticket"] = frame["revenue"] / frame["transactions"]
+        return frame.sort_index().rename_axis("hour_of_day")
+
+
+def print_ingestion_report(ingestor: IncrementalIngestor, result: Dict[str, Any]) -> None:
+    """
+    Print the outcome of an ``IncrementalIngestor.update`` call.
+
+    Args:
+        ingestor: Ingestor that produced ``result``
+        result: Return value of ``update``
+    """
+    print("\n📥 INCREMENTAL INGESTION")
+    print("-" * 50)
+    if result["mode"] == "rebuild":
+        print(f"🔁 Full rebuild ({result['reason']})")
+    print(f"   Rows added: {result['rows_added']:,} (total {result['rows']:,})")
+    print(f"   Offset: {ingestor.offset:,} bytes")
+    daily = ingestor.daily_revenue()
+    if not daily.empty:
+        print(f"   Days: {len(daily)} ({daily.index.min():%Y-%m-%d} to "
+              f"{daily.index.max():%Y-%m-%d}), revenue {daily['sales'].sum():,.2f}")
+        products = ingestor.product_counts()["transactions"]
+        print(f"   Top product: {products.index[0]} ({products.iloc[0]:,} sales)")
+        busiest = ingestor.hourly_profile()["transactions"].idxmax()
+        print(f"   Busiest hour: {busiest}:00")
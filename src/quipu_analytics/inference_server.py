@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Micro-Batching Local Inference Server
+
+This module serves trained suite models (for example the churn model from
+``machine_learning_example.ipynb``) over a small asyncio HTTP front end on
+localhost TCP or a Unix socket. Concurrent requests are coalesced into
+micro-batches that are flushed when they reach ``max_batch_size`` rows or
+when the oldest request has waited ``max_latency_ms``. Each batch runs
+feature preparation and ``predict_proba`` in a worker process pool, and the
+server exposes queue depth, a batch-size histogram and p50/p99 latency.
+
+Endpoints:
+    POST /predict   body ``{"records": [{...}, ...]}`` or a single record object
+    GET  /metrics   serving statistics
+    GET  /health    liveness check
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import asyncio
+import collections
+import json
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+_WORKER_MODEL: Any = None
+_WORKER_PREPARE: Optional[Callable[[List[Dict[str, Any]]], Any]] = None
+
+
+class StoreModelLoader:
+    """
+    Picklable loader that opens a model from a ``ModelStore`` inside a worker.
+
+    Args:
+        root: ModelStore directory
+        key: Artifact key
+        execution_id: Artifact version (latest if omitted)
+    """
+
+    def __init__(self, root: str, key: str, execution_id: Optional[str] = None):
+        self.root = root
+        self.key = key
+        self.execution_id = execution_id
+
+    def __call__(self) -> Any:
+        from .model_store import ModelStore  # pylint: disable=import-outside-toplevel
+        return ModelStore(self.root, max_loaded=1).load(self.key, self.execution_id)
+
+
+class ChurnFeaturePreparer:
+    """
+    Rebuilds the churn notebook's feature matrix from raw request records.
+
+    Categorical columns are encoded exactly like ``LabelEncoder`` (codes are
+    positions in the sorted category list); unseen categories map to -1.
+
+    Args:
+        numeric_columns: Numeric feature columns, in model order
+        categorical_columns: Categorical columns, appended as ``<name>_encoded``
+    """
+
+    NUMERIC = ['age', 'listening_time', 'songs_played_per_day', 'skip_rate',
+               'ads_listened_per_week', 'offline_listening']
+    CATEGORICAL = ['gender', 'country', 'subscription_type', 'device_type']
+
+    def __init__(self, numeric_columns: Optional[Sequence[str]] = None,
+                 categorical_columns: Optional[Sequence[str]] = None):
+        self.numeric_columns = list(numeric_columns or self.NUMERIC)
+        self.categorical_columns = list(categorical_columns or self.CATEGORICAL)
+        self.categories: Dict[str, List[Any]] = {}
+
+    @property
+    def required_columns(self) -> List[str]:
+        """Columns every request record must provide."""
+        return self.numeric_columns + self.categorical_columns
+
+    def fit(self, frame: pd.DataFrame) -> "ChurnFeaturePreparer":
+        """
+        Learn the category lists from the training frame.
+
+        Args:
+            frame: Training data with the raw categorical columns
+
+        Returns:
+            The fitted preparer
+        """
+        self.categories = {column: sorted(frame[column].unique().tolist())
+                           for column in self.categorical_columns}
+        return self
+
+    def transform(self, frame: pd.DataFrame) -> np.ndarray:
+        """
+        Encode a frame of raw records into the model's feature matrix.
+
+        Args:
+            frame: Records with numeric and raw categorical columns
+
+        Returns:
+            Float array of shape (n_rows, n_features)
+        """
+        encoded = [frame[self.numeric_columns].to_numpy(dtype=np.float64)]
+        for column in self.categorical_columns:
+            codes = pd.Categorical(frame[column], categories=self.categories[column]).codes
+            encoded.append(codes.astype(np.float64)[:, None])
+        return np.hstack(encoded)
+
+    def __call__(self, records: List[Dict[str, Any]]) -> np.ndarray:
+        return self.transform(pd.DataFrame.from_records(records))
+
+
+def _init_worker(model_loader: Callable[[], Any],
+                 prepare: Optional[Callable[[List[Dict[str, Any]]], Any]]) -> None:
+    """Load the model once per worker process."""
+    global _WORKER_MODEL, _WORKER_PREPARE  # pylint: disable=global-statement
+    _WORKER_MODEL = model_loader()
+    _WORKER_PREPARE = prepare
+
+
+def _predict_batch(records: List[Dict[str, Any]]) -> List[float]:
+    """Prepare features and score one micro-batch inside a worker."""
+    features = (_WORKER_PREPARE(records) if _WORKER_PREPARE is not None
+                else pd.DataFrame.from_records(records))
+    if hasattr(_WORKER_MODEL, "predict_proba"):
+        return _WORKER_MODEL.predict_proba(features)[:, 1].tolist()
+    return np.asarray(_WORKER_MODEL.predict(features), dtype=np.float64).tolist()
+
+
+class InferenceServer:
+    """
+    Asyncio HTTP front end with deadline-bounded micro-batching.
+
+    Args:
+        model_loader: Picklable zero-argument callable returning a fitted model;
+            it runs once in every worker process
+        prepare: Picklable callable turning a list of record dicts into features;
+            records missing any of its ``required_columns`` are rejected with 400
+        max_batch_size: Rows per micro-batch before an early flush
+        max_latency_ms: Longest a request waits for its batch to fill
+        n_workers: Worker processes (also the number of batches in flight)
+        host: TCP bind address (ignored when ``unix_path`` is set)
+        port: TCP port (0 picks a free port)
+        unix_path: Serve on this Unix socket instead of TCP
+    """
+
+    HISTOGRAM_EDGES = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+    def __init__(self, model_loader: Callable[[], Any],
+                 prepare: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+                 max_batch_size: int = 256, max_latency_ms: float = 5.0,
+                 n_workers: int = 2, host: str = "127.0.0.1", port: int = 0,
+                 unix_path: Optional[str] = None):
+        self.model_loader = model_loader
+        self.prepare = prepare
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.n_workers = n_workers
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._pending_rows = 0
+        self._max_depth = 0
+        self._latencies: collections.deque = collections.deque(maxlen=100_000)
+        self._histogram = collections.Counter()
+        self._requests = 0
+        self._batches = 0
+        self._rows_batched = 0
+        self._errors = 0
+
+    async def start(self) -> "InferenceServer":
+        """
+        Start the worker pool, batcher and listener.
+
+        Returns:
+            The running server (``port`` is filled in when 0 was requested)
+        """
+        self._pool = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker,
+                                         initargs=(self.model_loader, self.prepare))
+        # Load models in every worker up front so the first requests are not penalized
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self._pool, _worker_ready)
+                               for _ in range(self.n_workers)])
+        self._queue = asyncio.Queue()
+        self._in_flight = asyncio.Semaphore(self.n_workers)
+        self._batcher = asyncio.create_task(self._batch_loop())
+        if self.unix_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        """Stop accepting connections and shut down the worker pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        self._server = self._batcher = self._pool = None
+
+    async def __aenter__(self) -> "InferenceServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def predict(self, records: List[Dict[str, Any]]) -> List[float]:
+        """
+        Score records through the micro-batcher (used by the HTTP handler).
+
+        Args:
+            records: Raw feature records
+
+        Returns:
+            One score per record
+        """
+        future = asyncio.get_running_loop().create_future()
+        enqueued = time.perf_counter()
+        self._pending_rows += len(records)
+        self._max_depth = max(self._max_depth, self._pending_rows)
+        await self._queue.put((records, future))
+        try:
+            return await future
+        finally:
+            self._latencies.append(time.perf_counter() - enqueued)
+            self._requests += 1
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            rows = len(batch[0][0])
+            deadline = loop.time() + self.max_latency
+            while rows < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                rows += len(item[0])
+            await self._in_flight.acquire()
+            asyncio.create_task(self._run_batch(batch, rows))
+
+    async def _run_batch(self, batch: List[Tuple[List[Dict[str, Any]], asyncio.Future]],
+                         rows: int) -> None:
+        loop = asyncio.get_running_loop()
+        records = [record for request_records, _ in batch for record in request_records]
+        self._pending_rows -= rows
+        self._batches += 1
+        self._rows_batched += rows
+        self._histogram[next((edge for edge in self.HISTOGRAM_EDGES if rows <= edge),
+                             self.HISTOGRAM_EDGES[-1] * 2)] += 1
+        try:
+            try:
+                scores = await loop.run_in_executor(self._pool, _predict_batch, records)
+            except Exception:  # pylint: disable=broad-except
+                # Score requests one by one so only the failing ones see the error
+                for request_records, future in batch:
+                    try:
+                        result = await loop.run_in_executor(self._pool, _predict_batch,
+                                                            request_records)
+                    except Exception as error:  # pylint: disable=broad-except
+                        self._errors += 1
+                        if not future.done():
+                            future.set_exception(error)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+                return
+        finally:
+            self._in_flight.release()
+        position = 0
+        for request_records, future in batch:
+            if not future.done():
+                future.set_result(scores[position:position + len(request_records)])
+            position += len(request_records)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Serving statistics.
+
+        Returns:
+            Dict with request/batch counts, current and peak queue depth (rows),
+            the batch-size histogram and latency percentiles in milliseconds
+        """
+        latencies_ms = np.array(self._latencies) * 1000.0
+        p50, p99 = (np.percentile(latencies_ms, [50, 99]) if len(latencies_ms)
+                    else (float("nan"), float("nan")))
+        return {
+            "requests": self._requests,
+            "batches": self._batches,
+            "errors": self._errors,
+            "queue_depth": self._pending_rows,
+            "max_queue_depth": self._max_depth,
+            "batch_size_histogram": {f"<={edge}": count
+                                     for edge, count in sorted(self._histogram.items())},
+            "mean_batch_size": self._rows_batched / self._batches if self._batches else 0.0,
+            "latency_p50_ms": float(p50),
+            "latency_p99_ms": float(p99),
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_http_request(reader)
+                except ValueError as error:
+                    _write_http_response(writer, 400, {"error": f"Malformed request: {error}"},
+                                         keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_http_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _validate(self, records: List[Any]) -> Optional[str]:
+        """Why a request's records cannot be scored, or None when they can."""
+        required = getattr(self.prepare, "required_columns", ())
+        for index, record in enumerate(records):
+            if not isinstance(record, dict):
+                return f"Record {index} is not an object"
+            missing = [column for column in required if column not in record]
+            if missing:
+                return f"Record {index} is missing columns: {', '.join(missing)}"
+        return None
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if method == "GET" and path == "/metrics":
+            return 200, self.metrics()
+        if method == "POST" and path == "/predict":
+            try:
+                payload = json.loads(body or b"{}")
+            except json.JSONDecodeError as error:
+                return 400, {"error": f"Invalid JSON: {error}"}
+            records = payload.get("records", [payload]) if isinstance(payload, dict) else payload
+            if not isinstance(records, list) or not records:
+                return 400, {"error": "Expected a record object or a non-empty 'records' list"}
+            problem = self._validate(records)
+            if problem:
+                return 400, {"error": problem}
+            try:
+                scores = await self.predict(records)
+            except Exception as error:  # pylint: disable=broad-except
+                return 500, {"error": str(error)}
+            return 200, {"predictions": scores}
+        return 404, {"error": f"No route for {method} {path}"}
+
+
+def _worker_ready() -> bool:
+    """No-op task that forces a worker's initializer to run."""
+    return _WORKER_MODEL is not None
+
+
+async def _read_http_request(
+        reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Parse one HTTP/1.1 request; None when the client closed the connection."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path, headers, body
+
+
+def _write_http_response(writer: asyncio.StreamWriter, status: int,
+                         payload: Dict[str, Any], keep_alive: bool) -> None:
+    """Serialize a JSON HTTP/1.1 response."""
+    reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+    body = json.dumps(payload).encode()
+    head = (f"HTTP/1.1 {status} {reasons.get(status, 'OK')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+
+
+async def request_predictions(records: List[Dict[str, Any]], host: str = "127.0.0.1",
+                              port: Optional[int] = None,
+                              unix_path: Optional[str] = None) -> List[float]:
+    """
+    Async client for ``POST /predict`` over TCP or a Unix socket.
+
+    Args:
+        records: Raw feature records
+        host: Server host for TCP
+        port: Server port for TCP
+        unix_path: Server Unix socket path (takes precedence over TCP)
+
+    Returns:
+        One score per record
+    """
+    if unix_path is not None:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps({"records": records}).encode()
+    writer.write((f"POST /predict HTTP/1.1\r\nHost: {host}\r\n"
+                  "Content-Type: application/json\r\n"
+                  f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    _, _, payload = response.partition(b"\r\n\r\n")
+    result = json.loads(payload)
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result["predictions"]
+
+
+def fetch_metrics(url: str) -> Dict[str, Any]:
+    """
+    Synchronous ``GET /metrics`` helper for notebooks.
+
+    Args:
+        url: Server base URL, e.g. ``http://127.0.0.1:8765``
+
+    Returns:
+        Metrics dictionary
+    """
+    with urllib.request.urlopen(f"{url.rstrip('/')}/metrics", timeout=10) as response:
+        return json.loads(response.read())
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Persistent Model Artifact Store
+
+This module saves fitted estimators so scoring jobs can reuse them instead
+of retraining. Large NumPy arrays inside an estimator are written as
+separate ``.npy`` files and memory-mapped on load; everything else is
+pickled. Artifacts are keyed by the estimator class, its hyperparameters and
+a fingerprint of the training data, and versioned by the ``execution_id``
+from ``get_execution_metadata``. Loaded models are kept in a small LRU and
+can be loaded lazily on first use.
+
+Only load artifacts from stores you trust: like any pickle, an artifact can
+execute code when it is loaded.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import collections
+import datetime
+import hashlib
+import io
+import json
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .execution_tracking import get_execution_metadata
+
+ARRAY_THRESHOLD_BYTES = 1 << 16
+
+
+def data_fingerprint(X: Any, y: Any = None) -> str:
+    """
+    Stable content hash of training data.
+
+    Args:
+        X: Feature matrix (NumPy array or DataFrame)
+        y: Optional target vector
+
+    Returns:
+        Hex digest identifying the data
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (X, y):
+        if part is None:
+            continue
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            labels = list(part.columns) if isinstance(part, pd.DataFrame) else [part.name]
+            digest.update(repr(labels).encode())
+            digest.update(repr([str(t) for t in np.atleast_1d(part.dtypes)]).encode())
+            digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        else:
+            array = np.ascontiguousarray(part)
+            digest.update(f"{array.dtype.str}{array.shape}".encode())
+            if array.dtype == object:
+                digest.update(repr(array.tolist()).encode())
+            else:
+                digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _jsonable(value: Any, name: str) -> Any:
+    """One hyperparameter as a JSON-safe value that identifies it exactly."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "get_params") and not isinstance(value, type):
+        return {"class": f"{type(value).__module__}.{type(value).__qualname__}",
+                "params": _jsonable_params(value, name)}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item, f"{name}[{index}]") for index, item in enumerate(value)]
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item, f"{name}.{key}") for key, item in sorted(value.items())}
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        array = np.ascontiguousarray(value)
+        return {"array": f"{array.dtype.str}{array.shape}",
+                "sha256": hashlib.sha256(array.tobytes()).hexdigest()}
+    if isinstance(value, (np.random.RandomState, np.random.Generator)):
+        raise ValueError(f"Parameter '{name}' is a random generator, whose state changes as "
+                         "it is used; pass an integer seed to get a reusable model key")
+    if isinstance(value, type) or callable(value) and hasattr(value, "__qualname__"):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, np.dtype):
+        return value.str
+    raise ValueError(f"Parameter '{name}' of type {type(value).__name__} cannot be "
+                     "keyed reliably; use plain values, estimators or named functions")
+
+
+def _jsonable_params(estimator: Any, prefix: str = "") -> Dict[str, Any]:
+    """Hyperparameters, with nested estimators expanded, reduced to JSON-safe values."""
+    params = estimator.get_params(deep=False) if hasattr(estimator, "get_params") else {}
+    return {name: _jsonable(value, f"{prefix}__{name}" if prefix else name)
+            for name, value in sorted(params.items())}
+
+
+def model_key(estimator: Any, fingerprint: str) -> str:
+    """
+    Artifact key from estimator class, hyperparameters and data fingerprint.
+
+    Args:
+        estimator: Estimator instance (fitted or not)
+        fingerprint: Output of ``data_fingerprint``
+
+    Returns:
+        Hex digest used as the artifact directory name
+    """
+    payload = json.dumps({
+        "class": f"{type(estimator).__module__}.{type(estimator).__qualname__}",
+        "params": _jsonable_params(estimator),
+        "data": fingerprint,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class _ArrayPickler(pickle.Pickler):
+    """Pickler that diverts large numeric arrays to separate ``.npy`` files."""
+
+    def __init__(self, file: io.BufferedWriter, array_dir: Path, threshold: int):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.array_dir = array_dir
+        self.threshold = threshold
+        self.arrays: List[Dict[str, Any]] = []
+        self._seen: Dict[int, str] = {}
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if (type(obj) is np.ndarray and obj.dtype != object  # pylint: disable=unidiomatic-typecheck
+                and obj.nbytes >= self.threshold):
+            if id(obj) not in self._seen:
+                name = f"array_{len(self._seen):04d}.npy"
+                np.save(self.array_dir / name, obj, allow_pickle=False)
+                self._seen[id(obj)] = name
+                self.arrays.append({"file": name, "shape": list(obj.shape),
+                                    "dtype": obj.dtype.str, "nbytes": int(obj.nbytes)})
+            return self._seen[id(obj)]
+        return None
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """
+    Unpickler that restores diverted arrays, memory-mapped when requested.
+
+    Maps are copy-on-write: estimators such as libsvm-backed SVMs need
+    writable buffers, and writes must never reach the stored artifact.
+    """
+
+    def __init__(self, file: io.BufferedReader, array_dir: Path, mmap: bool):
+        super().__init__(file)
+        self.array_dir = array_dir
+        self.mmap_mode = "c" if mmap else None
+
+    def persistent_load(self, pid: str) -> np.ndarray:
+        return np.load(self.array_dir / pid, mmap_mode=self.mmap_mode, allow_pickle=False)
+
+
+class LazyModel:
+    """
+    Proxy that loads a stored model on first attribute access.
+
+    Args:
+        store: Owning ModelStore
+        key: Artifact key
+        execution_id: Artifact version (latest if omitted)
+    """
+
+    def __init__(self, store: "ModelStore", key: str, execution_id: Optional[str] = None):
+        self._store = store
+        self._key = key
+        self._execution_id = execution_id
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the underlying model is currently in the store's LRU."""
+        return self._store.is_loaded(self._key, self._execution_id)
+
+    def __getattr__(self, name: str) -> Any:
+        model = self._store.load(self._key, self._execution_id)
+        return getattr(model, name)
+
+
+class ModelStore:
+    """
+    On-disk store of fitted estimators with memory-mapped arrays and an LRU.
+
+    Layout: ``<root>/<model_key>/<execution_id>/`` holding ``model.pkl``,
+    ``metadata.json`` and one ``.npy`` file per large array.
+
+    Args:
+        root: Store directory
+        max_loaded: Models kept in memory by the LRU
+        array_threshold: Arrays of at least this many bytes are stored separately
+    """
+
+    def __init__(self, root: str = "model_store", max_loaded: int = 8,
+                 array_threshold: int = ARRAY_THRESHOLD_BYTES):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_loaded = max_loaded
+        self.array_threshold = array_threshold
+        self._loaded: "collections.OrderedDict[tuple, Any]" = collections.OrderedDict()
+
+    def save(self, estimator: Any, X: Any = None, y: Any = None,
+             fingerprint: Optional[str] = None,
+             execution_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Persist a fitted estimator.
+
+        Args:
+            estimator: Fitted estimator
+            X: Training features (used for the fingerprint if none is given)
+            y: Training target (used for the fingerprint if none is given)
+            fingerprint: Precomputed ``data_fingerprint``
+            execution_metadata: Output of ``get_execution_metadata`` for this run
+
+        Returns:
+            Artifact metadata, including ``key`` and ``execution_id``
+        """
+        if fingerprint is None:
+            if X is None:
+                raise ValueError("Provide training data or a precomputed fingerprint")
+            fingerprint = data_fingerprint(X, y)
+        if execution_metadata is None:
+            execution_metadata = get_execution_metadata()
+
+        key = model_key(estimator, fingerprint)
+        execution_id = execution_metadata["execution_id"]
+        artifact_dir = self.root / key / execution_id
+        artifact_dir.mkdir(parents=True, exist_ok=True)
+
+        with open(artifact_dir / "model.pkl", "wb") as f:
+            pickler = _ArrayPickler(f, artifact_dir, self.array_threshold)
+            pickler.dump(estimator)
+
+        metadata = {
+            "key": key,
+            "execution_id": execution_id,
+            "estimator": f"{type(estimator).__module__}.{type(estimator).__qualname__}",
+            "params": _jsonable_params(estimator),
+            "data_fingerprint": fingerprint,
+            "saved_at": datetime.datetime.now().isoformat(),
+            "execution_timestamp": execution_metadata.get("timestamp"),
+            "arrays": pickler.arrays,
+        }
+        with open(artifact_dir / "metadata.json", "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        return metadata
+
+    def versions(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Metadata of every stored version of a key, oldest first.
+
+        Args:
+            key: Artifact key
+
+        Returns:
+            List of metadata dictionaries
+        """
+        entries = []
+        for path in (self.root / key).glob("*/metadata.json"):
+            with open(path, "r", encoding="utf-8") as f:
+                entries.append(json.load(f))
+        return sorted(entries, key=lambda entry: entry["saved_at"])
+
+    def _resolve(self, key: str, execution_id: Optional[str]) -> str:
+        if execution_id is not None:
+            return execution_id
+        versions = self.versions(key)
+        if not versions:
+            raise KeyError(f"No stored model for key {key}")
+        return versions[-1]["execution_id"]
+
+    def is_loaded(self, key: str, execution_id: Optional[str] = None) -> bool:
+        """
+        Whether a model is currently held by the LRU.
+
+        Args:
+            key: Artifact key
+            execution_id: Artifact version (latest if omitted)
+
+        Returns:
+            True if the model is in memory
+        """
+        try:
+            return (key, self._resolve(key, execution_id)) in self._loaded
+        except KeyError:
+            return False
+
+    def load(self, key: str, execution_id: Optional[str] = None, mmap: bool = True) -> Any:
+        """
+        Load a stored model, serving repeated requests from the LRU.
+
+        Args:
+            key: Artifact key
+            execution_id: Artifact version (latest if omitted)
+            mmap: Memory-map separately stored arrays instead of reading them
+
+        Returns:
+            The fitted estimator
+        """
+        execution_id = self._resolve(key, execution_id)
+        cache_key = (key, execution_id)
+        if cache_key in self._loaded:
+            self._loaded.move_to_end(cache_key)
+            return self._loaded[cache_key]
+
+        artifact_dir = self.root / key / execution_id
+        with open(artifact_dir / "model.pkl", "rb") as f:
+            model = _ArrayUnpickler(f, artifact_dir, mmap).load()
+
+        self._loaded[cache_key] = model
+        while len(self._loaded) > self.max_loaded:
+            self._loaded.popitem(last=False)
+        return model
+
+    def lazy(self, key: str, execution_id: Optional[str] = None) -> LazyModel:
+        """
+        Handle that defers loading until the model is first used.
+
+        Args:
+            key: Artifact key
+            execution_id: Artifact version (latest if omitted)
+
+        Returns:
+            LazyModel proxy
+        """
+        return LazyModel(self, key, execution_id)
+
+    def get_or_train(self, estimator: Any, X: Any, y: Any = None,
+                     execution_metadata: Optional[Dict[str, Any]] = None,
+                     fit: Optional[Callable[[Any, Any, Any], Any]] = None) -> Any:
+        """
+        Return a stored model for this estimator and data, training it if absent.
+
+        Args:
+            estimator: Unfitted estimator carrying the hyperparameters
+            X: Training features
+            y: Training target
+            execution_metadata: Output of ``get_execution_metadata`` for this run
+            fit: Optional ``fit(estimator, X, y)`` callable (defaults to ``estimator.fit``)
+
+        Returns:
+            The fitted estimator
+        """
+        fingerprint = data_fingerprint(X, y)
+        key = model_key(estimator, fingerprint)
+        if self.versions(key):
+            return self.load(key)
+        fitted = fit(estimator, X, y) if fit is not None else estimator.fit(X, y)
+        fitted = estimator if fitted is None else fitted
+        self.save(fitted, fingerprint=fingerprint, execution_metadata=execution_metadata)
+        return fitted
+
+
+def benchmark_load(estimator: Any, store: ModelStore, n_repeats: int = 5) -> Dict[str, float]:
+    """
+    Compare artifact load time against a plain pickle round trip.
+
+    Args:
+        estimator: Fitted estimator to benchmark
+        store: Store used for the memory-mapped artifact
+        n_repeats: Timed repetitions (best time is reported)
+
+    Returns:
+        Dict with best load times in seconds and artifact sizes in bytes
+    """
+    payload = pickle.dumps(estimator, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle_times = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        pickle.loads(payload)
+        pickle_times.append(time.perf_counter() - start)
+
+    metadata = store.save(estimator, fingerprint="benchmark",
+                          execution_metadata={"execution_id": "benchmark", "timestamp": None})
+    store_times = []
+    for _ in range(n_repeats):
+        store._loaded.clear()  # pylint: disable=protected-access
+        start = time.perf_counter()
+        store.load(metadata["key"], "benchmark", mmap=True)
+        store_times.append(time.perf_counter() - start)
+
+    return {
+        "pickle_load_seconds": min(pickle_times),
+        "mmap_load_seconds": min(store_times),
+        "pickle_bytes": len(payload),
+        "external_array_bytes": sum(a["nbytes"] for a in metadata["arrays"]),
+    }
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Streaming Notebook Indexer
+
+This module indexes ``.ipynb`` files without ``json.load``-ing them. A pull
+scanner reads each notebook in fixed-size chunks, decodes only the values it
+needs (cell types, sources, cell and notebook metadata) and steps over
+``outputs`` and ``attachments`` payloads without materializing them, so a
+notebook with megabytes of embedded images costs little more than its code.
+Cell sources are hashed and their imports extracted, and everything is
+persisted to a SQLite index that is refreshed only for notebooks whose mtime
+or size changed. Validating every notebook or asking "which notebooks use
+GridSearchCV" is then a query against the index.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+CHUNK_SIZE = 64 * 1024
+SKIPPED_CELL_KEYS = {"outputs", "attachments"}
+CELL_TYPES = {"code", "markdown", "raw"}
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+_SKIP_RUN = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*')
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_FROM_IMPORT = re.compile(
+    r"^[ \t]*from[ \t]+([\w.]+)[ \t]+import[ \t]+(?:\(([^)]*)\)|([^\n#;]+))", re.MULTILINE)
+_PLAIN_IMPORT = re.compile(r"^[ \t]*import[ \t]+([^\n#;]+)", re.MULTILINE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notebooks (
+    path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, nbformat INTEGER,
+    nbformat_minor INTEGER, metadata TEXT, n_cells INTEGER, skipped_outputs INTEGER
+);
+CREATE TABLE IF NOT EXISTS cells (
+    path TEXT, idx INTEGER, cell_type TEXT, source TEXT, source_hash TEXT,
+    tags TEXT, metadata TEXT, PRIMARY KEY (path, idx)
+);
+CREATE TABLE IF NOT EXISTS imports (path TEXT, idx INTEGER, module TEXT, name TEXT);
+CREATE INDEX IF NOT EXISTS imports_name ON imports (name);
+CREATE INDEX IF NOT EXISTS imports_module ON imports (module);
+"""
+
+
+class _Scanner:
+    """Pull parser over a text stream that only keeps the current window in memory."""
+
+    def __init__(self, stream, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _more(self) -> bool:
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._more():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._more():
+                    continue
+                raise
+            # A number at the end of the window may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self._more():
+                continue
+            self.pos = end
+            return value
+
+    def skip(self) -> int:
+        """Step over one value without decoding it; returns the characters skipped."""
+        if self.peek() not in ('{', '[', '"'):
+            self.decode()
+            return 0
+        depth, skipped = 0, 0
+        while True:
+            if self.pos >= len(self.buffer) and not self._more():
+                raise ValueError("truncated JSON value")
+            start = self.pos
+            # Consume everything up to the next bracket, complete strings included
+            self.pos = _SKIP_RUN.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) and self.buffer[self.pos] == '"':
+                # A string runs past the window: follow it chunk by chunk
+                self.pos += 1
+                while True:
+                    self.pos = _STRING_BODY.match(self.buffer, self.pos).end()
+                    if self.pos < len(self.buffer) and self.buffer[self.pos] == '"':
+                        self.pos += 1
+                        break
+                    skipped += self.pos - start
+                    start = 0
+                    if not self._more():
+                        raise ValueError("truncated JSON string")
+                skipped += self.pos - start
+                if depth == 0:
+                    return skipped
+                continue
+            if self.pos < len(self.buffer):
+                char = self.buffer[self.pos]
+                self.pos += 1
+                depth += 1 if char in "{[" else -1
+                if depth == 0:
+                    skipped += self.pos - start
+                    return skipped
+            skipped += self.pos - start
+
+    def members(self):
+        """Iterate over the keys of an object; the caller consumes each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"expected ',' or '}}' at offset {self.pos - 1}")
+
+    def items(self):
+        """Iterate over the elements of an array; the caller consumes each value."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"expected ',' or ']' at offset {self.pos - 1}")
+
+
+def _names(clause: str) -> List[str]:
+    names = [part.strip().split()[0] for part in clause.replace("\\", " ").split(",")
+             if part.strip() and not part.strip().startswith("#")]
+    return [name for name in names if name.replace(".", "").replace("_", "").isalnum()
+            or name == "*"]
+
+
+def extract_imports(source: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Modules and names imported by a code cell.
+
+    Import statements are matched line by line (including parenthesized
+    multi-line ``from`` imports), so cells containing IPython magics are
+    handled without parsing.
+
+    Args:
+        source: Cell source
+
+    Returns:
+        List of (module, imported name or None) pairs
+    """
+    if "import" not in source:
+        return []
+    found: List[Tuple[str, Optional[str]]] = []
+    for module, grouped, inline in _FROM_IMPORT.findall(source):
+        found.extend((module, name) for name in _names(grouped or inline))
+    for clause in _PLAIN_IMPORT.findall(source):
+        found.extend((module, None) for module in _names(clause))
+    return found
+
+
+def _source_text(source: Union[str, List[str], None]) -> str:
+    return "".join(source) if isinstance(source, list) else (source or "")
+
+
+def scan_notebook(path: Union[str, os.PathLike],
+                  chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Extract a notebook's structure in one streaming pass, skipping outputs.
+
+    Args:
+        path: ``.ipynb`` file
+        chunk_size: Characters read per chunk
+
+    Returns:
+        Dict with ``nbformat``, ``nbformat_minor``, notebook ``metadata``,
+        ``cells`` (``cell_type``, ``source``, ``source_hash``, ``tags``,
+        ``metadata``, ``imports``) and ``skipped_outputs`` (characters of
+        output payload that were stepped over)
+    """
+    notebook: Dict[str, Any] = {"nbformat": None, "nbformat_minor": None, "metadata": None,
+                                "cells": None, "skipped_outputs": 0}
+    with open(path, "r", encoding="utf-8") as f:
+        scanner = _Scanner(f, chunk_size)
+        for key in scanner.members():
+            if key == "cells":
+                notebook["cells"] = []
+                for _ in scanner.items():
+                    cell: Dict[str, Any] = {}
+                    for cell_key in scanner.members():
+                        if cell_key in SKIPPED_CELL_KEYS:
+                            notebook["skipped_outputs"] += scanner.skip()
+                        else:
+                            cell[cell_key] = scanner.decode()
+                    source = _source_text(cell.get("source"))
+                    metadata = cell.get("metadata") or {}
+                    notebook["cells"].append({
+                        "cell_type": cell.get("cell_type"),
+                        "source": source,
+                        "source_hash": hashlib.blake2b(source.encode(),
+                                                       digest_size=16).hexdigest(),
+                        "tags": list(metadata.get("tags", [])),
+                        "metadata": metadata,
+                        "imports": extract_imports(source)
+                        if cell.get("cell_type") == "code" else [],
+                    })
+            elif key in notebook and key != "skipped_outputs":
+                notebook[key] = scanner.decode()
+            else:
+                scanner.skip()
+    return notebook
+
+
+class NotebookIndex:
+    """
+    SQLite index of notebook cells and imports, refreshed by mtime and size.
+
+    Args:
+        db_path: SQLite file (``":memory:"`` for a per-process index)
+    """
+
+    def __init__(self, db_path: Union[str, os.PathLike] = ":memory:"):
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(db_path))
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def _store(self, path: str, stat: os.stat_result, notebook: Dict[str, Any]) -> None:
+        cells = notebook["cells"] or []
+        self._forget(path)
+        self.connection.execute(
+            "INSERT INTO notebooks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, notebook["nbformat"],
+             notebook["nbformat_minor"],
+             None if notebook["metadata"] is None else json.dumps(notebook["metadata"]),
+             None if notebook["cells"] is None else len(cells), notebook["skipped_outputs"]))
+        self.connection.executemany(
+            "INSERT INTO cells VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(path, idx, cell["cell_type"], cell["source"], cell["source_hash"],
+              json.dumps(cell["tags"]), json.dumps(cell["metadata"]))
+             for idx, cell in enumerate(cells)])
+        self.connection.executemany(
+            "INSERT INTO imports VALUES (?, ?, ?, ?)",
+            [(path, idx, module, name) for idx, cell in enumerate(cells)
+             for module, name in cell["imports"]])
+
+    def _forget(self, path: str) -> None:
+        for table in ("notebooks", "cells", "imports"):
+            self.connection.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+
+    def refresh(self, root: Union[str, os.PathLike] = "notebooks",
+                pattern: str = "**/*.ipynb") -> Dict[str, int]:
+        """
+        Index new or modified notebooks under ``root`` and drop deleted ones.
+
+        Args:
+            root: Directory to search
+            pattern: Glob pattern relative to ``root``
+
+        Returns:
+            Dict with ``indexed``, ``unchanged`` and ``removed`` counts
+        """
+        known = {path: (mtime_ns, size) for path, mtime_ns, size in self.connection.execute(
+            "SELECT path, mtime_ns, size FROM notebooks")}
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        seen: Set[str] = set()
+        with self.connection:
+            for notebook_path in sorted(Path(root).glob(pattern)):
+                if ".ipynb_checkpoints" in notebook_path.parts:
+                    continue
+                path = str(notebook_path)
+                seen.add(path)
+                stat = notebook_path.stat()
+                if known.get(path) == (stat.st_mtime_ns, stat.st_size):
+                    counts["unchanged"] += 1
+                    continue
+                self._store(path, stat, scan_notebook(notebook_path))
+                counts["indexed"] += 1
+            prefix = Path(root)
+            for path in known:
+                if path not in seen and prefix in Path(path).parents:
+                    self._forget(path)
+                    counts["removed"] += 1
+        return counts
+
+    def notebooks(self) -> List[str]:
+        """
+        Indexed notebook paths.
+
+        Returns:
+            Sorted list of paths
+        """
+        return [row[0] for row in self.connection.execute(
+            "SELECT path FROM notebooks ORDER BY path")]
+
+    def cells(self, path: str, cell_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Cells of one notebook.
+
+        Args:
+            path: Notebook path as indexed
+            cell_type: Optional filter ("code", "markdown", "raw")
+
+        Returns:
+            List of dicts with ``idx``, ``cell_type``, ``source``, ``source_hash`` and ``tags``
+        """
+        query = "SELECT idx, cell_type, source, source_hash, tags FROM cells WHERE path = ?"
+        params: Tuple[Any, ...] = (path,)
+        if cell_type is not None:
+            query += " AND cell_type = ?"
+            params += (cell_type,)
+        return [{"idx": idx, "cell_type": kind, "source": source, "source_hash": digest,
+                 "tags": json.loads(tags)}
+                for idx, kind, source, digest, tags in self.connection.execute(
+                    query + " ORDER BY idx", params)]
+
+    def notebooks_importing(self, symbol: str) -> List[str]:
+        """
+        Notebooks that import a module or name (e.g. "GridSearchCV" or "sklearn").
+
+        Args:
+            symbol: Imported name, module or parent package
+
+        Returns:
+            Sorted list of notebook paths
+        """
+        return [row[0] for row in self.connection.execute(
+            "SELECT DISTINCT path FROM imports WHERE name = ? OR module = ? "
+            "OR module LIKE ? ORDER BY path", (symbol, symbol, f"{symbol}.%"))]
+
+    def search_source(self, text: str, cell_type: Optional[str] = "code"
+                      ) -> List[Tuple[str, int]]:
+        """
+        Cells whose source contains ``text``.
+
+        Args:
+            text: Substring to find
+            cell_type: Restrict to a cell type (None for all)
+
+        Returns:
+            List of (notebook path, cell index)
+        """
+        query = "SELECT path, idx FROM cells WHERE instr(source, ?) > 0"
+        params: Tuple[Any, ...] = (text,)
+        if cell_type is not None:
+            query += " AND cell_type = ?"
+            params += (cell_type,)
+        return list(self.connection.execute(query + " ORDER BY path, idx", params))
+
+    def validate(self) -> Dict[str, List[str]]:
+        """
+        Structural problems per notebook.
+
+        Checks that ``cells``, ``metadata`` and ``nbformat`` are present, that
+        nbformat is 4 or later, that cells are non-empty and of a known type.
+
+        Returns:
+            Dict mapping every indexed notebook to its list of problems
+        """
+        problems: Dict[str, List[str]] = {}
+        for path, nbformat, metadata, n_cells in self.connection.execute(
+                "SELECT path, nbformat, metadata, n_cells FROM notebooks ORDER BY path"):
+            found = problems[path] = []
+            if n_cells is None:
+                found.append("missing 'cells'")
+            elif n_cells == 0:
+                found.append("no cells")
+            if metadata is None:
+                found.append("missing 'metadata'")
+            if nbformat is None:
+                found.append("missing 'nbformat'")
+            elif nbformat < 4:
+                found.append(f"nbformat {nbformat} is older than 4")
+        for path, idx, cell_type in self.connection.execute(
+                "SELECT path, idx, cell_type FROM cells WHERE cell_type IS NULL "
+                f"OR cell_type NOT IN ({', '.join('?' * len(CELL_TYPES))})",
+                sorted(CELL_TYPES)):
+            problems[path].append(f"cell {idx} has unknown type {cell_type!r}")
+        return problems
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Data-Scale Parameter Injection and Notebook Scaling Reports
+
+Each notebook declares its data-size knobs (``n_customers``, ``n_days``,
+``n_locations`` ...) as literal assignments in a code cell tagged
+``parameters``, following the papermill convention. At run time an
+``injected-parameters`` cell with overrides is inserted right after it, so a
+notebook can be smoke-tested at 1% scale or stress-tested at 100x without
+editing it. ``scaling_study`` runs notebooks at several scale factors in
+fresh subprocesses, records runtime and peak memory, and ``fit_complexity``
+fits log-log complexity exponents to show which notebooks will not survive
+production volumes.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import ast
+import copy
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+PARAMETERS_TAG = "parameters"
+INJECTED_TAG = "injected-parameters"
+
+# Data-size knobs of the suite's notebooks (model sizes such as n_estimators are excluded)
+SCALE_KNOBS = {
+    "Tier1_Correlation": ("n_samples",),
+    "Tier2_GradientBoosting": ("n_customers", "n_periods"),
+    "Tier2_LogisticRegression": ("n_customers", "n_products", "n_samples"),
+    "Tier2_NaiveBayes": ("n_patients", "n_docs_per_topic", "n_emails"),
+    "Tier2_NeuralNetworks": ("n_customers", "n_buildings"),
+    "Tier2_RandomForest": ("n_employees", "n_houses", "n_samples"),
+    "Tier2_SVM": ("n_samples", "n_reg_samples"),
+    "Tier2_kNN": ("n_samples",),
+    "Tier3_ARIMA": ("n_months", "n_days", "n_weeks"),
+    "Tier3_ExponentialSmoothing": ("n_months", "n_days", "n_trading_days"),
+    "Tier3_FourierAnalysis": ("n_days", "n_months"),
+    "Tier3_MovingAverages": ("n_quarters",),
+    "Tier4_Clustering": ("n_customers",),
+    "Tier4_DBSCAN": ("n_locations", "n_noise"),
+    "Tier4_PCA": ("n_customers",),
+    "Tier4_kMeans": ("n_customers",),
+    "Tier6_AnomalyDetection": ("n_normal", "n_fraud", "n_normal_parts", "n_defective"),
+    "Tier6_IsolationForest": ("n_transactions", "n_connections"),
+    "Tier6_OneClassSVM": ("n_normal_connections", "n_intrusions", "n_normal_readings",
+                          "n_fault_readings", "n_outliers"),
+    "Tier6_StatAnomaly": ("n_transactions", "n_fraudulent", "n_products", "n_defective"),
+}
+
+_CHILD_SCRIPT = r"""
+import contextlib, io, json, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+from IPython.core.interactiveshell import InteractiveShell
+
+def peak_rss():
+    # VmHWM belongs to this process image; on Linux ru_maxrss can carry the
+    # parent's peak over from fork + exec
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+with open(sys.argv[1], "r", encoding="utf-8") as f:
+    sources = json.load(f)
+shell = InteractiveShell.instance()
+baseline = peak_rss()
+outcome = {"status": "ok", "error": None, "failed_cell": None}
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    for index, source in enumerate(sources):
+        result = shell.run_cell(source, silent=True)
+        if not result.success:
+            error = result.error_in_exec or result.error_before_exec
+            outcome.update(status="error", error=f"{type(error).__name__}: {error}",
+                           failed_cell=index)
+            break
+outcome["seconds"] = time.perf_counter() - start
+peak = peak_rss()
+outcome["peak_mem_mb"] = None if peak is None else max(peak - baseline, 0) / 1e6
+with open(sys.argv[2], "w", encoding="utf-8") as f:
+    json.dump(outcome, f)
+"""
+
+
+def _load(notebook: Union[str, os.PathLike, Dict[str, Any]]) -> Dict[str, Any]:
+    if isinstance(notebook, dict):
+        return notebook
+    with open(notebook, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _source(cell: Dict[str, Any]) -> str:
+    source = cell.get("source", "")
+    return "".join(source) if isinstance(source, list) else source
+
+
+def _tagged(notebook: Dict[str, Any], tag: str) -> Optional[int]:
+    return next((index for index, cell in enumerate(notebook["cells"])
+                 if tag in cell.get("metadata", {}).get("tags", [])), None)
+
+
+def _literal_assignments(source: str) -> Dict[str, Any]:
+    values = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and \
+                isinstance(node.targets[0], ast.Name):
+            try:
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+    return values
+
+
+def _code_cell(source: str, tag: str) -> Dict[str, Any]:
+    return {"cell_type": "code", "execution_count": None, "id": uuid.uuid4().hex[:8],
+            "metadata": {"tags": [tag]}, "outputs": [],
+            "source": source.splitlines(keepends=True)}
+
+
+def _numeric_literal(match: Optional[re.Match]) -> Optional[Union[int, float]]:
+    if match is None:
+        return None
+    try:
+        value = ast.literal_eval(match.group(1))
+    except (ValueError, SyntaxError):
+        return None
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _parses(lines: List[str]) -> bool:
+    code = "".join("\n" if line.lstrip().startswith(("%", "!")) else line for line in lines)
+    try:
+        ast.parse(code)
+    except SyntaxError:
+        return False
+    return True
+
+
+def _write(path: Union[str, os.PathLike], notebook: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(notebook, indent=1, ensure_ascii=False) + "\n")
+
+
+def read_parameters(notebook: Union[str, os.PathLike, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Scale knobs declared in a notebook's ``parameters`` cell.
+
+    Args:
+        notebook: Notebook path or loaded notebook dict
+
+    Returns:
+        Dict mapping knob names to their default literal values (empty when
+        the notebook has no parameters cell)
+    """
+    notebook = _load(notebook)
+    index = _tagged(notebook, PARAMETERS_TAG)
+    return {} if index is None else _literal_assignments(_source(notebook["cells"][index]))
+
+
+def add_parameters_cell(path: Union[str, os.PathLike], knobs: Sequence[str],
+                        write: bool = True) -> Dict[str, Any]:
+    """
+    Move knob assignments into a new tagged ``parameters`` cell.
+
+    A knob is moved only when it is assigned a numeric literal exactly once in
+    the notebook and is not used or reassigned before that point (later
+    computed reassignments are left alone). An assignment inside
+    a data-generation function is removed too, so the function reads the
+    module-level knob and the notebook behaves identically at default scale.
+
+    Args:
+        path: Notebook file
+        knobs: Variable names to move
+        write: Save the notebook in place
+
+    Returns:
+        Dict with the moved ``parameters`` and the ``skipped`` knob names
+    """
+    notebook = _load(path)
+    if _tagged(notebook, PARAMETERS_TAG) is not None:
+        return {"parameters": read_parameters(notebook), "skipped": []}
+    moved: Dict[str, Any] = {}
+    lines: List[str] = []
+    skipped: List[str] = []
+    first_cell: Optional[int] = None
+    for knob in knobs:
+        pattern = re.compile(rf"^[ \t]*{re.escape(knob)}\s*=\s*(.+?)\s*(#.*)?$")
+        matches = [(index, line_no) for index, cell in enumerate(notebook["cells"])
+                   if cell["cell_type"] == "code"
+                   for line_no, line in enumerate(_source(cell).splitlines())
+                   if _numeric_literal(pattern.match(line)) is not None]
+        if len(matches) != 1:
+            skipped.append(knob)
+            continue
+        index, line_no = matches[0]
+        cell_lines = _source(notebook["cells"][index]).splitlines(keepends=True)
+        reassigned = re.compile(rf"^{re.escape(knob)}\s*=")
+        used_earlier = any(re.search(rf"\b{re.escape(knob)}\b", _source(cell))
+                           for cell in notebook["cells"][:index] if cell["cell_type"] == "code")
+        used_earlier |= any(reassigned.match(line) for line in cell_lines[:line_no])
+        remaining = cell_lines[:line_no] + cell_lines[line_no + 1:]
+        if used_earlier or not _parses(remaining):
+            skipped.append(knob)
+            continue
+        moved[knob] = _numeric_literal(pattern.match(cell_lines[line_no].rstrip("\n")))
+        lines.append(cell_lines[line_no].strip() + "\n")
+        notebook["cells"][index]["source"] = remaining
+        first_cell = index if first_cell is None else min(first_cell, index)
+    if first_cell is not None:
+        header = "# Data-size knobs; overridden at run time by quipu_analytics.notebook_scaling\n"
+        cell = _code_cell(header + "".join(lines).rstrip("\n"), PARAMETERS_TAG)
+        notebook["cells"].insert(first_cell, cell)
+        if write:
+            _write(path, notebook)
+    return {"parameters": moved, "skipped": skipped}
+
+
+def inject_parameters(notebook: Union[str, os.PathLike, Dict[str, Any]],
+                      overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a notebook with an ``injected-parameters`` cell after its parameters cell.
+
+    Args:
+        notebook: Notebook path or loaded notebook dict
+        overrides: Knob values to inject
+
+    Returns:
+        New notebook dict (an existing injected cell is replaced)
+
+    Raises:
+        ValueError: If the notebook has no parameters cell or a knob is unknown
+    """
+    notebook = copy.deepcopy(_load(notebook))
+    index = _tagged(notebook, PARAMETERS_TAG)
+    if index is None:
+        raise ValueError("notebook has no cell tagged 'parameters'")
+    unknown = set(overrides) - set(read_parameters(notebook))
+    if unknown:
+        raise ValueError(f"unknown parameters: {sorted(unknown)}")
+    existing = _tagged(notebook, INJECTED_TAG)
+    if existing is not None:
+        del notebook["cells"][existing]
+    source = "# Injected parameters\n" + "".join(
+        f"{name} = {value!r}\n" for name, value in overrides.items())
+    notebook["cells"].insert(index + 1, _code_cell(source.rstrip("\n"), INJECTED_TAG))
+    return notebook
+
+
+def scale_overrides(parameters: Dict[str, Any], factor: float) -> Dict[str, Any]:
+    """
+    Scale numeric knobs by a factor (integers are rounded and kept at least 1).
+
+    Args:
+        parameters: Defaults from ``read_parameters``
+        factor: Scale factor (e.g. 0.01 for a smoke test, 100 for a stress test)
+
+    Returns:
+        Dict of overridden knob values
+    """
+    scaled = {}
+    for name, value in parameters.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        scaled[name] = max(1, int(round(value * factor))) if isinstance(value, int) \
+            else value * factor
+    return scaled
+
+
+def run_notebook(path: Union[str, os.PathLike], overrides: Optional[Dict[str, Any]] = None,
+                 scale: Optional[float] = None, timeout: Optional[float] = None
+                 ) -> Dict[str, Any]:
+    """
+    Execute a notebook's code cells in a fresh IPython subprocess.
+
+    The notebook runs from its own directory with non-interactive plotting
+    backends; runtime covers cell execution and peak memory is the growth of
+    the process's peak RSS over its state after start-up.
+
+    Args:
+        path: Notebook file
+        overrides: Explicit knob values to inject
+        scale: Scale factor applied to every numeric knob (combined with
+            ``overrides``, which take precedence)
+        timeout: Seconds before the run is killed
+
+    Returns:
+        Dict with ``notebook``, ``scale``, ``parameters``, ``status`` ("ok",
+        "error" or "timeout"), ``seconds``, ``peak_mem_mb``, ``error`` and
+        ``failed_cell`` (index among code cells)
+    """
+    path = Path(path)
+    notebook = _load(path)
+    parameters = dict(overrides or {})
+    if scale is not None:
+        parameters = {**scale_overrides(read_parameters(notebook), scale), **parameters}
+    if parameters:
+        notebook = inject_parameters(notebook, parameters)
+    sources = [_source(cell) for cell in notebook["cells"] if cell["cell_type"] == "code"]
+    record = {"notebook": path.stem, "scale": scale, "parameters": parameters,
+              "status": "ok", "seconds": None, "peak_mem_mb": None, "error": None,
+              "failed_cell": None}
+    env = {**os.environ, "MPLBACKEND": "Agg", "PLOTLY_RENDERER": "json"}
+    with tempfile.TemporaryDirectory() as workdir:
+        sources_path, result_path = Path(workdir) / "cells.json", Path(workdir) / "result.json"
+        sources_path.write_text(json.dumps(sources), encoding="utf-8")
+        try:
+            subprocess.run([sys.executable, "-c", _CHILD_SCRIPT, str(sources_path),
+                            str(result_path)], cwd=path.parent, env=env, timeout=timeout,
+                           check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except subprocess.TimeoutExpired:
+            record.update(status="timeout", seconds=timeout)
+            return record
+        if not result_path.exists():
+            record.update(status="error", error="runner process died")
+            return record
+        record.update(json.loads(result_path.read_text(encoding="utf-8")))
+    return record
+
+
+def scaling_study(paths: Iterable[Union[str, os.PathLike]],
+                  factors: Sequence[float] = (0.01, 0.1, 1.0),
+                  timeout: Optional[float] = 600.0, stop_on_failure: bool = True
+                  ) -> pd.DataFrame:
+    """
+    Run notebooks at several scale factors.
+
+    Args:
+        paths: Notebook files (notebooks without a parameters cell are skipped)
+        factors: Scale factors, run in increasing order
+        timeout: Seconds per run
+        stop_on_failure: Skip larger factors of a notebook once one fails
+
+    Returns:
+        DataFrame with one row per (notebook, factor) run
+    """
+    rows = []
+    for path in paths:
+        if not read_parameters(path):
+            continue
+        for factor in sorted(factors):
+            record = run_notebook(path, scale=factor, timeout=timeout)
+            rows.append(record)
+            if record["status"] != "ok" and stop_on_failure:
+                break
+    return pd.DataFrame(rows, columns=["notebook", "scale", "parameters", "status", "seconds",
+                                       "peak_mem_mb", "error", "failed_cell"])
+
+
+def fit_complexity(results: pd.DataFrame, target_scale: float = 100.0) -> pd.DataFrame:
+    """
+    Log-log complexity exponents of runtime and memory against scale.
+
+    An exponent near 1 means linear growth, near 2 quadratic.
+
+    Args:
+        results: Output of ``scaling_study``
+        target_scale: Scale at which runtime and memory are projected
+
+    Returns:
+        DataFrame per notebook with ``time_exponent``, ``memory_exponent``,
+        ``projected_seconds``, ``projected_memory_mb``, ``largest_ok_scale``
+        and ``first_failure``
+    """
+    rows = []
+    for notebook, runs in results.groupby("notebook", sort=False):
+        ok = runs[runs["status"] == "ok"]
+        failed = runs[runs["status"] != "ok"]
+        row = {"notebook": notebook, "time_exponent": np.nan, "memory_exponent": np.nan,
+               "projected_seconds": np.nan, "projected_memory_mb": np.nan,
+               "largest_ok_scale": ok["scale"].max() if len(ok) else np.nan,
+               "first_failure": failed["scale"].min() if len(failed) else np.nan}
+        for column, exponent, projected in (("seconds", "time_exponent", "projected_seconds"),
+                                            ("peak_mem_mb", "memory_exponent",
+                                             "projected_memory_mb")):
+            points = ok[(ok[column].astype(float) > 0) & (ok["scale"] > 0)]
+            if points["scale"].nunique() >= 2:
+                slope, intercept = np.polyfit(np.log(points["scale"].astype(float)),
+                                              np.log(points[column].astype(float)), 1)
+                row[exponent] = slope
+                row[projected] = float(np.exp(intercept) * target_scale ** slope)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def print_scaling_report(complexity: pd.DataFrame, target_scale: float = 100.0) -> None:
+    """
+    Print the output of ``fit_complexity``, steepest runtime growth first.
+
+    Args:
+        complexity: Complexity table
+        target_scale: Scale used for the projections
+    """
+    print(f"\n📈 NOTEBOOK SCALING REPORT (projected at {target_scale:g}x)")
+    print("-" * 50)
+    for _, row in complexity.sort_values("time_exponent", ascending=False).iterrows():
+        status = "⚠️" if row["time_exponent"] > 1.5 or pd.notna(row["first_failure"]) else "✅"
+        failure = "" if pd.isna(row["first_failure"]) else \
+            f", fails at {row['first_failure']:g}x"
+        print(f"{status} {row['notebook']:<28} time ~ n^{row['time_exponent']:.2f} "
+              f"({row['projected_seconds']:.1f}s), memory ~ n^{row['memory_exponent']:.2f} "
+              f"({row['projected_memory_mb']:.0f} MB){failure}")
@@ -0,0 +1,718 @@
+#!/usr/bin/env python3
+"""
+Pluggable Work Executors for Local Pools and Socket Workers
+
+This module provides one ``concurrent.futures.Executor`` interface over
+three backends: a thread pool, a process pool, and socket workers, which
+are daemons (``python -m quipu_analytics.parallel_executor``) running on
+other hosts or as local processes. Work units are picklable calls such as
+``notebook_scaling.run_notebook``, a cross-validation fold or a search
+trial (see ``run_cv_trials``). Large inputs are registered once with
+``put`` and passed as ``DatasetRef`` placeholders that carry the data
+fingerprint. Each backend ships a dataset at most once per worker, and the
+socket scheduler hands every idle worker the pending unit whose datasets it
+already holds. A unit whose worker dies or times out is retried on another
+worker; exceptions raised by the unit itself are returned to the caller
+unchanged.
+
+Socket workers exchange pickled messages, so every worker requires an
+``authkey`` and only clients holding it can connect; even on localhost,
+any other user on the machine could otherwise run code in the worker.
+Notebook paths and importable functions must resolve the same way on every
+worker host.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import abc
+import argparse
+import collections
+import multiprocessing
+import os
+import pickle
+import secrets
+import shutil
+import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.connection import Client, Listener
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .model_store import data_fingerprint
+
+DEFAULT_PORT = 7077
+AUTHKEY_VARIABLE = "QUIPU_WORKER_AUTHKEY"
+# Executor.shutdown only takes cancel_futures from Python 3.9
+SHUTDOWN_CANCELS_FUTURES = sys.version_info >= (3, 9)
+
+# Datasets loaded by process-backend workers, keyed by fingerprint
+_WORKER_DATASETS: Dict[str, Any] = {}
+
+
+class DatasetRef(NamedTuple):
+    """Placeholder for a dataset registered with ``WorkExecutor.put``."""
+
+    fingerprint: str
+    nbytes: int
+
+
+def _nbytes(data: Any) -> int:
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return int(np.sum(data.memory_usage(index=True, deep=True)))
+    nbytes = getattr(data, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _refs(args: tuple, kwargs: Dict[str, Any]) -> List[DatasetRef]:
+    return [value for value in (*args, *kwargs.values()) if isinstance(value, DatasetRef)]
+
+
+def _resolve(args: tuple, kwargs: Dict[str, Any],
+             lookup: Callable[[DatasetRef], Any]) -> Tuple[tuple, Dict[str, Any]]:
+    """Replace top-level ``DatasetRef`` arguments with their data."""
+    args = tuple(lookup(value) if isinstance(value, DatasetRef) else value for value in args)
+    kwargs = {key: lookup(value) if isinstance(value, DatasetRef) else value
+              for key, value in kwargs.items()}
+    return args, kwargs
+
+
+def _shutdown_pool(pool: Executor, wait: bool, cancel_futures: bool,
+                   futures: Iterable[Future]) -> None:
+    """Shut a stdlib pool down, cancelling ``futures`` by hand where it cannot."""
+    if SHUTDOWN_CANCELS_FUTURES:
+        pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+        return
+    if cancel_futures:
+        for future in list(futures):
+            future.cancel()
+    pool.shutdown(wait=wait)
+
+
+def _track(futures: set, future: Future) -> Future:
+    futures.add(future)
+    future.add_done_callback(futures.discard)
+    return future
+
+
+class WorkExecutor(Executor, abc.ABC):
+    """
+    Executor interface shared by the thread, process and socket backends.
+
+    Register large inputs once with ``put`` and pass the returned
+    ``DatasetRef`` as a (top-level) argument to ``submit``; the backend
+    replaces it with the data on the worker side.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self._datasets: Dict[str, Any] = {}
+        self._datasets_lock = threading.Lock()
+
+    def put(self, data: Any, fingerprint: Optional[str] = None) -> DatasetRef:
+        """
+        Register a dataset for use by work units.
+
+        Args:
+            data: Array, DataFrame or other picklable object
+            fingerprint: Identity of the data (``model_store.data_fingerprint`` by default)
+
+        Returns:
+            Reference to pass to ``submit`` in place of the data
+        """
+        fingerprint = fingerprint or data_fingerprint(data)
+        with self._datasets_lock:
+            if fingerprint not in self._datasets:
+                self._datasets[fingerprint] = data
+                self._stage(fingerprint, data)
+        return DatasetRef(fingerprint, _nbytes(data))
+
+    def _stage(self, fingerprint: str, data: Any) -> None:
+        """Make a newly registered dataset reachable by the backend's workers."""
+
+    @abc.abstractmethod
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Schedule ``fn(*args, **kwargs)`` with ``DatasetRef`` arguments resolved."""
+
+
+class ThreadWorkExecutor(WorkExecutor):
+    """
+    Thread-pool backend; datasets are shared in memory.
+
+    Args:
+        max_workers: Pool size (``ThreadPoolExecutor`` default if omitted)
+    """
+
+    name = "thread"
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: set = set()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        args, kwargs = _resolve(args, kwargs, lambda ref: self._datasets[ref.fingerprint])
+        return _track(self._futures, self._pool.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        _shutdown_pool(self._pool, wait, cancel_futures, self._futures)
+
+
+def _load_spilled(directory: str, fingerprint: str) -> Any:
+    if fingerprint not in _WORKER_DATASETS:
+        with open(os.path.join(directory, f"{fingerprint}.pkl"), "rb") as f:
+            _WORKER_DATASETS[fingerprint] = pickle.load(f)
+    return _WORKER_DATASETS[fingerprint]
+
+
+def _run_spilled(directory: str, fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Worker-side wrapper: resolve dataset references from the spill directory."""
+    args, kwargs = _resolve(args, kwargs, lambda ref: _load_spilled(directory, ref.fingerprint))
+    return fn(*args, **kwargs)
+
+
+class ProcessWorkExecutor(WorkExecutor):
+    """
+    Process-pool backend.
+
+    Datasets are pickled once to a spill directory and loaded at most once
+    per worker process. If a worker process dies, the pool is replaced and
+    the affected units are resubmitted.
+
+    Args:
+        max_workers: Pool size (``ProcessPoolExecutor`` default if omitted)
+        max_retries: Resubmissions of a unit after the pool breaks
+        mp_context: Optional multiprocessing context
+    """
+
+    name = "process"
+
+    def __init__(self, max_workers: Optional[int] = None, max_retries: int = 2,
+                 mp_context: Any = None):
+        super().__init__()
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.mp_context = mp_context
+        self._spill_dir = tempfile.mkdtemp(prefix="quipu_datasets_")
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pool = ProcessPoolExecutor(max_workers, mp_context=mp_context)
+        self._futures: set = set()
+
+    def _stage(self, fingerprint: str, data: Any) -> None:
+        path = os.path.join(self._spill_dir, f"{fingerprint}.pkl")
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is broken and not self._closed:
+                self._pool = ProcessPoolExecutor(self.max_workers, mp_context=self.mp_context)
+        broken.shutdown(wait=False)
+
+    def _dispatch(self, outer: Future, fn: Callable, args: tuple, kwargs: Dict[str, Any],
+                  attempt: int) -> None:
+        with self._lock:
+            pool = self._pool
+        inner = _track(self._futures, pool.submit(_run_spilled, self._spill_dir, fn, args, kwargs))
+
+        def _forward(done: Future) -> None:
+            if done.cancelled():
+                outer.cancel()
+                return
+            error = done.exception()
+            if isinstance(error, BrokenProcessPool) and attempt < self.max_retries \
+                    and not self._closed:
+                self._replace_pool(pool)
+                self._dispatch(outer, fn, args, kwargs, attempt + 1)
+                return
+            if not outer.set_running_or_notify_cancel():
+                return
+            if error is not None:
+                outer.set_exception(error)
+            else:
+                outer.set_result(done.result())
+
+        inner.add_done_callback(_forward)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        outer: Future = Future()
+        self._dispatch(outer, fn, args, kwargs, attempt=0)
+        return outer
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._closed = True
+            pool = self._pool
+        _shutdown_pool(pool, wait, cancel_futures, self._futures)
+        if wait:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+
+
+class WorkerServer:
+    """
+    Socket worker daemon executing units sent by ``SocketWorkExecutor``.
+
+    Each client connection is served by its own thread, one unit at a time.
+    Datasets received from clients stay cached (least recently used first
+    out) across connections, so a reconnecting scheduler does not resend them.
+
+    Args:
+        address: (host, port) to listen on; port 0 picks a free port
+        authkey: Shared secret for HMAC authentication of clients (required)
+        max_cache_bytes: Dataset cache budget
+    """
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", DEFAULT_PORT),
+                 authkey: Optional[bytes] = None, max_cache_bytes: int = 2 * 1024 ** 3):
+        if not authkey:
+            raise ValueError("an authkey is required: workers unpickle and run what clients send")
+        self.authkey = authkey
+        self.max_cache_bytes = max_cache_bytes
+        self._listener = Listener(tuple(address), authkey=authkey)
+        self.address: Tuple[str, int] = self._listener.address
+        self._cache: "collections.OrderedDict[str, Tuple[Any, int]]" = collections.OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self.stats = {"units": 0, "datasets_received": 0, "datasets_evicted": 0}
+
+    def _store(self, fingerprint: str, data: Any) -> None:
+        with self._lock:
+            if fingerprint in self._cache:
+                self._cache.move_to_end(fingerprint)
+                return
+            nbytes = _nbytes(data)
+            self._cache[fingerprint] = (data, nbytes)
+            self._cache_bytes += nbytes
+            self.stats["datasets_received"] += 1
+            while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._cache_bytes -= evicted
+                self.stats["datasets_evicted"] += 1
+
+    def _checkout(self, refs: List[DatasetRef]) -> Tuple[Dict[str, Any], List[str]]:
+        with self._lock:
+            missing = [ref.fingerprint for ref in refs if ref.fingerprint not in self._cache]
+            found = {}
+            for ref in refs:
+                if ref.fingerprint in self._cache:
+                    self._cache.move_to_end(ref.fingerprint)
+                    found[ref.fingerprint] = self._cache[ref.fingerprint][0]
+            return found, missing
+
+    def _reply(self, message: tuple) -> tuple:
+        kind = message[0]
+        if kind == "held":
+            with self._lock:
+                return ("ok", list(self._cache))
+        if kind == "put":
+            self._store(message[1], message[2])
+            return ("ok", None)
+        if kind == "stop":
+            threading.Thread(target=self.stop, daemon=True).start()
+            return ("ok", None)
+        _, fn, args, kwargs = message
+        found, missing = self._checkout(_refs(args, kwargs))
+        if missing:
+            return ("missing", missing)
+        args, kwargs = _resolve(args, kwargs, lambda ref: found[ref.fingerprint])
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as error:  # pylint: disable=broad-except
+            error.remote_traceback = traceback.format_exc()
+            return ("error", error)
+        finally:
+            with self._lock:
+                self.stats["units"] += 1
+        return ("ok", result)
+
+    def _handle(self, conn: Any) -> None:
+        with conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+                reply = self._reply(message)
+                try:
+                    conn.send(reply)
+                except OSError:
+                    return
+                except Exception:  # pylint: disable=broad-except
+                    conn.send(("error", RuntimeError(
+                        f"result could not be pickled:\n{traceback.format_exc()}")))
+
+    def serve_forever(self) -> None:
+        """Accept client connections until ``stop`` is called."""
+        while not self._stopping.is_set():
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                continue
+            if self._stopping.is_set():
+                conn.close()
+                break
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        self._listener.close()
+
+    def stop(self) -> None:
+        """Stop accepting connections (wakes a blocked ``serve_forever``)."""
+        self._stopping.set()
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (OSError, EOFError, multiprocessing.AuthenticationError):
+            pass
+
+
+def _serve(address: Tuple[str, int], authkey: bytes, max_cache_bytes: int,
+           ready: Any) -> None:
+    server = WorkerServer(address, authkey, max_cache_bytes)
+    ready.send(server.address)
+    ready.close()
+    server.serve_forever()
+
+
+def start_local_workers(n_workers: int = 2, authkey: Optional[bytes] = None,
+                        max_cache_bytes: int = 2 * 1024 ** 3
+                        ) -> Tuple[bytes, List[Tuple[Tuple[str, int], Any]]]:
+    """
+    Start socket worker daemons as local (daemonic) processes.
+
+    Args:
+        n_workers: Number of workers
+        authkey: Shared secret for the workers (a random one if omitted)
+        max_cache_bytes: Dataset cache budget per worker
+
+    Returns:
+        (authkey to pass to ``SocketWorkExecutor``, list of (address, process)
+        pairs); terminate the processes when done
+    """
+    authkey = authkey or secrets.token_bytes(32)
+    context = multiprocessing.get_context("spawn")
+    workers = []
+    for _ in range(n_workers):
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_serve, daemon=True,
+                                  args=(("127.0.0.1", 0), authkey, max_cache_bytes, sender))
+        process.start()
+        sender.close()
+        workers.append((tuple(receiver.recv()), process))
+        receiver.close()
+    return authkey, workers
+
+
+class _Unit:
+    __slots__ = ("future", "fn", "args", "kwargs", "refs", "attempts", "failures")
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: Dict[str, Any]):
+        self.future: Future = Future()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.refs = _refs(args, kwargs)
+        self.attempts = 0
+        self.failures: List[str] = []
+
+
+class _Worker:
+    __slots__ = ("address", "alive", "held", "units", "shipped_bytes", "error")
+
+    def __init__(self, address: Tuple[str, int]):
+        self.address = address
+        self.alive = True
+        self.held: set = set()
+        self.units = 0
+        self.shipped_bytes = 0
+        self.error: Optional[str] = None
+
+
+class SocketWorkExecutor(WorkExecutor):
+    """
+    Backend dispatching units to ``WorkerServer`` daemons.
+
+    One scheduler thread per worker keeps a connection open and, whenever
+    the worker is idle, takes the pending unit that needs the fewest dataset
+    bytes shipped (oldest first among ties). Datasets the worker already
+    holds, including ones cached from earlier sessions, are never resent.
+    A worker whose connection fails or whose unit exceeds ``task_timeout``
+    is dropped and its unit requeued for another worker.
+
+    Args:
+        addresses: (host, port) of each worker
+        authkey: Shared secret configured on the workers (required)
+        max_retries: Requeues of a unit after losing its worker
+        task_timeout: Seconds a unit may run before its worker is considered lost
+    """
+
+    name = "socket"
+
+    def __init__(self, addresses: Sequence[Tuple[str, int]], authkey: Optional[bytes] = None,
+                 max_retries: int = 2, task_timeout: Optional[float] = None):
+        super().__init__()
+        if not addresses:
+            raise ValueError("at least one worker address is required")
+        if not authkey:
+            raise ValueError("an authkey is required to connect to socket workers")
+        self.authkey = authkey
+        self.max_retries = max_retries
+        self.task_timeout = task_timeout
+        self.workers = [_Worker(tuple(address)) for address in addresses]
+        self._pending: List[_Unit] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._serve_worker, args=(worker,), daemon=True,
+                                          name=f"quipu-worker-{worker.address[1]}")
+                         for worker in self.workers]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        unit = _Unit(fn, args, kwargs)
+        unknown = [ref.fingerprint for ref in unit.refs if ref.fingerprint not in self._datasets]
+        if unknown:
+            raise ValueError(f"datasets not registered with put(): {unknown}")
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._pending.append(unit)
+            self._fail_if_no_workers()
+            self._cond.notify_all()
+        return unit.future
+
+    def _fail_if_no_workers(self) -> None:
+        if any(worker.alive for worker in self.workers):
+            return
+        errors = "; ".join(f"{w.address[0]}:{w.address[1]}: {w.error}" for w in self.workers)
+        for unit in self._pending:
+            if not unit.future.cancelled():
+                unit.future.set_exception(ConnectionError(f"no socket workers left ({errors})"))
+        self._pending.clear()
+
+    def _pick(self, worker: _Worker) -> Optional[_Unit]:
+        """Pending unit needing the fewest bytes shipped to ``worker`` (called under the lock)."""
+        self._pending = [unit for unit in self._pending if not unit.future.cancelled()]
+        if not self._pending:
+            return None
+        position = min(range(len(self._pending)), key=lambda index: (
+            sum(ref.nbytes for ref in self._pending[index].refs
+                if ref.fingerprint not in worker.held), index))
+        return self._pending.pop(position)
+
+    def _receive(self, conn: Any, timeout: Optional[float] = None) -> tuple:
+        if timeout is not None and not conn.poll(timeout):
+            raise TimeoutError(f"no reply within {timeout}s")
+        return conn.recv()
+
+    def _execute(self, conn: Any, worker: _Worker, unit: _Unit) -> tuple:
+        for _ in range(2):
+            for ref in unit.refs:
+                if ref.fingerprint not in worker.held:
+                    conn.send(("put", ref.fingerprint, self._datasets[ref.fingerprint]))
+                    self._receive(conn)
+                    worker.held.add(ref.fingerprint)
+                    worker.shipped_bytes += ref.nbytes
+            conn.send(("run", unit.fn, unit.args, unit.kwargs))
+            status, payload = self._receive(conn, self.task_timeout)
+            if status != "missing":
+                worker.units += 1
+                return status, payload
+            worker.held.difference_update(payload)
+        return "error", MemoryError("worker cache cannot hold the unit's datasets")
+
+    def _lose(self, worker: _Worker, unit: Optional[_Unit], error: BaseException) -> None:
+        with self._cond:
+            worker.alive = False
+            worker.error = repr(error)
+            if unit is not None:
+                unit.attempts += 1
+                unit.failures.append(f"{worker.address[0]}:{worker.address[1]}: {error!r}")
+                if unit.attempts <= self.max_retries:
+                    self._pending.insert(0, unit)
+                else:
+                    unit.future.set_exception(ConnectionError(
+                        f"work unit lost on {unit.attempts} workers ({'; '.join(unit.failures)})"))
+            self._fail_if_no_workers()
+            self._cond.notify_all()
+
+    def _serve_worker(self, worker: _Worker) -> None:
+        try:
+            conn = Client(worker.address, authkey=self.authkey)
+            conn.send(("held",))
+            worker.held = set(self._receive(conn, self.task_timeout)[1])
+        except (OSError, EOFError, TimeoutError, multiprocessing.AuthenticationError) as error:
+            self._lose(worker, None, error)
+            return
+        with conn:
+            while True:
+                with self._cond:
+                    unit = self._pick(worker)
+                    while unit is None and not self._closed:
+                        self._cond.wait()
+                        unit = self._pick(worker)
+                if unit is None:
+                    return
+                if unit.attempts == 0 and not unit.future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    status, payload = self._execute(conn, worker, unit)
+                except (OSError, EOFError, TimeoutError) as error:
+                    self._lose(worker, unit, error)
+                    return
+                except Exception as error:  # pylint: disable=broad-except
+                    status, payload = "error", error
+                if status == "ok":
+                    unit.future.set_result(payload)
+                else:
+                    unit.future.set_exception(payload)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._cond:
+            self._closed = True
+            if cancel_futures:
+                for unit in self._pending:
+                    unit.future.cancel()
+                self._pending.clear()
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def worker_stats(self) -> pd.DataFrame:
+        """
+        Per-worker scheduling statistics.
+
+        Returns:
+            DataFrame with liveness, units run, bytes shipped and datasets held
+        """
+        return pd.DataFrame([{
+            "address": f"{worker.address[0]}:{worker.address[1]}",
+            "alive": worker.alive,
+            "units": worker.units,
+            "shipped_bytes": worker.shipped_bytes,
+            "datasets_held": len(worker.held),
+            "error": worker.error,
+        } for worker in self.workers])
+
+
+EXECUTORS = {executor.name: executor for executor in
+             (ThreadWorkExecutor, ProcessWorkExecutor, SocketWorkExecutor)}
+
+
+def get_executor(backend: str = "thread", **options: Any) -> WorkExecutor:
+    """
+    Create an executor by backend name.
+
+    Args:
+        backend: "thread", "process" or "socket"
+        **options: Backend constructor arguments (``addresses`` for "socket")
+
+    Returns:
+        WorkExecutor instance
+    """
+    if backend not in EXECUTORS:
+        raise ValueError(f"Unknown backend '{backend}'; use one of {sorted(EXECUTORS)}")
+    return EXECUTORS[backend](**options)
+
+
+def _rows(data: Any, index: np.ndarray) -> Any:
+    return data.iloc[index] if isinstance(data, (pd.DataFrame, pd.Series)) else data[index]
+
+
+def _fit_fold(estimator: Any, params: Dict[str, Any], X: Any, y: Any, train: np.ndarray,
+              test: np.ndarray, scoring: Optional[str]) -> float:
+    """Work unit: fit one candidate on one fold and score it."""
+    from sklearn.base import clone  # pylint: disable=import-outside-toplevel
+    from sklearn.metrics import check_scoring  # pylint: disable=import-outside-toplevel
+
+    model = clone(estimator).set_params(**params)
+    model.fit(_rows(X, train), _rows(y, train))
+    return float(check_scoring(model, scoring=scoring)(model, _rows(X, test), _rows(y, test)))
+
+
+def run_cv_trials(executor: WorkExecutor, estimator: Any, X: Any, y: Any,
+                  param_grid: Optional[Dict[str, Sequence[Any]]] = None, cv: Any = 5,
+                  scoring: Optional[str] = None) -> pd.DataFrame:
+    """
+    Cross-validate search candidates with one work unit per (candidate, fold).
+
+    ``X`` and ``y`` are registered once, so each worker receives them at
+    most once however many folds and candidates it runs.
+
+    Args:
+        executor: Backend to run on
+        estimator: Unfitted scikit-learn estimator
+        X: Features
+        y: Target
+        param_grid: Candidate grid (only ``estimator``'s own parameters when omitted)
+        cv: Folds or a scikit-learn splitter
+        scoring: Scorer name (estimator default if omitted)
+
+    Returns:
+        DataFrame with one row per candidate: params, mean_score, std_score, fold_scores
+    """
+    # pylint: disable=import-outside-toplevel
+    from sklearn.base import is_classifier
+    from sklearn.model_selection import ParameterGrid, check_cv
+
+    X_ref, y_ref = executor.put(X), executor.put(y)
+    splits = list(check_cv(cv, y, classifier=is_classifier(estimator)).split(X, y))
+    candidates = list(ParameterGrid(param_grid)) if param_grid else [{}]
+    futures = [[executor.submit(_fit_fold, estimator, params, X_ref, y_ref, train, test, scoring)
+                for train, test in splits] for params in candidates]
+    rows = []
+    for params, fold_futures in zip(candidates, futures):
+        scores = [future.result() for future in fold_futures]
+        rows.append({"params": params, "mean_score": float(np.mean(scores)),
+                     "std_score": float(np.std(scores)), "fold_scores": scores})
+    return pd.DataFrame(rows)
+
+
+def print_executor_report(executor: SocketWorkExecutor) -> None:
+    """
+    Print per-worker statistics of a socket executor.
+
+    Args:
+        executor: Socket executor
+    """
+    print("\n🛰️ SOCKET WORKERS")
+    print("-" * 50)
+    for _, row in executor.worker_stats().iterrows():
+        status = "✅" if row["alive"] else "❌"
+        print(f"{status} {row['address']}: {row['units']} units, "
+              f"{row['shipped_bytes'] / 1024 ** 2:.1f} MB shipped, "
+              f"{row['datasets_held']} datasets held")
+        if row["error"]:
+            print(f"   {row['error']}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run a socket worker daemon (authkey read from ``QUIPU_WORKER_AUTHKEY``)."""
+    parser = argparse.ArgumentParser(description="quipu_analytics socket worker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-cache-mb", type=int, default=2048)
+    options = parser.parse_args(argv)
+    authkey = os.environ.get(AUTHKEY_VARIABLE)
+    if not authkey:
+        parser.error(f"set {AUTHKEY_VARIABLE} to the secret shared with the clients")
+    server = WorkerServer((options.host, options.port), authkey.encode(),
+                          options.max_cache_mb * 1024 ** 2)
+    print(f"🛰️ Worker listening on {server.address[0]}:{server.address[1]}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
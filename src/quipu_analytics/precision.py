@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Suite-Wide Floating-Point Precision Policy
+
+This module holds a global float precision ("float64" by default, or
+"float32") that the suite's data paths follow: ``load_dataset`` casts
+float columns to it, ``generate`` casts the output of synthetic data
+generators, and ``wrap_estimator`` prepends a cast step so scikit-learn
+estimators that preserve float32 (scalers, PCA, k-NN, k-means, MLP) run in
+single precision end to end. The policy is set with ``set_precision`` or
+through ``set_reproducible_environment(precision=...)``. It is exported as
+``QUIPU_PRECISION`` so subprocesses and worker pools inherit it.
+``precision_drift`` replays the key-metric pipelines of the notebooks under
+both precisions and reports how far each metric moves.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import contextlib
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+PRECISION_VARIABLE = "QUIPU_PRECISION"
+PRECISIONS = ("float64", "float32")
+
+
+def _validate(precision: Union[str, type, np.dtype]) -> np.dtype:
+    dtype = np.dtype(precision)
+    if dtype.name not in PRECISIONS:
+        raise ValueError(f"Unsupported precision '{dtype.name}'; use one of {PRECISIONS}")
+    return dtype
+
+
+_PRECISION = _validate(os.environ.get(PRECISION_VARIABLE, "float64"))
+
+
+def set_precision(precision: Union[str, type, np.dtype] = "float32") -> None:
+    """
+    Set the suite-wide float precision.
+
+    The initial value comes from the ``QUIPU_PRECISION`` environment variable,
+    which is updated so child processes follow the same policy.
+
+    Args:
+        precision: "float64" or "float32"
+    """
+    global _PRECISION  # pylint: disable=global-statement
+    _PRECISION = _validate(precision)
+    os.environ[PRECISION_VARIABLE] = _PRECISION.name
+
+
+def get_precision() -> np.dtype:
+    """
+    Current float precision.
+
+    Returns:
+        ``np.dtype('float64')`` or ``np.dtype('float32')``
+    """
+    return _PRECISION
+
+
+@contextlib.contextmanager
+def precision_scope(precision: Union[str, type, np.dtype]) -> Iterator[np.dtype]:
+    """
+    Temporarily switch the precision policy.
+
+    Args:
+        precision: Precision used inside the block
+
+    Yields:
+        The active dtype
+    """
+    global _PRECISION  # pylint: disable=global-statement
+    previous, previous_variable = _PRECISION, os.environ.get(PRECISION_VARIABLE)
+    set_precision(precision)
+    try:
+        yield _PRECISION
+    finally:
+        _PRECISION = previous
+        if previous_variable is None:
+            os.environ.pop(PRECISION_VARIABLE, None)
+        else:
+            os.environ[PRECISION_VARIABLE] = previous_variable
+
+
+def as_precision(data: Any, precision: Optional[Union[str, type, np.dtype]] = None) -> Any:
+    """
+    Cast the floating-point parts of ``data`` to the policy precision.
+
+    Integer, boolean, categorical and text data are left unchanged, and
+    nothing is copied when the data is already in the target precision.
+
+    Args:
+        data: NumPy array, DataFrame, Series or SciPy sparse matrix
+        precision: Target precision (the policy by default)
+
+    Returns:
+        Data in the target precision (other objects are returned as-is)
+    """
+    dtype = get_precision() if precision is None else _validate(precision)
+    if isinstance(data, pd.DataFrame):
+        columns = {column: dtype for column, column_dtype in data.dtypes.items()
+                   if pd.api.types.is_float_dtype(column_dtype) and column_dtype != dtype}
+        return data.astype(columns) if columns else data
+    if isinstance(data, pd.Series):
+        return data.astype(dtype) if pd.api.types.is_float_dtype(data.dtype) \
+            and data.dtype != dtype else data
+    data_dtype = getattr(data, "dtype", None)
+    if data_dtype is not None and np.issubdtype(data_dtype, np.floating) and data_dtype != dtype:
+        return data.astype(dtype)
+    return data
+
+
+def generate(generator: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call a synthetic data generator and cast its float outputs.
+
+    Args:
+        generator: For example ``sklearn.datasets.make_classification``
+        *args: Generator arguments
+        **kwargs: Generator keyword arguments
+
+    Returns:
+        Generator output with float arrays in the policy precision (integer
+        labels keep their dtype)
+    """
+    output = generator(*args, **kwargs)
+    if isinstance(output, tuple):
+        return tuple(as_precision(part) for part in output)
+    return as_precision(output)
+
+
+def wrap_estimator(estimator: Any, precision: Optional[Union[str, type, np.dtype]] = None
+                   ) -> Any:
+    """
+    Prepend a cast to the policy precision to a scikit-learn estimator.
+
+    Args:
+        estimator: Estimator or pipeline
+        precision: Fixed precision (the policy at wrap time by default)
+
+    Returns:
+        ``Pipeline`` of a ``FunctionTransformer`` cast and ``estimator``
+    """
+    # pylint: disable=import-outside-toplevel
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import FunctionTransformer
+
+    dtype = get_precision() if precision is None else _validate(precision)
+    cast = FunctionTransformer(as_precision, kw_args={"precision": dtype.name},
+                               feature_names_out="one-to-one")
+    return make_pipeline(cast, estimator)
+
+
+def _split(X: Any, y: Any) -> Any:
+    from sklearn.model_selection import train_test_split  # pylint: disable=import-outside-toplevel
+    return train_test_split(X, y, test_size=0.2, random_state=42)
+
+
+def _knn_metrics() -> Dict[str, float]:
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_classification, make_regression
+    from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.pipeline import make_pipeline
+
+    X, y = generate(make_classification, n_samples=1000, n_features=8, n_informative=6,
+                    n_classes=4, random_state=42)
+    X_train, X_test, y_train, y_test = _split(X, y)
+    classifier = wrap_estimator(make_pipeline(StandardScaler(), KNeighborsClassifier(5)))
+    X, y = generate(make_regression, n_samples=1000, n_features=8, noise=10.0, random_state=42)
+    X_reg_train, X_reg_test, y_reg_train, y_reg_test = _split(X, y)
+    regressor = wrap_estimator(make_pipeline(StandardScaler(), KNeighborsRegressor(5)))
+    return {"accuracy": classifier.fit(X_train, y_train).score(X_test, y_test),
+            "r2": regressor.fit(X_reg_train, y_reg_train).score(X_reg_test, y_reg_test)}
+
+
+def _svm_metrics() -> Dict[str, float]:
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_circles, make_classification
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.svm import SVC
+
+    X, y = generate(make_circles, n_samples=1000, noise=0.1, factor=0.5, random_state=42)
+    X_train, X_test, y_train, y_test = _split(X, y)
+    rbf = wrap_estimator(make_pipeline(StandardScaler(), SVC(kernel="rbf", random_state=42)))
+    X, y = generate(make_classification, n_samples=1000, n_features=10, random_state=42)
+    X_lin_train, X_lin_test, y_lin_train, y_lin_test = _split(X, y)
+    linear = wrap_estimator(make_pipeline(StandardScaler(),
+                                          SVC(kernel="linear", random_state=42)))
+    return {"rbf_accuracy": rbf.fit(X_train, y_train).score(X_test, y_test),
+            "linear_accuracy": linear.fit(X_lin_train, y_lin_train).score(X_lin_test, y_lin_test)}
+
+
+def _logistic_metrics() -> Dict[str, float]:
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_classification
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import roc_auc_score
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    X, y = generate(make_classification, n_samples=500, n_features=10, random_state=42)
+    X_train, X_test, y_train, y_test = _split(X, y)
+    model = wrap_estimator(make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000)))
+    model.fit(X_train, y_train)
+    return {"accuracy": model.score(X_test, y_test),
+            "roc_auc": roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])}
+
+
+def _mlp_metrics() -> Dict[str, float]:
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_classification
+    from sklearn.neural_network import MLPClassifier
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    X, y = generate(make_classification, n_samples=1000, n_features=20, n_informative=12,
+                    n_classes=3, random_state=42)
+    X_train, X_test, y_train, y_test = _split(X, y)
+    model = wrap_estimator(make_pipeline(StandardScaler(), MLPClassifier(
+        hidden_layer_sizes=(100, 50), max_iter=300, early_stopping=True, random_state=42)))
+    return {"accuracy": model.fit(X_train, y_train).score(X_test, y_test)}
+
+
+def _pca_metrics() -> Dict[str, float]:
+    # pylint: disable=import-outside-toplevel
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    rng = np.random.RandomState(42)
+    latent = rng.normal(size=(1500, 4))
+    X = as_precision(latent @ rng.normal(size=(4, 12)) + 0.3 * rng.normal(size=(1500, 12)))
+    scaled = StandardScaler().fit_transform(X)
+    pca = PCA().fit(scaled)
+    reduced = PCA(n_components=0.95).fit(scaled)
+    reconstruction = reduced.inverse_transform(reduced.transform(scaled))
+    return {"explained_variance_3": float(pca.explained_variance_ratio_[:3].sum()),
+            "components_95": float(reduced.n_components_),
+            "reconstruction_mse": float(np.mean((scaled - reconstruction) ** 2))}
+
+
+def _kmeans_metrics() -> Dict[str, float]:
+    # pylint: disable=import-outside-toplevel
+    from sklearn.cluster import KMeans
+    from sklearn.datasets import make_blobs
+    from sklearn.metrics import silhouette_score
+    from sklearn.preprocessing import StandardScaler
+
+    X, _ = generate(make_blobs, n_samples=1000, centers=4, n_features=5, random_state=42)
+    scaled = StandardScaler().fit_transform(X)
+    model = KMeans(n_clusters=4, init="k-means++", n_init=10, random_state=42).fit(scaled)
+    return {"silhouette": float(silhouette_score(scaled, model.labels_)),
+            "inertia_per_sample": float(model.inertia_ / len(scaled))}
+
+
+DRIFT_RECIPES: Dict[str, Callable[[], Dict[str, float]]] = {
+    "Tier2_kNN": _knn_metrics,
+    "Tier2_SVM": _svm_metrics,
+    "Tier2_LogisticRegression": _logistic_metrics,
+    "Tier2_NeuralNetworks": _mlp_metrics,
+    "Tier4_PCA": _pca_metrics,
+    "Tier4_kMeans": _kmeans_metrics,
+}
+
+
+def precision_drift(notebooks: Optional[Sequence[str]] = None,
+                    precisions: Sequence[str] = PRECISIONS) -> pd.DataFrame:
+    """
+    Compare each notebook's key metrics across precisions.
+
+    Every recipe in ``DRIFT_RECIPES`` rebuilds a notebook's main pipeline
+    (same generators, sizes and estimators) and runs it once per precision,
+    after an untimed warm-up run that absorbs import costs.
+
+    Args:
+        notebooks: Recipe names (all by default)
+        precisions: Precisions to run; the first is the reference
+
+    Returns:
+        DataFrame with one row per (notebook, metric): the value under each
+        precision, absolute and relative drift from the reference, and the
+        recipe's run time per precision
+    """
+    notebooks = list(notebooks or DRIFT_RECIPES)
+    reference = _validate(precisions[0]).name
+    rows = []
+    for notebook in notebooks:
+        values, seconds = {}, {}
+        DRIFT_RECIPES[notebook]()
+        for precision in precisions:
+            name = _validate(precision).name
+            with precision_scope(name):
+                start = time.perf_counter()
+                values[name] = DRIFT_RECIPES[notebook]()
+                seconds[name] = time.perf_counter() - start
+        for metric, expected in values[reference].items():
+            row = {"notebook": notebook, "metric": metric}
+            for name in values:
+                row[name] = values[name][metric]
+            drift = max(abs(values[name][metric] - expected) for name in values)
+            row["abs_drift"] = drift
+            row["rel_drift"] = drift / abs(expected) if expected else float(drift > 0)
+            row.update({f"{name}_seconds": seconds[name] for name in seconds})
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def print_drift_report(drift: pd.DataFrame, tolerance: float = 0.01) -> None:
+    """
+    Print the output of ``precision_drift``.
+
+    Args:
+        drift: Drift table
+        tolerance: Relative drift above which a metric is flagged
+    """
+    print("\n🎚️ PRECISION DRIFT REPORT")
+    print("-" * 50)
+    reference, *others = [c for c in drift.columns if c in PRECISIONS]
+    for notebook, rows in drift.groupby("notebook", sort=False):
+        print(f"📓 {notebook}")
+        for _, row in rows.iterrows():
+            status = "⚠️" if row["rel_drift"] > tolerance else "✅"
+            values = ", ".join(f"{name}={row[name]:.4f}" for name in others)
+            print(f"   {status} {row['metric']}: {reference}={row[reference]:.4f}, {values} "
+                  f"(drift {row['rel_drift']:.2%})")
+    flagged = int((drift["rel_drift"] > tolerance).sum())
+    print(f"\n{len(drift) - flagged}/{len(drift)} metrics within {tolerance:.0%}")
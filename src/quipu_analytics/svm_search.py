@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+SVM Hyperparameter Search with Gram-Matrix Reuse
+
+This module runs the C/gamma/kernel grid searches of the SVM notebooks
+without recomputing kernels for every candidate. The linear Gram matrix
+``X @ X.T`` is computed once per dataset in row blocks and kept in a
+size-bounded ``GramStore``. Each fold's train and test kernels for a given
+(kernel, gamma, degree, coef0) are derived from slices of it: RBF from the
+squared distances ``|x|^2 + |y|^2 - 2 x.y``, and polynomial/sigmoid from
+the dot products. Every C (and SVR epsilon) value is then fitted with
+``kernel="precomputed"``. ``gamma="scale"`` is resolved on each training
+fold, as ``SVC`` does, so scores match ``GridSearchCV``. Inputs too large for
+an exact Gram matrix fall back to Nyström or random Fourier features with a
+linear solver.
+
+Author: Brandon Deloatch
+Affiliation: Quipu Research Labs, LLC
+Date: 2026-10-18
+Version: v1.3
+"""
+
+import collections
+import hashlib
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .model_store import data_fingerprint
+
+KERNEL_PARAMS = ("kernel", "gamma", "degree", "coef0")
+
+
+class GramStore:
+    """
+    Byte-bounded LRU of kernel matrices shared between searches.
+
+    Args:
+        max_bytes: Total size of cached arrays
+    """
+
+    def __init__(self, max_bytes: int = 1024 ** 3):
+        self.max_bytes = max_bytes
+        self._entries: "collections.OrderedDict[tuple, Any]" = collections.OrderedDict()
+        self._sizes: Dict[tuple, int] = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, computing and storing it on a miss.
+
+        Values larger than ``max_bytes`` are returned without being cached.
+
+        Args:
+            key: Hashable cache key
+            compute: Callable producing an array or tuple of arrays
+
+        Returns:
+            Cached or freshly computed value
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        value = compute()
+        size = sum(part.nbytes for part in (value if isinstance(value, tuple) else (value,)))
+        if size <= self.max_bytes:
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted)
+                self.evictions += 1
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dict with entries, bytes, hits, misses and evictions
+        """
+        return {"entries": len(self._entries), "bytes": self.nbytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+def linear_gram(X: np.ndarray, block_size: int = 2048) -> np.ndarray:
+    """
+    ``X @ X.T`` computed one row block at a time into a preallocated array.
+
+    Args:
+        X: Feature matrix
+        block_size: Rows per block
+
+    Returns:
+        (n_samples, n_samples) float64 Gram matrix
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    gram = np.empty((len(X), len(X)), dtype=np.float64)
+    for start in range(0, len(X), block_size):
+        np.dot(X[start:start + block_size], X.T, out=gram[start:start + block_size])
+    return gram
+
+
+def _resolve_gamma(gamma: Union[str, float], X_train: np.ndarray) -> float:
+    """Numeric gamma as ``SVC`` computes it from the training data."""
+    if gamma == "scale":
+        variance = X_train.var()
+        return 1.0 / (X_train.shape[1] * variance) if variance != 0 else 1.0
+    if gamma == "auto":
+        return 1.0 / X_train.shape[1]
+    return float(gamma)
+
+
+def _effective_params(params: Dict[str, Any], gamma: float) -> Tuple:
+    """Kernel parameters that actually affect the kernel values."""
+    kernel = params["kernel"]
+    if kernel == "linear":
+        return ("linear",)
+    if kernel == "rbf":
+        return ("rbf", gamma)
+    if kernel == "poly":
+        return ("poly", gamma, float(params["coef0"]), int(params["degree"]))
+    if kernel == "sigmoid":
+        return ("sigmoid", gamma, float(params["coef0"]))
+    raise ValueError(f"Unsupported kernel '{kernel}'; use linear, rbf, poly or sigmoid")
+
+
+def _kernel_block(gram: np.ndarray, effective: Tuple, sq_rows: np.ndarray,
+                  sq_cols: np.ndarray) -> np.ndarray:
+    """Kernel values from a block of dot products (modified in place)."""
+    kernel = effective[0]
+    if kernel == "linear":
+        return gram
+    gamma = effective[1]
+    if kernel == "rbf":
+        gram *= -2.0
+        gram += sq_rows[:, None]
+        gram += sq_cols[None, :]
+        np.maximum(gram, 0.0, out=gram)
+        gram *= -gamma
+        return np.exp(gram, out=gram)
+    gram *= gamma
+    gram += effective[2]
+    if kernel == "poly":
+        return np.power(gram, effective[3], out=gram)
+    return np.tanh(gram, out=gram)
+
+
+def _fold_kernels(gram: np.ndarray, train: np.ndarray, test: np.ndarray,
+                  effective: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+    sq = np.diagonal(gram)
+    k_train = _kernel_block(gram[np.ix_(train, train)], effective, sq[train], sq[train])
+    k_test = _kernel_block(gram[np.ix_(test, train)], effective, sq[test], sq[train])
+    return k_train, k_test
+
+
+class SVMGridSearch:
+    """
+    Grid search for ``SVC``/``SVR`` that computes kernels once per fold and kernel setting.
+
+    Args:
+        estimator: Unfitted ``SVC`` or ``SVR`` (fixed settings such as
+            ``class_weight`` are kept)
+        param_grid: Grid (or list of grids) as for ``GridSearchCV``; kernel
+            parameters are ``kernel``, ``gamma``, ``degree`` and ``coef0``,
+            everything else (``C``, ``epsilon``, ...) is fitted on the shared kernels
+        cv: Folds or a scikit-learn splitter
+        scoring: Scorer name (estimator default if omitted)
+        store: Kernel cache, shareable between searches on the same data
+        block_size: Rows per block when computing the Gram matrix
+        max_exact_samples: Sample count above which the approximation is used
+        approximation: "nystroem" or "rff" (random Fourier features, RBF only)
+        n_components: Feature-map size of the approximation
+        refit: Refit the best candidate on the full data
+        random_state: Seed for the approximation and the linear solver
+    """
+
+    def __init__(self, estimator: Any = None,
+                 param_grid: Union[Dict[str, Sequence[Any]], List[Dict[str, Sequence[Any]]],
+                                   None] = None,
+                 cv: Any = 5, scoring: Optional[str] = None,
+                 store: Optional[GramStore] = None, block_size: int = 2048,
+                 max_exact_samples: int = 20_000, approximation: str = "nystroem",
+                 n_components: int = 500, refit: bool = True, random_state: int = 42):
+        if approximation not in ("nystroem", "rff"):
+            raise ValueError(f"Unknown approximation '{approximation}'; use 'nystroem' or 'rff'")
+        if estimator is None:
+            from sklearn.svm import SVC  # pylint: disable=import-outside-toplevel
+            estimator = SVC()
+        self.estimator = estimator
+        self.param_grid = param_grid or {"C": [0.1, 1, 10, 100]}
+        self.cv = cv
+        self.scoring = scoring
+        self.store = store if store is not None else GramStore()
+        self.block_size = block_size
+        self.max_exact_samples = max_exact_samples
+        self.approximation = approximation
+        self.n_components = n_components
+        self.refit = refit
+        self.random_state = random_state
+
+    def _use_exact(self, n_samples: int) -> bool:
+        return n_samples <= self.max_exact_samples and n_samples ** 2 * 8 <= self.store.max_bytes
+
+    def _scorer(self) -> Callable:
+        from sklearn.metrics import check_scoring  # pylint: disable=import-outside-toplevel
+        return check_scoring(self.estimator, scoring=self.scoring)
+
+    def _feature_map(self, effective: Tuple, n_train: int) -> Any:
+        # pylint: disable=import-outside-toplevel
+        from sklearn.kernel_approximation import Nystroem, RBFSampler
+
+        if self.approximation == "rff" and effective[0] == "rbf":
+            return RBFSampler(gamma=effective[1], n_components=self.n_components,
+                              random_state=self.random_state)
+        options = {"gamma": effective[1]}
+        if effective[0] in ("poly", "sigmoid"):
+            options["coef0"] = effective[2]
+        if effective[0] == "poly":
+            options["degree"] = effective[3]
+        return Nystroem(kernel=effective[0], n_components=min(self.n_components, n_train),
+                        random_state=self.random_state, **options)
+
+    def _linear_model(self, solver_params: Dict[str, Any]) -> Any:
+        # pylint: disable=import-outside-toplevel
+        from sklearn.base import is_classifier
+        from sklearn.svm import LinearSVC, LinearSVR
+
+        settings = {**self.estimator.get_params(), **solver_params}
+        if is_classifier(self.estimator):
+            return LinearSVC(C=settings["C"], class_weight=settings.get("class_weight"),
+                             random_state=self.random_state)
+        return LinearSVR(C=settings["C"], epsilon=settings.get("epsilon", 0.0),
+                         random_state=self.random_state)
+
+    def fit(self, X: Any, y: Any) -> "SVMGridSearch":
+        """
+        Evaluate every candidate with cross-validation.
+
+        Args:
+            X: Features
+            y: Target
+
+        Returns:
+            The fitted search; results are in ``cv_results_`` and ``best_*``
+        """
+        # pylint: disable=import-outside-toplevel
+        from sklearn.base import clone, is_classifier
+        from sklearn.model_selection import ParameterGrid, check_cv
+        from sklearn.pipeline import make_pipeline
+
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.asarray(y)
+        splits = list(check_cv(self.cv, y, classifier=is_classifier(self.estimator)).split(X, y))
+        candidates = list(ParameterGrid(self.param_grid))
+        defaults = self.estimator.get_params()
+        groups: Dict[Tuple, List[int]] = collections.OrderedDict()
+        for index, candidate in enumerate(candidates):
+            key = tuple(candidate.get(name, defaults[name]) for name in KERNEL_PARAMS)
+            groups.setdefault(key, []).append(index)
+
+        self.method_ = "exact" if self._use_exact(len(X)) else self.approximation
+        scorer = self._scorer()
+        scores = np.zeros((len(candidates), len(splits)))
+        fit_seconds = np.zeros(len(candidates))
+        start = time.perf_counter()
+        kernel_seconds = 0.0
+        if self.method_ == "exact":
+            fingerprint = data_fingerprint(X)
+            tick = time.perf_counter()
+            gram = self.store.get_or_compute((fingerprint, "linear_gram"),
+                                             lambda: linear_gram(X, self.block_size))
+            kernel_seconds += time.perf_counter() - tick
+
+        for fold, (train, test) in enumerate(splits):
+            fold_key = hashlib.blake2b(train.tobytes(), digest_size=16).hexdigest()
+            for kernel_key, members in groups.items():
+                params = dict(zip(KERNEL_PARAMS, kernel_key))
+                effective = _effective_params(params, _resolve_gamma(params["gamma"], X[train]))
+                tick = time.perf_counter()
+                if self.method_ == "exact":
+                    features_train, features_test = self.store.get_or_compute(
+                        (fingerprint, fold_key, effective),
+                        lambda: _fold_kernels(gram, train, test, effective))
+                elif effective[0] == "linear":
+                    features_train, features_test = X[train], X[test]
+                else:
+                    feature_map = self._feature_map(effective, len(train))
+                    features_train = feature_map.fit_transform(X[train])
+                    features_test = feature_map.transform(X[test])
+                kernel_seconds += time.perf_counter() - tick
+
+                for index in members:
+                    solver_params = {name: value for name, value in candidates[index].items()
+                                     if name not in KERNEL_PARAMS}
+                    tick = time.perf_counter()
+                    if self.method_ == "exact":
+                        model = clone(self.estimator).set_params(kernel="precomputed",
+                                                                 **solver_params)
+                    else:
+                        model = self._linear_model(solver_params)
+                    model.fit(features_train, y[train])
+                    scores[index, fold] = scorer(model, features_test, y[test])
+                    fit_seconds[index] += time.perf_counter() - tick
+
+        results = pd.DataFrame({"params": candidates,
+                                "mean_test_score": scores.mean(axis=1),
+                                "std_test_score": scores.std(axis=1),
+                                "mean_fit_seconds": fit_seconds / len(splits)})
+        for fold in range(len(splits)):
+            results[f"split{fold}_test_score"] = scores[:, fold]
+        results["rank_test_score"] = results["mean_test_score"].rank(
+            ascending=False, method="min").astype(int)
+        self.cv_results_ = results
+        best = int(np.argmax(scores.mean(axis=1)))
+        self.best_index_ = best
+        self.best_params_ = candidates[best]
+        self.best_score_ = float(results["mean_test_score"].iloc[best])
+        self.kernel_seconds_ = kernel_seconds
+        self.search_seconds_ = time.perf_counter() - start
+
+        if self.refit:
+            params = {**defaults, **self.best_params_}
+            if self.method_ == "exact":
+                self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+            else:
+                effective = _effective_params(params, _resolve_gamma(params["gamma"], X))
+                solver_params = {name: value for name, value in self.best_params_.items()
+                                 if name not in KERNEL_PARAMS}
+                steps = [] if effective[0] == "linear" else [self._feature_map(effective, len(X))]
+                self.best_estimator_ = make_pipeline(*steps, self._linear_model(solver_params))
+            self.best_estimator_.fit(X, y)
+        return self
+
+    def predict(self, X: Any) -> np.ndarray:
+        """
+        Predict with the refitted best estimator.
+
+        Args:
+            X: Features
+
+        Returns:
+            Predictions
+        """
+        return self.best_estimator_.predict(X)
+
+    def score(self, X: Any, y: Any) -> float:
+        """
+        Score the refitted best estimator with the search's scorer.
+
+        Args:
+            X: Features
+            y: Target
+
+        Returns:
+            Score
+        """
+        return float(self._scorer()(self.best_estimator_, X, y))
+
+
+def print_search_report(search: SVMGridSearch, top: int = 5) -> None:
+    """
+    Print the best candidates of a fitted ``SVMGridSearch``.
+
+    Args:
+        search: Fitted search
+        top: Number of candidates to list
+    """
+    print("\n🧮 SVM GRID SEARCH")
+    print("-" * 50)
+    results = search.cv_results_.sort_values("rank_test_score")
+    print(f"Method: {search.method_}, {len(results)} candidates, "
+          f"{search.search_seconds_:.2f}s ({search.kernel_seconds_:.2f}s in kernels)")
+    for _, row in results.head(top).iterrows():
+        print(f"   #{row['rank_test_score']} {row['params']}: "
+              f"{row['mean_test_score']:.4f} ± {row['std_test_score']:.4f}")
+    stats = search.store.stats()
+    print(f"Gram store: {stats['entries']} matrices, {stats['bytes'] / 1024 ** 2:.1f} MB, "
+          f"{stats['hits']} hits / {stats['misses']} misses, {stats['evictions']} evictions")
@@ -0,0 +1,72 @@
+"""Tests for the benchmark runner and its commit-keyed history."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import runner  # noqa: E402
+
+FAKE_BENCH = '''
+class Scaled:
+    params = [10, 100]
+
+    def setup(self, n):
+        self.values = list(range(n))
+
+    def time_sum(self, n):
+        sum(self.values)
+
+
+class Optional:
+    def setup(self):
+        raise NotImplementedError("missing dependency")
+
+    def time_never(self):
+        pass
+
+
+def time_noop():
+    pass
+'''
+
+
+def _fake_suite(tmp_path):
+    bench_dir = tmp_path / "fake_bench_suite"
+    bench_dir.mkdir()
+    (bench_dir / "__init__.py").write_text("")
+    (bench_dir / "bench_fake.py").write_text(FAKE_BENCH)
+    return bench_dir
+
+
+def test_discovery_expands_parameters(tmp_path):
+    """Classes, parameters and module-level functions become named cases."""
+    names = [name for name, *_ in runner.discover(_fake_suite(tmp_path))]
+    assert names == ["bench_fake.Scaled.time_sum[10]", "bench_fake.Scaled.time_sum[100]",
+                     "bench_fake.Optional.time_never", "bench_fake.time_noop"]
+
+
+def test_run_records_history_and_compare_flags_regressions(tmp_path):
+    """Runs are stored per commit and slowdowns beyond the threshold are flagged."""
+    bench_dir = _fake_suite(tmp_path)
+    history_path = tmp_path / "history.json"
+    entry = runner.run(history_path, name_filter="Scaled", repeat=1, commit="base",
+                       bench_dir=bench_dir)
+    runner.run(history_path, name_filter="Optional", repeat=1, commit="base",
+               bench_dir=bench_dir)
+    assert entry["results"]["bench_fake.Scaled.time_sum[10]"]["status"] == "ok"
+
+    history = runner.load_history(history_path)
+    assert history["base"]["results"]["bench_fake.Optional.time_never"]["status"] == "skipped"
+    assert len(history["base"]["results"]) == 3
+
+    head = {name: dict(result) for name, result in history["base"]["results"].items()}
+    head["bench_fake.Scaled.time_sum[10]"]["median"] *= 2.0
+    head["bench_fake.Scaled.time_sum[100]"]["median"] *= 1.05
+    history["head"] = {"results": head}
+
+    statuses = {row["name"]: row["status"]
+                for row in runner.compare(history, "base", "head", threshold=0.10)}
+    assert statuses == {"bench_fake.Scaled.time_sum[10]": "regression",
+                        "bench_fake.Scaled.time_sum[100]": "unchanged",
+                        "bench_fake.Optional.time_never": "skipped"}
@@ -0,0 +1,107 @@
+"""Tests for the unified gradient-boosting harness."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.boosting_harness import (  # noqa: E402
+    BACKENDS,
+    BoostingBackend,
+    BoostingHarness,
+    available_backends,
+    thread_budget,
+    throughput_comparison,
+)
+
+
+def _data(n_samples=1500, seed=0):
+    X, y = make_classification(n_samples=n_samples, n_features=12, n_informative=6,
+                               random_state=seed)
+    return pd.DataFrame(X, columns=[f"f{i}" for i in range(12)]), y
+
+
+def test_thread_budget_splits_cores():
+    """Concurrent trials share the thread pool without oversubscription."""
+    assert thread_budget(4, total_threads=16) == 4
+    assert thread_budget(8, total_threads=4) == 1
+    assert thread_budget() >= 1
+
+
+def test_search_reuses_fold_datasets():
+    """Datasets are built once per fold and worker slot, not per trial."""
+    X, y = _data()
+    harness = BoostingHarness("sklearn", X, y, n_splits=3)
+    results = harness.search({"learning_rate": [0.05, 0.2], "max_leaf_nodes": [7, 15]},
+                             n_parallel_trials=2, num_boost_round=200,
+                             early_stopping_rounds=10, total_threads=2)
+    assert len(results) == 4
+    assert harness.datasets_built == 3 * 2
+    assert results["logloss"].is_monotonic_increasing
+    assert (results["n_threads"] == 1).all()
+    assert any(max(iterations) < 200 for iterations in results["best_iterations"])
+    assert results["auc"].min() > 0.85
+
+
+def test_sklearn_backend_before_validation_set_support(monkeypatch):
+    """Without fit(X_val=...), warm-started trees are early-stopped on the same split."""
+    from quipu_analytics import boosting_harness  # pylint: disable=import-outside-toplevel
+
+    X, y = _data()
+    native = BoostingHarness("sklearn", X, y, n_splits=3).search(
+        {"learning_rate": [0.2]}, num_boost_round=200, early_stopping_rounds=10)
+    monkeypatch.setattr(boosting_harness, "_fit_accepts_validation_set", lambda _: False)
+    fallback = BoostingHarness("sklearn", X, y, n_splits=3).search(
+        {"learning_rate": [0.2]}, num_boost_round=200, early_stopping_rounds=10)
+    assert list(fallback["best_iterations"][0]) == list(native["best_iterations"][0])
+    assert max(fallback["best_iterations"][0]) < 200
+    assert fallback["auc"][0] == pytest.approx(native["auc"][0])
+
+
+def test_unavailable_backend_is_rejected():
+    """Unknown names and missing libraries raise clear errors."""
+    X, y = _data(200)
+    with pytest.raises(ValueError):
+        BoostingHarness("gbm", X, y)
+    missing = [name for name in BACKENDS if name not in available_backends()]
+    for name in missing:
+        with pytest.raises(ImportError):
+            BoostingHarness(name, X, y)
+
+
+def test_incomplete_backend_fails_on_creation():
+    """An adapter missing part of the interface cannot be instantiated."""
+    class PartialBackend(BoostingBackend):
+        def build(self, X, y, reference=None):
+            return X
+
+    with pytest.raises(TypeError):
+        PartialBackend()
+
+
+@pytest.mark.parametrize("backend", ["xgboost", "lightgbm", "catboost"])
+def test_native_backends(backend):
+    """Native libraries train early-stopped folds from reused datasets."""
+    pytest.importorskip(backend)
+    X, y = _data()
+    harness = BoostingHarness(backend, X, y, n_splits=3)
+    result = harness.cross_validate({"learning_rate": 0.1}, num_boost_round=300,
+                                    early_stopping_rounds=20)
+    harness.cross_validate({"learning_rate": 0.3}, num_boost_round=300,
+                           early_stopping_rounds=20)
+    assert harness.datasets_built == 3
+    assert result["auc"] > 0.85
+
+
+def test_throughput_comparison_reports_every_backend():
+    """The comparison has one scored row per installed backend."""
+    X, y = _data()
+    report = throughput_comparison(X, y, num_boost_round=100, early_stopping_rounds=10)
+    assert list(report["backend"]) == available_backends()
+    assert (report["train_rows_per_second"] > 0).all()
+    assert (report["auc"] > 0.85).all()
@@ -0,0 +1,80 @@
+"""Tests for the fast k-selection utilities."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.cluster_selection import (  # noqa: E402
+    extend_centers,
+    k_sweep,
+    sampled_silhouette,
+    select_k,
+)
+
+
+def _customers(seed=42):
+    rng = np.random.default_rng(seed)
+    centers = np.array([[0, 0, 0], [6, 6, 0], [0, 6, 6], [6, 0, 6]])
+    return np.vstack([rng.normal(c, 1.0, size=(150, 3)) for c in centers])
+
+
+def test_full_sample_silhouette_is_exact():
+    """Sampling every row reproduces sklearn's silhouette with zero width."""
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import silhouette_score
+
+    X = _customers()
+    labels = KMeans(n_clusters=4, n_init=3, random_state=0).fit_predict(X)
+    result = sampled_silhouette(X, labels, sample_size=len(X))
+
+    assert abs(result["silhouette"] - silhouette_score(X, labels)) < 1e-10
+    assert result["ci_low"] == result["ci_high"]
+    chunked = sampled_silhouette(X, labels, sample_size=len(X), max_bytes=32 * 8 * 4 * len(X))
+    assert abs(chunked["silhouette"] - result["silhouette"]) < 1e-12
+
+
+def test_sampled_silhouette_interval_covers_exact():
+    """A partial sample brackets the exact silhouette."""
+    from sklearn.metrics import silhouette_score
+
+    X = _customers()
+    labels = np.repeat(np.arange(4), 150)
+    result = sampled_silhouette(X, labels, sample_size=200, random_state=3)
+
+    assert result["ci_low"] <= silhouette_score(X, labels) <= result["ci_high"]
+
+
+def test_extend_centers_keeps_previous_seeds():
+    """Warm starts reuse every center from the smaller fit."""
+    X = _customers()
+    previous = X[:2]
+    centers = extend_centers(X, previous, 5, np.random.default_rng(0))
+
+    assert centers.shape == (5, 3)
+    np.testing.assert_array_equal(centers[:2], previous)
+
+
+def test_parallel_sweep_selects_true_k():
+    """The warm-started parallel sweep finds the generating number of clusters."""
+    X = _customers()
+    results = k_sweep(X, range(2, 8), n_jobs=2, silhouette_sample_size=300,
+                      exact_check=True)
+
+    assert sorted(results) == list(range(2, 8))
+    assert select_k(results) == 4
+    assert select_k(results, "davies_bouldin") == 4
+    for row in results.values():
+        assert abs(row["silhouette_error"]) < 0.05
+
+
+def test_minibatch_path_for_large_inputs():
+    """Inputs above the threshold switch to mini-batch updates."""
+    X = _customers()
+    results = k_sweep(X, [3, 4], minibatch_threshold=100, batch_size=128,
+                      silhouette_sample_size=100)
+
+    assert all(row["minibatch"] for row in results.values())
+    assert results[4]["inertia"] < results[3]["inertia"]
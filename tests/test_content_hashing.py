@@ -0,0 +1,74 @@
+"""Tests for chunked, stat-cached content hashing."""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.content_hashing import (  # noqa: E402
+    HashCache,
+    hash_directory,
+    hash_file,
+)
+from quipu_analytics.execution_tracking import (  # noqa: E402
+    generate_execution_summary,
+    get_execution_metadata,
+)
+
+
+def test_chunked_digest_matches_and_stat_cache_skips_rehash(tmp_path):
+    """Chunked mmap hashing equals one-shot BLAKE2b; unchanged files hit the cache."""
+    payload = os.urandom(300_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(payload)
+    cache = HashCache(tmp_path / "hashes.json")
+
+    first = hash_file(path, cache, chunk_size=4096)
+    assert first["blake2b"] == hashlib.blake2b(payload, digest_size=32).hexdigest()
+    assert not first["cached"] and hash_file(path, cache)["cached"]
+    cache.save()
+
+    reloaded = HashCache(tmp_path / "hashes.json")
+    assert hash_file(path, reloaded)["cached"] and reloaded.misses == 0
+
+    path.write_bytes(payload[::-1])
+    changed = hash_file(path, reloaded)
+    assert not changed["cached"] and changed["blake2b"] != first["blake2b"]
+    assert hash_file(path, reloaded)["cached"]
+    assert len(reloaded._entries) == 1  # pylint: disable=protected-access
+    (tmp_path / "empty.bin").touch()
+    assert hash_file(tmp_path / "empty.bin")["blake2b"] == \
+        hashlib.blake2b(b"", digest_size=32).hexdigest()
+
+
+def test_directory_digest_tracks_names_and_contents(tmp_path):
+    """Parallel directory hashing covers nested files; any change alters the digest."""
+    (tmp_path / "nested").mkdir()
+    for index in range(6):
+        (tmp_path / ("nested" if index % 2 else ".") / f"part{index}.csv").write_text(
+            f"a\tb\n{index}\t{index * 2}\n")
+    cache = HashCache()
+    before = hash_directory(tmp_path, cache=cache, n_jobs=3)
+    assert len(before["files"]) == 6 and "nested/part1.csv" in before["files"]
+    assert hash_directory(tmp_path, cache=cache, n_jobs=3)["blake2b"] == before["blake2b"]
+    assert cache.hits == 6
+
+    (tmp_path / "nested" / "part1.csv").rename(tmp_path / "nested" / "renamed.csv")
+    assert hash_directory(tmp_path, cache=cache)["blake2b"] != before["blake2b"]
+
+
+def test_execution_summary_records_data_digests(tmp_path):
+    """Data source paths and extra files are fingerprinted in the summary."""
+    source = tmp_path / "sales.csv"
+    source.write_text("date\tmoney\n2024-03-01\t38.7\n")
+    summary = generate_execution_summary(
+        get_execution_metadata(),
+        data_sources={"sales": {"source": "local", "path": str(source)}},
+        data_files=[str(tmp_path)])["execution_summary"]
+    fingerprints = summary["data_fingerprints"]
+    assert fingerprints[str(source)]["blake2b"] == \
+        hashlib.blake2b(source.read_bytes(), digest_size=32).hexdigest()
+    directory = fingerprints[str(tmp_path)]
+    assert directory["files"] == {"sales.csv": fingerprints[str(source)]["blake2b"]}
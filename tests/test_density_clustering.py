@@ -0,0 +1,90 @@
+"""Tests for the density-based clustering utilities."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.density_clustering import (  # noqa: E402
+    GeoGridIndex,
+    build_neighbor_graph,
+    dbscan_from_graph,
+    dbscan_sweep,
+    haversine_distances,
+)
+
+
+def _blobs(seed=42):
+    rng = np.random.default_rng(seed)
+    centers = np.array([[0.0, 0.0], [4.0, 4.0], [0.0, 5.0]])
+    points = np.vstack([rng.normal(c, 0.5, size=(120, 2)) for c in centers])
+    noise = rng.uniform(-3, 8, size=(40, 2))
+    return np.vstack([points, noise])
+
+
+def test_sweep_matches_sklearn_dbscan():
+    """Labels from the shared graph equal a fresh DBSCAN fit per parameter pair."""
+    from sklearn.cluster import DBSCAN
+
+    X = _blobs()
+    eps_values = [0.2, 0.35, 0.5]
+    min_samples_values = [3, 5, 8]
+    results = dbscan_sweep(X, eps_values, min_samples_values)
+
+    for (eps, min_samples), result in results.items():
+        expected = DBSCAN(eps=eps, min_samples=min_samples).fit_predict(X)
+        np.testing.assert_array_equal(result["labels"], expected)
+        assert result["n_noise"] == int(np.sum(expected == -1))
+
+
+def test_kth_distances_match_nearest_neighbors():
+    """The sorted graph answers the k-distance plot without another search."""
+    from sklearn.neighbors import NearestNeighbors
+
+    X = _blobs()
+    graph = build_neighbor_graph(X, radius=20.0)
+    expected = NearestNeighbors(n_neighbors=4).fit(X).kneighbors(X)[0][:, 3]
+    np.testing.assert_allclose(graph.kth_distances(4), expected)
+
+
+def test_eps_above_graph_radius_rejected():
+    """Querying beyond the graph radius would silently drop neighbors."""
+    graph = build_neighbor_graph(_blobs(), radius=0.3)
+    with pytest.raises(ValueError):
+        graph.counts_within(0.5)
+    with pytest.raises(ValueError):
+        dbscan_from_graph(graph, 0.5, 5)
+    with pytest.raises(ValueError):
+        dbscan_sweep(_blobs(), [], [5])
+
+
+def test_geo_grid_matches_brute_force_haversine():
+    """Grid radius queries find exactly the brute-force haversine neighbors."""
+    rng = np.random.default_rng(0)
+    coords = np.column_stack([rng.uniform(40.5, 41.0, 500), rng.uniform(-74.3, -73.7, 500)])
+    # Points straddling the antimeridian must still see each other
+    coords = np.vstack([coords, [[10.0, 179.99], [10.0, -179.99]]])
+    radius_km = 3.0
+
+    graph = GeoGridIndex(coords, cell_km=radius_km).radius_graph()
+    full = haversine_distances(coords[:, None, 0], coords[:, None, 1],
+                               coords[None, :, 0], coords[None, :, 1])
+
+    for i in range(len(coords)):
+        row = slice(graph.indptr[i], graph.indptr[i + 1])
+        assert set(graph.indices[row]) == set(np.flatnonzero(full[i] <= radius_km))
+        assert np.all(np.diff(graph.distances[row]) >= 0)
+
+
+def test_haversine_sweep_clusters_store_locations():
+    """Geographic sweeps use kilometres and separate distant store clusters."""
+    rng = np.random.default_rng(1)
+    centers = [(40.7589, -73.9851), (40.6892, -74.0445)]
+    coords = np.vstack([np.column_stack([rng.normal(lat, 0.003, 100), rng.normal(lon, 0.003, 100)])
+                        for lat, lon in centers])
+
+    results = dbscan_sweep(coords, [1.0], [5], metric="haversine")
+    assert results[(1.0, 5)]["n_clusters"] == 2
@@ -0,0 +1,89 @@
+"""Tests for the out-of-core PCA utilities."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.dimensionality_reduction import StreamingPCA, iter_chunks  # noqa: E402
+
+
+def _features(n_samples=3000, seed=42):
+    rng = np.random.default_rng(seed)
+    latent = rng.standard_normal((n_samples, 3)) * [5.0, 3.0, 2.0]
+    mixing = rng.standard_normal((3, 12))
+    return latent @ mixing + 0.3 * rng.standard_normal((n_samples, 12)) + 10.0
+
+
+def _reference(X, n_components):
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    scaled = StandardScaler().fit_transform(X)
+    return PCA(n_components=n_components).fit(scaled), scaled
+
+
+def _assert_same_subspace(components, expected, atol):
+    for actual, target in zip(components, expected):
+        assert min(np.abs(actual - target).max(), np.abs(actual + target).max()) < atol
+
+
+@pytest.mark.parametrize("method", ["incremental", "randomized"])
+def test_streaming_matches_in_memory_pca(method):
+    """Chunked fits reproduce StandardScaler + PCA on the full matrix."""
+    X = _features()
+    reference, scaled = _reference(X, 3)
+    model = StreamingPCA(n_components=3, method=method, chunk_size=257).fit(X)
+
+    np.testing.assert_allclose(model.explained_variance_ratio_,
+                               reference.explained_variance_ratio_, rtol=1e-6)
+    _assert_same_subspace(model.components_, reference.components_, atol=1e-4)
+    np.testing.assert_allclose(np.abs(model.transform(X)),
+                               np.abs(reference.transform(scaled)), atol=1e-4)
+
+
+def test_power_iterations_trade_passes_for_accuracy():
+    """Each power iteration costs one extra pass over the data."""
+    X = _features()
+    quick = StreamingPCA(n_components=3, method="randomized", n_power_iterations=0,
+                         oversampling=2).fit(X)
+    thorough = StreamingPCA(n_components=3, method="randomized", n_power_iterations=3).fit(X)
+
+    assert thorough.n_passes_ == quick.n_passes_ + 3
+    reference, _ = _reference(X, 3)
+    quick_error = np.abs(quick.explained_variance_ - reference.explained_variance_).max()
+    thorough_error = np.abs(thorough.explained_variance_ - reference.explained_variance_).max()
+    assert thorough_error <= quick_error
+
+
+def test_npy_and_csv_sources_project_without_loading(tmp_path):
+    """Memory-mapped .npy and chunked CSV sources fit and project identically."""
+    X = _features(n_samples=1000)
+    npy_path = tmp_path / "features.npy"
+    np.save(npy_path, X)
+    csv_path = tmp_path / "features.csv"
+    pd.DataFrame(X, columns=[f"f{i}" for i in range(12)]).to_csv(csv_path, index=False)
+
+    from_npy = StreamingPCA(n_components=2, chunk_size=300).fit(str(npy_path))
+    from_csv = StreamingPCA(n_components=2, chunk_size=300).fit(str(csv_path))
+    np.testing.assert_allclose(from_npy.components_, from_csv.components_, atol=1e-8)
+
+    output = from_npy.transform_to_npy(str(npy_path), str(tmp_path / "projected.npy"))
+    np.testing.assert_allclose(np.load(output), from_npy.transform(X))
+    assert list(from_csv.loadings([f"f{i}" for i in range(12)]).columns) == ["PC1", "PC2"]
+
+
+def test_chunk_factory_allows_multiple_passes():
+    """Generated data is re-read through a callable for multi-pass solvers."""
+    X = _features(n_samples=900)
+
+    def factory():
+        return (X[start:start + 100] for start in range(0, len(X), 100))
+
+    assert sum(len(chunk) for chunk in iter_chunks(factory)) == len(X)
+    model = StreamingPCA(n_components=2, method="randomized").fit(factory)
+    assert model.n_samples_seen_ == len(X)
@@ -0,0 +1,69 @@
+"""Tests for parallel, cached distribution fitting."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.distribution_fitting import (  # noqa: E402
+    FitCache,
+    fit_distributions,
+    goodness_of_fit,
+    stratified_subsample,
+)
+
+
+def test_goodness_of_fit_matches_scipy():
+    """Vectorized KS and log-likelihood agree with scipy."""
+    sample = np.random.default_rng(0).normal(5.0, 2.0, 3000)
+    params = stats.norm.fit(sample)
+    gof = goodness_of_fit("norm", params, sample)
+    reference = stats.kstest(sample, "norm", args=params)
+    assert np.isclose(gof["ks_stat"], reference.statistic)
+    assert np.isclose(gof["ks_p"], reference.pvalue, rtol=1e-3)
+    assert np.isclose(gof["log_likelihood"], stats.norm.logpdf(sample, *params).sum())
+
+
+def test_stratified_subsample_keeps_extremes():
+    """The subsample spans the full range of the data."""
+    sample = np.random.default_rng(1).exponential(size=50_000)
+    subsample = stratified_subsample(sample, 500)
+    assert len(subsample) == 500
+    assert subsample[0] == sample.min() and subsample[-1] == sample.max()
+
+
+def test_small_sample_fits_match_scipy():
+    """Full-sample fits match a plain scipy fit for closed-form families."""
+    sample = np.random.default_rng(2).normal(10.0, 3.0, 1000)
+    results = fit_distributions(sample, families=("norm", "uniform"), n_jobs=1)
+    best = results.iloc[0]
+    assert best["distribution"] == "norm"
+    np.testing.assert_allclose(best["params"], stats.norm.fit(sample), rtol=1e-6)
+    assert results["refined"].all()
+
+
+def test_two_stage_fit_recovers_family_and_uses_cache(tmp_path):
+    """Subsample-then-refine picks the generating family; refits come from the cache."""
+    sample = np.random.default_rng(3).gamma(2.5, 3.0, 60_000) + 1.0
+    cache = FitCache(str(tmp_path))
+    families = ("norm", "expon", "gamma", "lognorm")
+    results = fit_distributions(sample, families=families, subsample_size=2000,
+                                top_k=2, n_jobs=2, cache=cache)
+    assert results.iloc[0]["distribution"] == "gamma"
+    assert results["refined"].sum() == 2
+    assert np.isfinite(results["aic"]).all()
+    np.testing.assert_allclose(results.iloc[0]["params"][0], 2.5, rtol=0.05)
+
+    reloaded = FitCache(str(tmp_path))
+    again = fit_distributions(sample, families=families, subsample_size=2000,
+                              top_k=2, n_jobs=2, cache=reloaded)
+    assert reloaded.misses == 0 and reloaded.hits == len(families) + 2
+    np.testing.assert_allclose(again["aic"], results["aic"])
+    fit_distributions(sample, families=families, subsample_size=1000, top_k=2, n_jobs=1,
+                      cache=reloaded)
+    fit_distributions(sample, families=families, subsample_size=2000, top_k=2, n_jobs=1,
+                      cache=reloaded, random_state=7)
+    assert reloaded.misses == 2 * len(families)
@@ -0,0 +1,66 @@
+"""Tests for dtype optimization and memory reporting."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics import dtype_optimization  # noqa: E402
+from quipu_analytics.dtype_optimization import (  # noqa: E402
+    analyze_dtypes,
+    load_dataset,
+    optimize_dtypes,
+)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def test_numeric_downcasts_preserve_values():
+    """Integers shrink to the smallest safe type; floats only when lossless."""
+    df = pd.DataFrame({
+        "small": np.arange(100, dtype=np.int64),
+        "wide": np.arange(100, dtype=np.int64) * 1_000,
+        "halves": np.arange(100) / 2.0,
+        "rates": np.linspace(0.01, 0.99, 100),
+    })
+    optimized, report = optimize_dtypes(df)
+    assert optimized["small"].dtype == np.int8
+    assert optimized["wide"].dtype == np.int32
+    assert optimized["halves"].dtype == np.float32
+    assert optimized["rates"].dtype == np.float64
+    pd.testing.assert_frame_equal(optimized.astype(df.dtypes.to_dict()), df)
+    assert report["total_after"] < report["total_before"]
+
+    lossy = analyze_dtypes(df, allow_float32=True)
+    assert lossy["rates"]["to"] == "float32"
+
+
+def test_coffee_sales_strings_and_timestamps():
+    """Low-cardinality strings become categories and Date/Time become timestamps."""
+    raw = pd.read_csv(DATA_DIR / "Coffee_sales.csv", sep="\t")
+    optimized, report = optimize_dtypes(raw)
+    for column in ("cash_type", "coffee_name", "Weekday", "Month_name"):
+        assert isinstance(optimized[column].dtype, pd.CategoricalDtype)
+        assert (optimized[column].astype(str) == raw[column]).all()
+    assert pd.api.types.is_datetime64_any_dtype(optimized["Date"])
+    assert pd.api.types.is_datetime64_any_dtype(optimized["Time"])
+    assert (optimized["Time"].dt.normalize() == optimized["Date"]).all()
+    assert (optimized["Time"].dt.hour == raw["Time"].str[:2].astype(int)).all()
+    assert report["reduction_pct"] > 50
+
+
+def test_auto_optimize_on_load():
+    """The global switch makes load_dataset optimize and attach the report."""
+    assert not isinstance(load_dataset(DATA_DIR / "Spotify_churn_dataset.csv",
+                                       optimize=False)["gender"].dtype, pd.CategoricalDtype)
+    dtype_optimization.set_auto_optimize(True)
+    try:
+        df = load_dataset(DATA_DIR / "Spotify_churn_dataset.csv")
+    finally:
+        dtype_optimization.set_auto_optimize(False)
+    assert isinstance(df["gender"].dtype, pd.CategoricalDtype)
+    assert df["is_churned"].dtype == np.int8
+    assert df.attrs["memory_report"]["reduction_pct"] > 50
@@ -0,0 +1,100 @@
+"""Tests for the cached environment fingerprint and fingerprint diffing."""
+
+import copy
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics import environment_fingerprint as fingerprint_module  # noqa: E402
+from quipu_analytics.environment_fingerprint import (  # noqa: E402
+    diff_fingerprints,
+    get_environment_fingerprint,
+)
+from quipu_analytics.execution_tracking import (  # noqa: E402
+    generate_execution_summary,
+    get_execution_metadata,
+)
+
+
+def _rehash(fingerprint):
+    fingerprint["section_digests"] = {section: fingerprint_module._digest(fingerprint[section])
+                                      for section in fingerprint_module.SECTIONS}
+    fingerprint["digest"] = fingerprint_module._digest(fingerprint["section_digests"])
+    return fingerprint
+
+
+def test_fingerprint_is_cached_and_stable():
+    """Repeated calls reuse the process cache and hash to the same digest."""
+    first = get_environment_fingerprint()
+    first["packages"]["mutated"] = "1.0"
+    second = get_environment_fingerprint()
+    assert "mutated" not in second["packages"]
+    assert second["digest"] == get_environment_fingerprint(refresh=True)["digest"]
+    assert "numpy" in second["packages"]
+    assert set(second["threads"]["environment"]) == set(fingerprint_module.THREAD_VARIABLES)
+    assert _rehash(copy.deepcopy(second))["digest"] == second["digest"]
+
+
+def test_diff_pinpoints_packages_and_thread_settings():
+    """Only the sections whose digests changed are reported."""
+    old = get_environment_fingerprint()
+    new = copy.deepcopy(old)
+    new["packages"]["numpy"] = "0.0.1"
+    new["packages"]["brand-new"] = "2.0"
+    del new["packages"]["pytest"]
+    new["threads"]["environment"]["OMP_NUM_THREADS"] = "4"
+    diff = diff_fingerprints(old, _rehash(new))
+
+    assert not diff["identical"]
+    assert diff["packages"] == {"added": {"brand-new": "2.0"},
+                                "removed": {"pytest": old["packages"]["pytest"]},
+                                "changed": {"numpy": [old["packages"]["numpy"], "0.0.1"]}}
+    assert diff["threads"] == {"environment.OMP_NUM_THREADS": [
+        old["threads"]["environment"]["OMP_NUM_THREADS"], "4"]}
+    assert set(diff) == {"identical", "packages", "threads"}
+    assert diff_fingerprints(old, old) == {"identical": True}
+
+
+def test_execution_tracking_records_fingerprint():
+    """Metadata carries the digest and summaries embed the full fingerprint."""
+    metadata = get_execution_metadata()
+    assert metadata["environment_digest"] == get_environment_fingerprint()["digest"]
+    assert get_execution_metadata()["execution_id"] != metadata["execution_id"]
+    summary = generate_execution_summary(metadata)["execution_summary"]
+    assert summary["environment_fingerprint"]["digest"] == metadata["environment_digest"]
+
+
+def test_thread_digest_ignores_import_order():
+    """A fresh process reports the same runtimes before and after importing scikit-learn."""
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    module_path = Path(fingerprint_module.__file__)
+    script = (
+        "import importlib.util\n"
+        f"spec = importlib.util.spec_from_file_location('fingerprint', {str(module_path)!r})\n"
+        "module = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(module)\n"
+        "before = module.get_environment_fingerprint()['section_digests']['threads']\n"
+        "import sklearn.ensemble, scipy.stats\n"
+        "after = module.get_environment_fingerprint(refresh=True)['section_digests']['threads']\n"
+        "print(before == after)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            check=True).stdout
+    assert output.strip() == "True"
+
+
+def test_diff_keeps_duplicate_runtimes_apart():
+    """Two copies of one BLAS are reported separately when only one changes."""
+    old = get_environment_fingerprint()
+    old["threads"]["libraries"] = [
+        {"user_api": "blas", "internal_api": "openblas", "num_threads": 8,
+         "filepath": "/site-packages/numpy.libs/libopenblas-a.so"},
+        {"user_api": "blas", "internal_api": "openblas", "num_threads": 8,
+         "filepath": "/site-packages/scipy.libs/libopenblas-b.so"},
+    ]
+    new = copy.deepcopy(old)
+    new["threads"]["libraries"][1]["num_threads"] = 2
+    diff = diff_fingerprints(_rehash(old), _rehash(new))
+    assert diff["threads"] == {"libraries[openblas:libopenblas-b.so].num_threads": [8, 2]}
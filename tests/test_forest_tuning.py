@@ -0,0 +1,66 @@
+"""Tests for incremental forest growth with OOB model selection."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.forest_tuning import OOBForestSearch, grow_forest  # noqa: E402
+
+
+def test_incremental_oob_matches_cold_forest():
+    """The running OOB score equals oob_score_ of a forest trained from scratch."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_classification, make_regression
+    from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+    X, y = make_classification(n_samples=300, n_features=8, n_classes=3, n_informative=4,
+                               random_state=0)
+    forest, curve = grow_forest(RandomForestClassifier(random_state=0), X, y, step=20,
+                                max_estimators=60, patience=10)
+    cold = RandomForestClassifier(n_estimators=60, oob_score=True, random_state=0).fit(X, y)
+    assert list(curve["n_estimators"]) == [20, 40, 60]
+    assert curve["oob_score"].iloc[-1] == pytest.approx(cold.oob_score_)
+    assert (forest.predict(X) == cold.predict(X)).all()
+
+    X, y = make_regression(n_samples=250, n_features=6, noise=5.0, random_state=0)
+    _, curve = grow_forest(RandomForestRegressor(max_samples=0.8, random_state=1), X, y,
+                           step=25, max_estimators=50, patience=10)
+    cold = RandomForestRegressor(n_estimators=50, max_samples=0.8, oob_score=True,
+                                 random_state=1).fit(X, y)
+    assert curve["oob_score"].iloc[-1] == pytest.approx(cold.oob_score_)
+
+
+def test_growth_stops_on_plateau():
+    """An easy problem plateaus long before the tree limit."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_blobs
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = make_blobs(n_samples=200, centers=2, cluster_std=0.5, random_state=0)
+    forest, curve = grow_forest(RandomForestClassifier(random_state=0), X, y, step=10,
+                                max_estimators=500, patience=2)
+    assert len(forest.estimators_) < 100
+    assert len(curve) >= 3 and curve["n_estimators"].is_monotonic_increasing
+    with pytest.raises(ValueError):
+        grow_forest(RandomForestClassifier(bootstrap=False), X, y)
+
+
+def test_search_ranks_candidates_within_thread_budget():
+    """Candidates grown in parallel share the thread budget and are ranked by OOB."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_classification
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = make_classification(n_samples=300, n_features=10, n_informative=5, random_state=0)
+    search = OOBForestSearch(RandomForestClassifier(random_state=0),
+                             {"max_depth": [1, None], "max_features": ["sqrt", 0.5]},
+                             step=20, max_estimators=100, n_parallel=2,
+                             total_threads=4).fit(X, y)
+    assert search.n_jobs_ == 2 and search.best_estimator_.n_jobs == 2
+    assert len(search.results_) == len(search.curves_) == 4
+    assert search.best_params_["max_depth"] is None
+    assert search.best_score_ == search.results_["oob_score"].max()
+    assert search.predict(X).shape == y.shape
@@ -0,0 +1,80 @@
+"""Tests for the memory-bounded hierarchical clustering utilities."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.hierarchical_clustering import (  # noqa: E402
+    cut_tree,
+    hierarchical_linkage,
+    nn_chain_linkage,
+    single_linkage,
+)
+
+
+def _features(n_samples=60, seed=42):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n_samples, 4))
+
+
+@pytest.mark.parametrize("method", ["ward", "single", "average", "complete", "weighted"])
+def test_linkage_matches_scipy(method):
+    """Linkage matrices are interchangeable with the notebook's scipy calls."""
+    from scipy.cluster.hierarchy import linkage
+    from scipy.spatial.distance import pdist
+
+    X = _features()
+    expected = linkage(X, "ward") if method == "ward" else linkage(pdist(X), method)
+    result = hierarchical_linkage(X, method=method)["linkage"]
+
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_memmapped_distance_store(tmp_path):
+    """Disk-backed distances give the same tree and clean up after themselves."""
+    from scipy.cluster.hierarchy import linkage
+    from scipy.spatial.distance import pdist
+
+    X = _features()
+    result = nn_chain_linkage(X, "average", memmap_dir=str(tmp_path))
+
+    np.testing.assert_allclose(result, linkage(pdist(X), "average"))
+    assert not list(tmp_path.iterdir())
+
+
+def test_average_linkage_weights_micro_clusters():
+    """Sized leaves merge like their observations repeated, as after pre-clustering."""
+    from scipy.cluster.hierarchy import linkage
+    from scipy.spatial.distance import pdist
+
+    centers = _features(n_samples=8)
+    sizes = np.array([1, 500, 3, 40, 1, 7, 120, 2])
+    result = nn_chain_linkage(centers, "average", sample_weight=sizes)
+    expected = linkage(pdist(np.repeat(centers, sizes, axis=0)), "average")
+
+    np.testing.assert_allclose(result[:, 2], expected[-(len(centers) - 1):, 2])
+
+def test_single_linkage_rejects_single_observation():
+    """A tree needs at least two leaves."""
+    with pytest.raises(ValueError):
+        single_linkage(np.zeros((1, 3)))
+
+
+def test_preclustered_cut_recovers_blobs():
+    """Pre-clustering keeps well separated groups intact and labels every row."""
+    rng = np.random.default_rng(0)
+    centers = np.array([[0, 0], [10, 10], [0, 10]])
+    X = np.vstack([rng.normal(c, 0.5, size=(400, 2)) for c in centers])
+
+    result = hierarchical_linkage(X, method="ward", max_exact_samples=500, n_preclusters=50)
+    labels = cut_tree(result, 3)
+
+    assert result["preclustered"]
+    assert result["observation_counts"][-1] == len(X)
+    assert len(labels) == len(X)
+    for block in range(3):
+        assert len(np.unique(labels[block * 400:(block + 1) * 400])) == 1
@@ -0,0 +1,78 @@
+"""Tests for tail-following incremental ingestion."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.incremental_ingestion import IncrementalIngestor  # noqa: E402
+
+DATA_FILE = Path(__file__).parent.parent / "data" / "Coffee_sales.csv"
+
+
+def _expected(text):
+    frame = pd.read_csv(pd.io.common.StringIO(text), sep="\t")
+    daily = frame.groupby("Date").agg(sales=("money", "sum"),
+                                      transaction_count=("coffee_name", "count"))
+    return daily, frame["coffee_name"].value_counts(), frame["hour_of_day"].value_counts()
+
+
+def _assert_matches(ingestor, text):
+    daily, products, hours = _expected(text)
+    result = ingestor.daily_revenue()
+    assert list(result.index.strftime("%Y-%m-%d")) == list(daily.index)
+    np.testing.assert_allclose(result["sales"], daily["sales"])
+    assert list(result["transaction_count"]) == list(daily["transaction_count"])
+    assert ingestor.product_counts()["transactions"].to_dict() == products.to_dict()
+    assert ingestor.hourly_profile()["transactions"].to_dict() == hours.to_dict()
+    assert ingestor.rows == products.sum()
+
+
+def test_appended_rows_match_full_recompute(tmp_path):
+    """Appends (including a half-written line) give the same aggregates as a full read."""
+    lines = DATA_FILE.read_text(encoding="utf-8").splitlines()
+    source, state = tmp_path / "sales.csv", tmp_path / "state.json"
+    source.write_text("\n".join(lines[:2000]) + "\n", encoding="utf-8")
+
+    ingestor = IncrementalIngestor(source, state)
+    assert ingestor.update()["mode"] == "rebuild"
+    _assert_matches(ingestor, source.read_text(encoding="utf-8"))
+
+    half = len(lines[2000]) // 2
+    with open(source, "a", encoding="utf-8") as f:
+        f.write("\n".join(lines[2000:3000]) + "\n" + lines[3000][:half])
+    result = IncrementalIngestor(source, state).update()
+    assert (result["mode"], result["rows_added"]) == ("incremental", 1001)
+
+    ingestor = IncrementalIngestor(source, state)
+    with open(source, "a", encoding="utf-8") as f:
+        f.write(lines[3000][half:] + "\n" + "\n".join(lines[3001:]))
+    result = ingestor.update()
+    assert (result["mode"], result["rows_added"], result["rows"]) == \
+        ("incremental", len(lines) - 3001, len(lines) - 1)
+    _assert_matches(ingestor, source.read_text(encoding="utf-8"))
+    assert ingestor.update()["mode"] == "unchanged"
+
+
+def test_truncation_and_rewrite_trigger_rebuild(tmp_path):
+    """Shrinking or editing already-ingested bytes falls back to a full rebuild."""
+    lines = DATA_FILE.read_text(encoding="utf-8").splitlines()[:500]
+    source = tmp_path / "sales.csv"
+    source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    ingestor = IncrementalIngestor(source)
+    ingestor.update()
+
+    source.write_text("\n".join(lines[:100]) + "\n", encoding="utf-8")
+    result = ingestor.update()
+    assert (result["mode"], result["reason"], result["rows"]) == ("rebuild", "file truncated", 99)
+
+    rewritten = "\n".join(lines[:100]).replace("\t38.7\t", "\t99.0\t") + "\n"
+    rewritten += "\n".join(lines[100:300]) + "\n"
+    with open(source, "r+", encoding="utf-8") as f:
+        f.write(rewritten)
+    result = ingestor.update()
+    assert (result["mode"], result["reason"]) == ("rebuild", "ingested rows rewritten")
+    _assert_matches(ingestor, source.read_text(encoding="utf-8"))
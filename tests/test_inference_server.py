@@ -0,0 +1,122 @@
+"""Tests for the micro-batching inference server."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.inference_server import (  # noqa: E402
+    ChurnFeaturePreparer,
+    InferenceServer,
+    StoreModelLoader,
+    request_predictions,
+)
+from quipu_analytics.model_store import ModelStore  # noqa: E402
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "Spotify_churn_dataset.csv"
+
+
+def _train(tmp_path):
+    df = pd.read_csv(DATA_PATH, sep="\t").head(2000)
+    preparer = ChurnFeaturePreparer().fit(df)
+    model = RandomForestClassifier(n_estimators=20, random_state=42)
+    model.fit(preparer.transform(df), df["is_churned"])
+    store = ModelStore(tmp_path / "store")
+    metadata = store.save(model, fingerprint="churn",
+                          execution_metadata={"execution_id": "test", "timestamp": None})
+    records = df.drop(columns=["user_id", "is_churned"]).head(200).to_dict("records")
+    return model, preparer, StoreModelLoader(str(tmp_path / "store"), metadata["key"]), records
+
+
+def test_preparer_matches_label_encoder():
+    """Encoded columns reproduce the notebook's LabelEncoder codes."""
+    from sklearn.preprocessing import LabelEncoder
+
+    df = pd.read_csv(DATA_PATH, sep="\t").head(500)
+    features = ChurnFeaturePreparer().fit(df)(df.to_dict("records"))
+    np.testing.assert_array_equal(features[:, 6], LabelEncoder().fit_transform(df["gender"]))
+    np.testing.assert_array_equal(features[:, 9], LabelEncoder().fit_transform(df["device_type"]))
+
+
+def test_concurrent_requests_are_batched_and_match_direct_predictions(tmp_path):
+    """Concurrent TCP requests are coalesced and return the model's probabilities."""
+    model, preparer, loader, records = _train(tmp_path)
+    expected = model.predict_proba(preparer(records))[:, 1]
+
+    async def scenario():
+        async with InferenceServer(loader, preparer, max_batch_size=64, max_latency_ms=20,
+                                   n_workers=2) as server:
+            scores = await asyncio.gather(*[
+                request_predictions([record], port=server.port) for record in records])
+            return scores, server.metrics()
+
+    scores, metrics = asyncio.run(scenario())
+    np.testing.assert_allclose(np.concatenate(scores), expected)
+    assert metrics["requests"] == len(records)
+    assert metrics["batches"] < len(records)
+    assert metrics["mean_batch_size"] > 1
+    assert sum(metrics["batch_size_histogram"].values()) == metrics["batches"]
+    assert metrics["latency_p99_ms"] >= metrics["latency_p50_ms"] > 0
+
+
+def test_unix_socket_and_bad_requests(tmp_path):
+    """The Unix-socket front end serves predictions and rejects malformed bodies."""
+    _, preparer, loader, records = _train(tmp_path)
+    socket_path = str(tmp_path / "serve.sock")
+
+    async def scenario():
+        async with InferenceServer(loader, preparer, n_workers=1, unix_path=socket_path):
+            scores = await request_predictions(records[:5], unix_path=socket_path)
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(b"POST /predict HTTP/1.1\r\nContent-Length: 3\r\n"
+                         b"Connection: close\r\n\r\n{x}")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return scores, response
+
+    scores, response = asyncio.run(scenario())
+    assert len(scores) == 5
+    assert response.startswith(b"HTTP/1.1 400")
+
+
+def test_bad_records_fail_alone(tmp_path):
+    """Invalid records get 400 up front, and a batch failure only fails its culprit."""
+    model, preparer, loader, records = _train(tmp_path)
+    expected = model.predict_proba(preparer(records[:20]))[:, 1]
+    unscorable = dict(records[0], age="not a number")
+
+    async def raw(port, payload):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(payload)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    async def scenario():
+        async with InferenceServer(loader, preparer, max_batch_size=64, max_latency_ms=50,
+                                   n_workers=1) as server:
+            outcomes = await asyncio.gather(
+                *[request_predictions([record], port=server.port) for record in records[:20]],
+                request_predictions([unscorable], port=server.port), return_exceptions=True)
+            missing = await asyncio.gather(
+                request_predictions([{"age": 30}], port=server.port),
+                request_predictions(["not a record"], port=server.port),
+                return_exceptions=True)
+            malformed = await raw(server.port, b"GARBAGE\r\n\r\n")
+            bad_length = await raw(server.port, b"POST /predict HTTP/1.1\r\n"
+                                                b"Content-Length: ten\r\n\r\n")
+            return outcomes, missing, malformed, bad_length, server.metrics()
+
+    outcomes, missing, malformed, bad_length, metrics = asyncio.run(scenario())
+    np.testing.assert_allclose(np.concatenate(outcomes[:20]), expected)
+    assert isinstance(outcomes[20], RuntimeError)
+    assert metrics["errors"] == 1 and metrics["batches"] < 21
+    assert "missing columns" in str(missing[0]) and "not an object" in str(missing[1])
+    assert malformed.startswith(b"HTTP/1.1 400") and bad_length.startswith(b"HTTP/1.1 400")
@@ -0,0 +1,148 @@
+"""Tests for the persistent model artifact store."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.model_store import (  # noqa: E402
+    ModelStore,
+    benchmark_load,
+    data_fingerprint,
+    model_key,
+)
+
+
+def _training_data(n_rows=2000, seed=42):
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((n_rows, 8))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int)
+    return X, y
+
+
+def test_fingerprint_tracks_content():
+    """Identical data hashes identically; any change produces a new key."""
+    X, y = _training_data()
+    frame = pd.DataFrame(X, columns=[f"f{i}" for i in range(8)])
+
+    assert data_fingerprint(X, y) == data_fingerprint(X.copy(), y.copy())
+    assert data_fingerprint(frame, y) == data_fingerprint(frame.copy(), y)
+    X_changed = X.copy()
+    X_changed[0, 0] += 1e-9
+    assert data_fingerprint(X_changed, y) != data_fingerprint(X, y)
+
+
+def test_large_arrays_are_memory_mapped(tmp_path):
+    """Neighbor training data is stored beside the pickle and mmapped on load."""
+    from sklearn.neighbors import KNeighborsClassifier
+
+    X, y = _training_data()
+    model = KNeighborsClassifier(n_neighbors=5).fit(X, y)
+    store = ModelStore(str(tmp_path))
+    metadata = store.save(model, X, y, execution_metadata={"execution_id": "run-1",
+                                                           "timestamp": None})
+
+    loaded = store.load(metadata["key"])
+    assert metadata["arrays"]
+    assert isinstance(loaded._fit_X, np.memmap)
+    np.testing.assert_array_equal(loaded.predict(X[:50]), model.predict(X[:50]))
+
+
+def test_mapped_arrays_are_writable_copies(tmp_path):
+    """libsvm needs writable buffers; copy-on-write maps keep the artifact intact."""
+    from sklearn.svm import SVC
+
+    X, y = _training_data(n_rows=300)
+    model = SVC(probability=True, random_state=0).fit(X, y)
+    store = ModelStore(str(tmp_path), array_threshold=64)
+    metadata = store.save(model, X, y, execution_metadata={"execution_id": "run-1",
+                                                           "timestamp": None})
+
+    loaded = store.load(metadata["key"])
+    assert isinstance(loaded.dual_coef_, np.memmap)
+    np.testing.assert_allclose(loaded.predict_proba(X[:50]), model.predict_proba(X[:50]))
+    loaded.dual_coef_[:] = 0.0
+    reloaded = ModelStore(str(tmp_path)).load(metadata["key"])
+    np.testing.assert_array_equal(reloaded.dual_coef_, model.dual_coef_)
+
+
+def test_versions_lru_and_lazy_loading(tmp_path):
+    """Versions are keyed by execution_id, the LRU is bounded and proxies defer loading."""
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = _training_data()
+    store = ModelStore(str(tmp_path), max_loaded=1)
+    first = LogisticRegression(C=1.0).fit(X, y)
+    second = LogisticRegression(C=0.1).fit(X, y)
+    meta_a = store.save(first, X, y, execution_metadata={"execution_id": "a", "timestamp": None})
+    store.save(first, X, y, execution_metadata={"execution_id": "b", "timestamp": None})
+    meta_c = store.save(second, X, y, execution_metadata={"execution_id": "c", "timestamp": None})
+
+    assert meta_a["key"] != meta_c["key"]
+    assert [v["execution_id"] for v in store.versions(meta_a["key"])] == ["a", "b"]
+
+    lazy = store.lazy(meta_a["key"])
+    assert not lazy.loaded
+    np.testing.assert_array_equal(lazy.predict(X[:10]), first.predict(X[:10]))
+    assert lazy.loaded
+    store.load(meta_c["key"])
+    assert not store.is_loaded(meta_a["key"])
+
+
+def test_get_or_train_skips_retraining(tmp_path):
+    """A second scoring job reuses the stored model instead of refitting."""
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = _training_data(500)
+    store = ModelStore(str(tmp_path))
+    calls = []
+
+    def fit(estimator, features, target):
+        calls.append(1)
+        return estimator.fit(features, target)
+
+    first = store.get_or_train(RandomForestClassifier(n_estimators=10, random_state=0), X, y,
+                               fit=fit)
+    second = store.get_or_train(RandomForestClassifier(n_estimators=10, random_state=0), X, y,
+                                fit=fit)
+
+    assert len(calls) == 1
+    np.testing.assert_array_equal(first.predict(X), second.predict(X))
+    key = model_key(RandomForestClassifier(n_estimators=10, random_state=0), data_fingerprint(X, y))
+    assert store.versions(key)
+
+
+def test_model_key_covers_nested_params():
+    """Deeply nested hyperparameters change the key; random generators are rejected."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.ensemble import BaggingClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    def bagged(c):
+        return BaggingClassifier(Pipeline([("scale", StandardScaler()),
+                                           ("model", LogisticRegression(C=c, max_iter=500))]))
+
+    fingerprint = data_fingerprint(*_training_data(50))
+    assert model_key(bagged(2.0), fingerprint) != model_key(bagged(5.0), fingerprint)
+    assert model_key(bagged(2.0), fingerprint) == model_key(bagged(2.0), fingerprint)
+    with pytest.raises(ValueError):
+        model_key(LogisticRegression(random_state=np.random.RandomState(0)), fingerprint)
+
+
+def test_benchmark_reports_both_loaders(tmp_path):
+    """The load benchmark times pickle and mmap loading of the same model."""
+    from sklearn.neighbors import KNeighborsClassifier
+
+    X, y = _training_data()
+    result = benchmark_load(KNeighborsClassifier().fit(X, y), ModelStore(str(tmp_path)),
+                            n_repeats=2)
+
+    assert result["pickle_load_seconds"] > 0
+    assert result["mmap_load_seconds"] > 0
+    assert result["external_array_bytes"] >= X.nbytes
@@ -0,0 +1,77 @@
+"""Tests for the vectorized Mahalanobis and outlier utilities."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.multivariate_distance import (  # noqa: E402
+    chi2_threshold,
+    classical_location_scatter,
+    detect_multivariate_outliers,
+    mahalanobis_distances,
+    mahalanobis_squared,
+    robust_location_scatter,
+)
+
+
+def _marketing(n_rows=400, seed=42):
+    rng = np.random.default_rng(seed)
+    spend = rng.normal(5000, 1500, n_rows)
+    revenue = 3.2 * spend + rng.normal(0, 2000, n_rows)
+    return np.column_stack([spend, revenue])
+
+
+def test_matches_notebook_scipy_loop():
+    """Distances equal the Tier1_Scatter per-row scipy computation."""
+    from scipy.spatial.distance import mahalanobis
+
+    data = _marketing()
+    mean, cov = np.mean(data, axis=0), np.cov(data.T)
+    inv_cov = np.linalg.inv(cov)
+    expected = [mahalanobis(point, mean, inv_cov) for point in data]
+
+    estimate = classical_location_scatter(data, chunk_size=64)
+    np.testing.assert_allclose(estimate["covariance"], cov)
+    np.testing.assert_allclose(
+        mahalanobis_distances(data, estimate["location"], estimate["covariance"], chunk_size=64),
+        expected)
+
+
+def test_small_input_matches_min_cov_det():
+    """Below max_samples the robust estimate is sklearn's MinCovDet."""
+    from sklearn.covariance import MinCovDet
+
+    data = _marketing()
+    reference = MinCovDet(random_state=42).fit(data)
+    estimate = robust_location_scatter(data)
+
+    assert not estimate["subsampled"]
+    np.testing.assert_allclose(
+        mahalanobis_squared(data, estimate["location"], estimate["covariance"]),
+        reference.mahalanobis(data))
+
+
+def test_subsampled_mcd_resists_contamination(tmp_path):
+    """Large, contaminated inputs stream from disk and still flag the outliers."""
+    rng = np.random.default_rng(1)
+    clean = rng.multivariate_normal([0, 0, 0], np.eye(3), size=20000)
+    contaminated = rng.multivariate_normal([6, 6, 6], 0.1 * np.eye(3), size=2000)
+    data = np.vstack([clean, contaminated])
+    path = tmp_path / "fraud.npy"
+    np.save(path, data)
+
+    result = detect_multivariate_outliers(str(path), chunk_size=4096, max_samples=2000)
+
+    np.testing.assert_allclose(result["location"], 0.0, atol=0.1)
+    np.testing.assert_allclose(result["covariance"], np.eye(3), atol=0.15)
+    assert result["outliers"][20000:].all()
+    assert result["outliers"][:20000].mean() < 0.05
+
+
+def test_chi2_threshold_squared_and_plain():
+    """The plain threshold is the square root of the squared one."""
+    assert abs(chi2_threshold(2, 0.975) - 7.3777589) < 1e-6
+    assert abs(chi2_threshold(2, 0.975, squared=False) ** 2 - chi2_threshold(2, 0.975)) < 1e-12
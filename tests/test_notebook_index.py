@@ -0,0 +1,94 @@
+"""Tests for the streaming notebook indexer."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.notebook_index import NotebookIndex, scan_notebook  # noqa: E402
+
+NOTEBOOK_DIR = Path(__file__).parent.parent / "notebooks"
+
+
+def _notebook(sources, nbformat=4, cell_type="code"):
+    noisy = 'tricky "quotes" \\ [brackets] {braces} ' * 200
+    cells = []
+    for index, source in enumerate(sources):
+        cells.append({
+            "cell_type": cell_type if index else "markdown",
+            "metadata": {"tags": ["parameters"]} if index == 1 else {},
+            "source": source.splitlines(keepends=True),
+            "outputs": [{"output_type": "stream", "text": [noisy, "ü\n"]},
+                        {"output_type": "display_data",
+                         "data": {"image/png": "iVBORw0KGgo" * 5000,
+                                  "application/json": {"nested": [[1, 2], {"a": [3]}]}}}],
+            "execution_count": index,
+        })
+    return {"cells": cells, "metadata": {"kernelspec": {"name": "python3"}},
+            "nbformat": nbformat, "nbformat_minor": 5}
+
+
+def _write(path, notebook):
+    path.write_text(json.dumps(notebook, indent=1, ensure_ascii=False), encoding="utf-8")
+
+
+def test_scan_matches_json_and_skips_outputs(tmp_path):
+    """Streamed cells equal json.load's at any chunk size; outputs are stepped over."""
+    path = tmp_path / "Tier9_Test.ipynb"
+    _write(path, _notebook(["# Title\n", "n_rows = 800\n",
+                            "%matplotlib inline\nimport numpy as np\n"
+                            "from sklearn.model_selection import (\n    GridSearchCV,\n)\n"]))
+    expected = json.loads(path.read_text(encoding="utf-8"))
+    for chunk_size in (5, 97, 65536):
+        scanned = scan_notebook(path, chunk_size=chunk_size)
+        assert scanned["metadata"] == expected["metadata"]
+        assert [cell["source"] for cell in scanned["cells"]] == \
+            ["".join(cell["source"]) for cell in expected["cells"]]
+        assert scanned["skipped_outputs"] > 3 * 55_000
+    cells = scanned["cells"]
+    assert cells[1]["tags"] == ["parameters"]
+    assert cells[2]["imports"] == [("sklearn.model_selection", "GridSearchCV"), ("numpy", None)]
+
+
+def test_index_refreshes_by_mtime_and_answers_queries(tmp_path):
+    """Only changed notebooks are rescanned; deleted ones are dropped."""
+    root = tmp_path / "notebooks"
+    root.mkdir()
+    _write(root / "a.ipynb", _notebook(["# A", "from sklearn.svm import SVC\n"]))
+    _write(root / "b.ipynb", _notebook(["# B", "import sklearn.ensemble\n"]))
+    _write(root / "old.ipynb", _notebook(["# Old", "x = 1\n"], nbformat=3, cell_type="bogus"))
+    db_path = tmp_path / "index.sqlite"
+
+    index = NotebookIndex(db_path)
+    assert index.refresh(root) == {"indexed": 3, "unchanged": 0, "removed": 0}
+    index.close()
+
+    index = NotebookIndex(db_path)
+    assert index.refresh(root) == {"indexed": 0, "unchanged": 3, "removed": 0}
+    assert index.notebooks_importing("SVC") == [str(root / "a.ipynb")]
+    assert index.notebooks_importing("sklearn") == [str(root / "a.ipynb"), str(root / "b.ipynb")]
+    problems = index.validate()
+    assert problems[str(root / "a.ipynb")] == []
+    assert problems[str(root / "old.ipynb")] == ["nbformat 3 is older than 4",
+                                                 "cell 1 has unknown type 'bogus'"]
+
+    _write(root / "b.ipynb",
+           _notebook(["# B", "from sklearn.model_selection import GridSearchCV\n"]))
+    stat = (root / "b.ipynb").stat()
+    os.utime(root / "b.ipynb", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (root / "old.ipynb").unlink()
+    assert index.refresh(root) == {"indexed": 1, "unchanged": 1, "removed": 1}
+    assert index.notebooks_importing("GridSearchCV") == [str(root / "b.ipynb")]
+    assert index.search_source("GridSearchCV") == [(str(root / "b.ipynb"), 1)]
+    assert index.cells(str(root / "a.ipynb"), "code")[0]["tags"] == ["parameters"]
+
+
+def test_repository_notebooks_are_valid():
+    """Every notebook in the repository passes the structural checks."""
+    index = NotebookIndex()
+    counts = index.refresh(NOTEBOOK_DIR)
+    assert counts["indexed"] == len(index.notebooks()) > 0
+    assert all(not problems for problems in index.validate().values())
+    assert index.notebooks_importing("GridSearchCV")
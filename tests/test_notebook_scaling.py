@@ -0,0 +1,101 @@
+"""Tests for data-scale parameter injection and scaling reports."""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.notebook_scaling import (  # noqa: E402
+    add_parameters_cell,
+    fit_complexity,
+    inject_parameters,
+    read_parameters,
+    run_notebook,
+    scaling_study,
+)
+
+NOTEBOOK_DIR = Path(__file__).parent.parent / "notebooks"
+
+
+def _cell(source, tags=None):
+    return {"cell_type": "code", "execution_count": None, "metadata": {"tags": tags or []},
+            "outputs": [], "source": source.splitlines(keepends=True)}
+
+
+def _write(path, cells):
+    path.write_text(json.dumps({"cells": cells, "metadata": {}, "nbformat": 4,
+                                "nbformat_minor": 5}, indent=1), encoding="utf-8")
+    return path
+
+
+def test_add_parameters_cell_moves_knobs_without_changing_results(tmp_path):
+    """Literal knobs move to a tagged cell; functions then read the module-level value."""
+    path = _write(tmp_path / "demo.ipynb", [
+        _cell("%matplotlib inline\nimport math"),
+        _cell("def generate():\n    n_rows = 40  # rows\n    return list(range(n_rows))\n"
+              "n_days = 7\nrows = generate()\n"),
+        _cell("def summarize(n_rows=3):\n    return n_rows\nn_days = 14\ntotal = len(rows)\n"),
+    ])
+    result = add_parameters_cell(path, ["n_rows", "n_days", "n_missing"])
+    assert result == {"parameters": {"n_rows": 40}, "skipped": ["n_days", "n_missing"]}
+    notebook = json.loads(path.read_text(encoding="utf-8"))
+    assert notebook["cells"][1]["metadata"]["tags"] == ["parameters"]
+    assert notebook["cells"][1]["source"][-1] == "n_rows = 40  # rows"
+    assert "n_rows = 40" not in "".join(notebook["cells"][2]["source"])
+    assert read_parameters(path) == {"n_rows": 40}
+
+    namespace = {}
+    for cell in inject_parameters(path, {"n_rows": 5})["cells"]:
+        exec("".join(line for line in cell["source"]  # pylint: disable=exec-used
+                     if not line.startswith("%")), namespace)
+    assert namespace["rows"] == list(range(5))
+    with pytest.raises(ValueError):
+        inject_parameters(path, {"n_unknown": 1})
+
+
+def test_fit_complexity_recovers_power_laws():
+    """Exact power-law runs give their exponents, projections and failure scale."""
+    results = pd.DataFrame({
+        "notebook": ["a"] * 4,
+        "scale": [1.0, 2.0, 4.0, 8.0],
+        "status": ["ok", "ok", "ok", "error"],
+        "seconds": [0.5, 1.0, 2.0, np.nan],
+        "peak_mem_mb": [10.0, 40.0, 160.0, np.nan],
+    })
+    complexity = fit_complexity(results, target_scale=10.0).iloc[0]
+    assert complexity["time_exponent"] == pytest.approx(1.0)
+    assert complexity["memory_exponent"] == pytest.approx(2.0)
+    assert complexity["projected_seconds"] == pytest.approx(5.0)
+    assert complexity["projected_memory_mb"] == pytest.approx(1000.0)
+    assert complexity["largest_ok_scale"] == 4.0 and complexity["first_failure"] == 8.0
+
+
+def test_scaling_study_runs_scaled_notebooks(tmp_path):
+    """Each factor runs with scaled knobs; larger runs take more time and memory."""
+    path = _write(tmp_path / "linear.ipynb", [
+        _cell("n_rows = 1000", tags=["parameters"]),
+        _cell("import time\nimport numpy as np\n"
+              "payload = np.ones(n_rows * 20_000)\ntime.sleep(n_rows / 5000)"),
+    ])
+    results = scaling_study([path], factors=(1.0, 4.0), timeout=120)
+    assert list(results["status"]) == ["ok"] * 2
+    assert list(results["parameters"]) == [{"n_rows": 1000}, {"n_rows": 4000}]
+    assert results["seconds"].iloc[1] > results["seconds"].iloc[0]
+    assert results["peak_mem_mb"].iloc[1] > results["peak_mem_mb"].iloc[0]
+    complexity = fit_complexity(results).iloc[0]
+    assert complexity["time_exponent"] > 0 and complexity["memory_exponent"] > 0
+
+    failing = run_notebook(path, overrides={"n_rows": -1})
+    assert failing["status"] == "error" and failing["failed_cell"] == 2
+    assert "ValueError" in failing["error"]
+
+
+def test_suite_notebooks_declare_scale_knobs():
+    """Tier4_DBSCAN exposes n_locations and n_noise as its scale knobs."""
+    parameters = read_parameters(NOTEBOOK_DIR / "tier4_unsupervised" / "Tier4_DBSCAN.ipynb")
+    assert parameters == {"n_locations": 800, "n_noise": 200}
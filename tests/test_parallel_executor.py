@@ -0,0 +1,127 @@
+"""Tests for the pluggable work executors."""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics import parallel_executor  # noqa: E402
+from quipu_analytics.parallel_executor import (  # noqa: E402
+    WorkerServer,
+    WorkExecutor,
+    get_executor,
+    run_cv_trials,
+    start_local_workers,
+)
+
+
+def _crash_once(marker):
+    """Kill the worker process the first time it is called."""
+    if not os.path.exists(marker):
+        Path(marker).touch()
+        os._exit(1)  # pylint: disable=protected-access
+    return os.getpid()
+
+
+@pytest.fixture(name="workers")
+def fixture_workers():
+    authkey, workers = start_local_workers(3)
+    yield authkey, workers
+    for _, process in workers:
+        process.terminate()
+        process.join()
+
+
+def test_backends_agree_on_cv_trials():
+    """Thread and process backends produce identical fold scores."""
+    from sklearn.datasets import make_classification  # pylint: disable=import-outside-toplevel
+    from sklearn.linear_model import LogisticRegression  # pylint: disable=import-outside-toplevel
+
+    X, y = make_classification(n_samples=300, n_features=8, random_state=0)
+    results = {}
+    for backend in ("thread", "process"):
+        with get_executor(backend, max_workers=2) as executor:
+            results[backend] = run_cv_trials(executor, LogisticRegression(), X, y,
+                                             param_grid={"C": [0.1, 1.0]}, cv=3)
+    assert results["thread"]["fold_scores"].tolist() == results["process"]["fold_scores"].tolist()
+    assert len(results["thread"]) == 2 and len(results["thread"]["fold_scores"][0]) == 3
+    with pytest.raises(ValueError):
+        get_executor("cluster")
+
+
+def test_process_backend_retries_after_worker_crash(tmp_path):
+    """A unit that kills its worker process is resubmitted to a fresh pool."""
+    with get_executor("process", max_workers=1) as executor:
+        pid = executor.submit(_crash_once, str(tmp_path / "crashed")).result(timeout=60)
+    assert pid != os.getpid()
+
+
+def test_socket_workers_ship_datasets_once_and_reuse_them(workers):
+    """Each worker receives a dataset at most once, including across sessions."""
+    authkey, workers = workers
+    addresses = [address for address, _ in workers]
+    data = np.arange(200_000, dtype=np.float64)
+    with get_executor("socket", addresses=addresses, authkey=authkey) as executor:
+        ref = executor.put(data)
+        assert [f.result(timeout=60) for f in [executor.submit(np.sum, ref)
+                                              for _ in range(12)]] == [data.sum()] * 12
+        with pytest.raises(ValueError, match="bad"):
+            executor.submit(int, "bad").result(timeout=60)
+        stats = executor.worker_stats()
+    assert stats["units"].sum() == 13
+    assert (stats["shipped_bytes"] <= data.nbytes).all()
+
+    with get_executor("socket", addresses=addresses, authkey=authkey) as executor:
+        ref = executor.put(data)
+        assert executor.submit(np.sum, ref).result(timeout=60) == data.sum()
+        assert executor.worker_stats()["shipped_bytes"].sum() == 0
+
+
+def test_socket_units_are_retried_on_other_workers(workers, tmp_path):
+    """Losing a worker requeues its unit; repeated losses surface as ConnectionError."""
+    authkey, workers = workers
+    addresses = [address for address, _ in workers]
+    with get_executor("socket", addresses=addresses, authkey=authkey,
+                      max_retries=1) as executor:
+        pid = executor.submit(_crash_once, str(tmp_path / "crashed")).result(timeout=60)
+        assert pid in [process.pid for _, process in workers]
+        with pytest.raises(ConnectionError, match="lost on 2 workers"):
+            executor.submit(os._exit, 1).result(timeout=60)  # pylint: disable=protected-access
+        stats = executor.worker_stats()
+    assert stats["alive"].tolist().count(False) == 3
+
+
+def test_socket_workers_require_an_authkey():
+    """Neither workers nor clients run without a shared secret, even on localhost."""
+    with pytest.raises(ValueError, match="authkey"):
+        WorkerServer(("127.0.0.1", 0))
+    with pytest.raises(ValueError, match="authkey"):
+        get_executor("socket", addresses=[("127.0.0.1", 1)])
+
+
+def test_executor_without_submit_fails_on_creation():
+    """A backend that does not implement submit cannot be instantiated."""
+    class PartialExecutor(WorkExecutor):
+        name = "partial"
+
+    with pytest.raises(TypeError):
+        PartialExecutor()
+
+
+@pytest.mark.parametrize("native_cancel", [True, False])
+def test_shutdown_cancels_pending_units(monkeypatch, native_cancel):
+    """cancel_futures works whether or not the stdlib pool accepts it (Python 3.8)."""
+    monkeypatch.setattr(parallel_executor, "SHUTDOWN_CANCELS_FUTURES", native_cancel)
+    release = threading.Event()
+    executor = get_executor("thread", max_workers=1)
+    running = executor.submit(release.wait, 30)
+    pending = [executor.submit(int, "1") for _ in range(3)]
+    executor.shutdown(wait=False, cancel_futures=True)
+    release.set()
+    assert running.result(timeout=30) is True
+    assert all(future.cancelled() for future in pending)
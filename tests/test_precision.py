@@ -0,0 +1,74 @@
+"""Tests for the suite-wide float precision policy."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.dtype_optimization import load_dataset  # noqa: E402
+from quipu_analytics.execution_tracking import get_execution_metadata  # noqa: E402
+from quipu_analytics.precision import (  # noqa: E402
+    as_precision,
+    generate,
+    get_precision,
+    precision_drift,
+    precision_scope,
+    wrap_estimator,
+)
+
+
+def test_policy_reaches_loaders_generators_and_estimators():
+    """Under float32, loaded, generated and transformed data all stay float32."""
+    from sklearn.datasets import make_classification  # pylint: disable=import-outside-toplevel
+    from sklearn.decomposition import PCA  # pylint: disable=import-outside-toplevel
+    from sklearn.pipeline import make_pipeline  # pylint: disable=import-outside-toplevel
+    from sklearn.preprocessing import StandardScaler  # pylint: disable=import-outside-toplevel
+
+    assert get_precision() == np.float64
+    variable = os.environ.get("QUIPU_PRECISION")
+    with precision_scope("float32"):
+        assert os.environ["QUIPU_PRECISION"] == "float32"
+        assert get_execution_metadata()["precision"] == "float32"
+        sales = load_dataset("Coffee_sales.csv")
+        assert sales["money"].dtype == np.float32 and sales["hour_of_day"].dtype == np.int64
+
+        X, y = generate(make_classification, n_samples=200, n_features=6, random_state=0)
+        assert X.dtype == np.float32 and y.dtype == np.int64
+        model = wrap_estimator(make_pipeline(StandardScaler(), PCA(n_components=3)))
+        assert model.fit_transform(X.astype(np.float64)).dtype == np.float32
+    assert get_precision() == np.float64
+    assert os.environ.get("QUIPU_PRECISION") == variable
+    assert load_dataset("Coffee_sales.csv")["money"].dtype == np.float64
+
+    frame = pd.DataFrame({"a": [1.5, 2.5], "b": [1, 2], "c": ["x", "y"]})
+    cast = as_precision(frame, "float32")
+    assert cast["a"].dtype == np.float32 and cast["b"].dtype == np.int64
+    assert cast["c"].dtype == frame["c"].dtype
+    assert as_precision(frame, "float64") is frame
+    with pytest.raises(ValueError):
+        as_precision(frame, "float16")
+
+
+def test_tracking_import_leaves_numeric_stack_unloaded():
+    """Importing execution_tracking does not pull numpy/pandas in via the package."""
+    src = str(Path(__file__).parent.parent / "src")
+    code = ("import sys; import quipu_analytics.execution_tracking; import quipu_analytics; "
+            "print(sorted({'numpy', 'pandas', 'sklearn'} & set(sys.modules)))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, env={**os.environ, "PYTHONPATH": src})
+    assert result.stdout.strip() == "[]"
+
+def test_precision_drift_reports_each_metric():
+    """The drift table compares every key metric of a notebook across precisions."""
+    drift = precision_drift(["Tier4_PCA", "Tier2_kNN"])
+    assert drift[["notebook", "metric"]].values.tolist() == [
+        ["Tier4_PCA", "explained_variance_3"], ["Tier4_PCA", "components_95"],
+        ["Tier4_PCA", "reconstruction_mse"], ["Tier2_kNN", "accuracy"], ["Tier2_kNN", "r2"]]
+    assert (drift["rel_drift"] < 1e-3).all()
+    assert {"float64", "float32", "float64_seconds", "float32_seconds"} <= set(drift.columns)
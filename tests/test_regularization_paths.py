@@ -0,0 +1,74 @@
+"""Tests for regularization-path model selection."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.regularization_paths import (  # noqa: E402
+    RegularizationPathSearch,
+    compare_grid_search,
+    ridge_path,
+)
+
+
+@pytest.fixture(name="regression_data")
+def fixture_regression_data():
+    from sklearn.datasets import make_regression  # pylint: disable=import-outside-toplevel
+    return make_regression(n_samples=300, n_features=12, n_informative=5, noise=10.0,
+                           random_state=0)
+
+
+def test_ridge_path_matches_individual_fits(regression_data):
+    """One SVD reproduces Ridge coefficients and intercepts for every alpha."""
+    from sklearn.linear_model import Ridge  # pylint: disable=import-outside-toplevel
+
+    X, y = regression_data
+    alphas = np.logspace(-3, 3, 7)
+    coefs, intercepts = ridge_path(X, y, alphas)
+    for alpha, coef, intercept in zip(alphas, coefs, intercepts):
+        model = Ridge(alpha=alpha).fit(X, y)
+        np.testing.assert_allclose(coef, model.coef_, rtol=1e-8, atol=1e-10)
+        assert intercept == pytest.approx(model.intercept_)
+
+
+@pytest.mark.parametrize("estimator_name, grid, scoring", [
+    ("Ridge", {"alpha": np.logspace(-4, 4, 9)}, "neg_mean_squared_error"),
+    ("Lasso", {"alpha": np.logspace(-3, 1, 8)}, None),
+    ("ElasticNet", {"alpha": np.logspace(-3, 1, 6), "l1_ratio": [0.2, 0.8]}, None),
+])
+def test_path_scores_match_grid_search(regression_data, estimator_name, grid, scoring):
+    """Path cv scores agree with GridSearchCV on the same folds and grid."""
+    from sklearn import linear_model  # pylint: disable=import-outside-toplevel
+
+    X, y = regression_data
+    estimator = getattr(linear_model, estimator_name)(max_iter=5000) \
+        if estimator_name != "Ridge" else linear_model.Ridge()
+    comparison = compare_grid_search(estimator, grid, X, y, cv=4, scoring=scoring)
+    assert comparison["max_score_difference"] < 1e-5
+    assert comparison["path_best"] == comparison["grid_best"]
+
+
+def test_logistic_path_warm_starts_through_c():
+    """Warm-started logistic fits give GridSearchCV's ranking and a refit best model."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_classification
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.model_selection import GridSearchCV
+
+    X, y = make_classification(n_samples=400, n_features=10, random_state=0)
+    grid = {"C": [100.0, 0.01, 1.0, 0.1]}
+    search = RegularizationPathSearch(LogisticRegression(max_iter=1000), grid, cv=3,
+                                      scoring="roc_auc").fit(X, y)
+    expected = GridSearchCV(LogisticRegression(max_iter=1000), grid, cv=3,
+                            scoring="roc_auc").fit(X, y)
+    np.testing.assert_allclose(search.cv_results_["mean_test_score"],
+                               expected.cv_results_["mean_test_score"], atol=1e-3)
+    assert search.best_params_ == expected.best_params_
+    assert search.best_estimator_.C == search.best_params_["C"]
+    assert search.predict(X).shape == y.shape
+    with pytest.raises(ValueError):
+        RegularizationPathSearch(LogisticRegression(), {"alpha": [1.0]})
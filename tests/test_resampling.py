@@ -0,0 +1,99 @@
+"""Tests for the vectorized bootstrap and permutation engine."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+from sklearn.metrics import roc_auc_score
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.resampling import (  # noqa: E402
+    bootstrap,
+    permutation_test,
+    resample_weights,
+    weighted_auc,
+    weighted_correlation,
+    weighted_quantile,
+)
+
+
+def _sample(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.exponential(2.0, n)
+    y = 0.5 * x + rng.normal(size=n)
+    labels = (y + rng.normal(size=n) > 1).astype(float)
+    return rng, x, y, labels
+
+
+def test_weighted_statistics_match_resampled_rows():
+    """Multinomial weights reproduce the statistic on explicitly resampled rows."""
+    rng, x, y, labels = _sample()
+    indices = rng.integers(0, len(x), len(x))
+    weights = np.bincount(indices, minlength=len(x))[None, :].astype(float)
+
+    assert np.isclose(weighted_quantile((x,), weights, 0.3)[0],
+                      np.quantile(x[indices], 0.3, method="inverted_cdf"))
+    assert np.isclose(weighted_correlation((x, y), weights)[0],
+                      np.corrcoef(x[indices], y[indices])[0, 1])
+    assert np.isclose(weighted_auc((y, labels), weights)[0],
+                      roc_auc_score(labels[indices], y[indices]))
+
+
+def test_resample_weights_sum_to_n():
+    """Every multinomial replicate draws exactly n observations."""
+    weights = resample_weights(50, 20, np.random.default_rng(1))
+    assert weights.shape == (20, 50)
+    assert (weights.sum(axis=1) == 50).all()
+
+
+def test_bca_interval_agrees_with_scipy():
+    """The BCa interval of the mean is close to scipy.stats.bootstrap."""
+    _, x, _, _ = _sample()
+    result = bootstrap(x, "mean", n_resamples=9999)
+    reference = stats.bootstrap((x,), np.mean, n_resamples=9999, method="BCa",
+                                random_state=0).confidence_interval
+    assert abs(result["ci_low"] - reference.low) < 0.05
+    assert abs(result["ci_high"] - reference.high) < 0.05
+    assert result["ci_low"] < result["statistic"] < result["ci_high"]
+
+
+def test_results_do_not_depend_on_worker_count():
+    """Seeded block streams give identical replicates serially and in parallel."""
+    _, x, _, _ = _sample()
+    serial = bootstrap(x, "quantile", quantile=0.9, n_resamples=3000, block_size=500,
+                       method="percentile", n_jobs=1)
+    parallel = bootstrap(x, "quantile", quantile=0.9, n_resamples=3000, block_size=500,
+                         method="percentile", n_jobs=4)
+    np.testing.assert_array_equal(serial["replicates"], parallel["replicates"])
+    budget = 20 * 32 * len(x)
+    bounded = bootstrap(x, "mean", n_resamples=500, max_bytes=budget, method="percentile")
+    assert np.array_equal(bounded["replicates"], bootstrap(
+        x, "mean", n_resamples=500, max_bytes=budget, method="percentile",
+        n_jobs=1)["replicates"])
+
+
+def test_bca_stays_finite_when_replicates_sit_on_one_side():
+    """The sample minimum is never above its bootstrap replicates; BCa still returns bounds."""
+    _, x, _, _ = _sample()
+    result = bootstrap(x, "quantile", quantile=0.0, n_resamples=999)
+    assert np.isfinite(result["ci_low"]) and np.isfinite(result["ci_high"])
+
+
+def test_permutation_tests():
+    """Permutation p-values detect real effects and agree with scipy."""
+    rng, x, y, labels = _sample()
+    assert permutation_test((x, y), "correlation")["p_value"] < 0.001
+    assert permutation_test((x, rng.normal(size=len(x))), "correlation")["p_value"] > 0.01
+
+    auc = permutation_test((y, labels), "auc", alternative="greater")
+    assert np.isclose(auc["statistic"], roc_auc_score(labels, y))
+    assert auc["p_value"] < 0.001
+
+    groups = rng.random(len(x)) < 0.4
+    ours = permutation_test((x, groups), "mean_difference")["p_value"]
+    reference = stats.permutation_test(
+        (x[groups], x[~groups]), lambda a, b, axis: a.mean(axis) - b.mean(axis),
+        vectorized=True, random_state=0).pvalue
+    assert abs(ours - reference) < 0.03
@@ -0,0 +1,85 @@
+"""Tests for sparse categorical encoding."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import OneHotEncoder
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.sparse_encoding import SparseFeatureEncoder  # noqa: E402
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _churn():
+    return pd.read_csv(DATA_DIR / "Spotify_churn_dataset.csv", sep="\t")
+
+
+def test_csr_matches_dense_one_hot_and_ignores_unknowns():
+    """The CSR output equals numeric columns stacked with OneHotEncoder's blocks."""
+    frame = _churn()
+    encoder = SparseFeatureEncoder().fit(frame)
+    matrix = encoder.transform(frame)
+    one_hot = OneHotEncoder(sparse_output=False).fit(frame[encoder.categorical_columns])
+    expected = np.hstack([frame[encoder.numeric_columns].to_numpy(dtype=np.float64),
+                          one_hot.transform(frame[encoder.categorical_columns])])
+    np.testing.assert_array_equal(matrix.toarray(), expected)
+    assert matrix.has_canonical_format
+    assert matrix.nnz < expected.size / 2
+    assert len(encoder.get_feature_names_out()) == matrix.shape[1]
+
+    records = frame.head(2).copy()
+    records["country"] = ["ZZ", "CA"]
+    records["gender"] = records["gender"].astype(
+        pd.CategoricalDtype(encoder.vocabulary_["gender"]))
+    scored = encoder.transform(records).toarray()
+    country = slice(encoder.offsets_["country"],
+                    encoder.offsets_["country"] + len(encoder.vocabulary_["country"]))
+    assert scored[0, country].sum() == 0 and scored[1, country].sum() == 1
+    np.testing.assert_array_equal(scored[:, :encoder.offsets_["country"]],
+                                  expected[:2, :encoder.offsets_["country"]])
+
+    # Category codes are int8 for few levels; offsets past 127 must not wrap
+    rng = np.random.default_rng(0)
+    wide = pd.DataFrame({"minutes": rng.integers(1, 5, 1000),
+                         "city": rng.choice([f"c{i:03d}" for i in range(120)], 1000),
+                         "plan": rng.choice([f"p{i}" for i in range(10)], 1000)})
+    wide_encoder = SparseFeatureEncoder(["city", "plan"], ["minutes"]).fit(wide)
+    categorical = wide.astype({"city": "category", "plan": "category"})
+    assert categorical["plan"].cat.codes.dtype == np.int8
+    matrix = wide_encoder.transform(categorical)
+    assert matrix.nnz == 3 * len(wide)
+    np.testing.assert_array_equal(matrix.toarray(), wide_encoder.transform(wide).toarray())
+
+
+def test_high_cardinality_columns_are_hashed_stably():
+    """Columns above the threshold hash into their own bucket block."""
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"user": [f"user{i}" for i in rng.integers(0, 50_000, 5_000)],
+                          "plan": rng.choice(["Free", "Premium"], 5_000),
+                          "minutes": rng.integers(0, 3, 5_000)})
+    encoder = SparseFeatureEncoder(["plan", "user"], ["minutes"], hash_threshold=100,
+                                   n_hash_buckets=64).fit(frame)
+    assert encoder.hashed_ == ["user"] and encoder.n_features_ == 1 + 2 + 64
+    matrix = encoder.transform(frame)
+    hashed = matrix[:, encoder.offsets_["user"]:].toarray()
+    assert (hashed.sum(axis=1) == 1).all()
+    repeat = encoder.transform(frame.iloc[::-1]).toarray()[::-1]
+    np.testing.assert_array_equal(repeat, matrix.toarray())
+    assert matrix.nnz == 2 * len(frame) + int((frame["minutes"] != 0).sum())
+
+
+def test_vocabulary_cache_and_round_trip(tmp_path):
+    """A cached vocabulary is reused for identical data and survives save/load."""
+    frame = _churn()
+    first = SparseFeatureEncoder().fit(frame, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("vocabulary_*.json"))) == 1
+    cached = SparseFeatureEncoder().fit(frame, cache_dir=tmp_path)
+    assert all(cached.vocabulary_[c].equals(first.vocabulary_[c]) for c in first.vocabulary_)
+
+    first.save(tmp_path / "encoder.json")
+    restored = SparseFeatureEncoder.load(tmp_path / "encoder.json")
+    assert (restored.transform(frame) != first.transform(frame)).nnz == 0
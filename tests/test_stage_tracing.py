@@ -0,0 +1,87 @@
+"""Tests for track_stage spans and Chrome trace export."""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.execution_tracking import (  # noqa: E402
+    TracedProcessPoolExecutor,
+    collect_spans,
+    export_chrome_trace,
+    generate_execution_summary,
+    get_execution_metadata,
+    stage_timings,
+    track_stage,
+)
+
+
+@track_stage("fit", model="ridge")
+def _fit(values):
+    with track_stage("solve"):
+        return sum(values)
+
+
+def _square(value):
+    with track_stage("square", value=value):
+        return value * value
+
+
+def test_nested_spans_decorator_and_errors():
+    """Spans record nesting, attributes and failures from every thread."""
+    collect_spans(clear=True)
+    with track_stage("pipeline", rows=3):
+        with track_stage("load"):
+            pass
+        assert _fit([1, 2, 3]) == 6 and _fit([4]) == 4
+        try:
+            with track_stage("score"):
+                raise ValueError("bad input")
+        except ValueError:
+            pass
+    thread = threading.Thread(target=_fit, args=([1],))
+    thread.start()
+    thread.join()
+
+    spans = collect_spans(clear=True)
+    by_name = {}
+    for span in spans:
+        by_name.setdefault(span["name"], []).append(span)
+    assert [span["start_ns"] for span in spans] == sorted(span["start_ns"] for span in spans)
+    assert by_name["pipeline"][0]["depth"] == 0 and by_name["pipeline"][0]["attrs"] == {"rows": 3}
+    assert by_name["load"][0]["parent"] == "pipeline"
+    assert [span["parent"] for span in by_name["solve"]] == ["fit"] * 3
+    assert {span["tid"] for span in by_name["fit"]} == {threading.get_ident(), thread.ident}
+    assert by_name["score"][0]["attrs"] == {"error": "ValueError"}
+    assert by_name["fit"][0]["attrs"] == {"model": "ridge"}
+    assert stage_timings(spans)["fit"]["count"] == 3
+    assert collect_spans() == []
+
+
+def test_process_pool_spans_and_chrome_trace(tmp_path):
+    """Worker spans come back to the parent and export as trace events."""
+    collect_spans(clear=True)
+    with track_stage("parallel"):
+        with TracedProcessPoolExecutor(max_workers=2) as executor:
+            assert list(executor.map(_square, range(4))) == [0, 1, 4, 9]
+            assert executor.submit(_square, 5).result() == 25
+
+    spans = collect_spans()
+    squares = [span for span in spans if span["name"] == "square"]
+    assert sorted(span["attrs"]["value"] for span in squares) == [0, 1, 2, 3, 5]
+    assert all(span["pid"] != os.getpid() for span in squares)
+    assert any(span["attrs"].get("parent_stage") == "parallel" for span in spans)
+
+    trace = export_chrome_trace(str(tmp_path / "trace.json"))
+    assert json.loads((tmp_path / "trace.json").read_text()) == trace
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert len(complete) == len(spans)
+    assert all(event["dur"] >= 0 for event in complete)
+
+    summary = generate_execution_summary(get_execution_metadata())["execution_summary"]
+    assert summary["stage_timings"]["square"]["count"] == 5
+    assert "spans" not in json.dumps(summary)
+    collect_spans(clear=True)
@@ -0,0 +1,70 @@
+"""Tests for SVM grid search with Gram-matrix reuse."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quipu_analytics.svm_search import GramStore, SVMGridSearch, linear_gram  # noqa: E402
+
+
+def test_scores_match_grid_search_cv():
+    """Precomputed fold kernels reproduce GridSearchCV, including gamma='scale'."""
+    # pylint: disable=import-outside-toplevel
+    from sklearn.datasets import make_classification, make_regression
+    from sklearn.model_selection import GridSearchCV
+    from sklearn.svm import SVC, SVR
+
+    X, y = make_classification(n_samples=300, n_features=6, random_state=0)
+    grid = [{"C": [0.1, 1, 10], "gamma": ["scale", "auto", 0.05]},
+            {"kernel": ["poly"], "C": [1], "degree": [2, 3], "coef0": [0.0, 1.0]},
+            {"kernel": ["linear", "sigmoid"], "C": [0.5]}]
+    expected = GridSearchCV(SVC(), grid, cv=4, scoring="accuracy").fit(X, y)
+    search = SVMGridSearch(SVC(), grid, cv=4, scoring="accuracy").fit(X, y)
+    np.testing.assert_allclose(search.cv_results_["mean_test_score"],
+                               expected.cv_results_["mean_test_score"])
+    assert search.best_params_ == expected.best_params_
+    assert search.score(X, y) == expected.score(X, y)
+
+    X, y = make_regression(n_samples=200, n_features=5, noise=5.0, random_state=0)
+    grid = {"C": [1, 100], "epsilon": [0.1, 1.0]}
+    expected = GridSearchCV(SVR(), grid, cv=3, scoring="r2").fit(X, y)
+    search = SVMGridSearch(SVR(), grid, cv=3, scoring="r2").fit(X, y)
+    np.testing.assert_allclose(search.cv_results_["mean_test_score"],
+                               expected.cv_results_["mean_test_score"])
+
+
+def test_kernels_are_computed_once_and_store_is_bounded():
+    """C values share a fold kernel, later searches hit the store, and size is capped."""
+    from sklearn.datasets import make_classification  # pylint: disable=import-outside-toplevel
+
+    X, y = make_classification(n_samples=200, n_features=5, random_state=1)
+    np.testing.assert_allclose(linear_gram(X, block_size=7), X @ X.T)
+    store = GramStore()
+    SVMGridSearch(param_grid={"C": [0.1, 1, 10, 100], "gamma": [0.1]}, cv=3,
+                  store=store).fit(X, y)
+    assert store.stats()["misses"] == 1 + 3
+    SVMGridSearch(param_grid={"C": [1000], "gamma": [0.1]}, cv=3, store=store).fit(X, y)
+    assert store.stats()["hits"] == 1 + 3
+
+    small = GramStore(max_bytes=int(X.shape[0] ** 2 * 8 * 1.5))
+    SVMGridSearch(param_grid={"C": [1], "gamma": [0.1, 1.0]}, cv=3, store=small,
+                  max_exact_samples=1000).fit(X, y)
+    assert small.nbytes <= small.max_bytes and small.stats()["evictions"] > 0
+
+
+@pytest.mark.parametrize("approximation", ["nystroem", "rff"])
+def test_large_inputs_fall_back_to_approximation(approximation):
+    """Above the exact-size limit, a feature map with a linear solver is searched."""
+    from sklearn.datasets import make_circles  # pylint: disable=import-outside-toplevel
+
+    X, y = make_circles(n_samples=600, noise=0.05, factor=0.5, random_state=0)
+    search = SVMGridSearch(param_grid={"C": [1, 10], "gamma": [1.0, "scale"]}, cv=3,
+                           max_exact_samples=100, approximation=approximation,
+                           n_components=200).fit(X, y)
+    assert search.method_ == approximation
+    assert search.best_score_ > 0.9
+    assert search.predict(X).shape == (600,)